@@ -0,0 +1,7 @@
+# coding=utf-8
+"""
+Benchmarks for nlpir-python, each module can be run as a script::
+
+    python -m benchmarks.native_call
+    python -m benchmarks.throughput -o result.json
+"""
@@ -0,0 +1,250 @@
+# coding=utf-8
+"""
+Save the JSON results of :mod:`benchmarks.throughput` as a named baseline, and compare new results with it,
+used to catch regressions after upgrading the bundled libraries in ``nlpir/lib`` or changing the wrapper::
+
+    python -m benchmarks.throughput -o run1.json
+    python -m benchmarks.throughput -o run2.json
+    python -m benchmarks.baseline save v0.9.15 run1.json run2.json
+    ...
+    python -m benchmarks.throughput -o new.json
+    python -m benchmarks.baseline compare v0.9.15 new.json --threshold 5
+    python -m benchmarks.baseline list
+
+Several result files of the same configuration are treated as samples of a measurement. A change is a
+regression only if it is worse than ``--threshold`` percent and also larger than the noise, which is
+``--z`` times the standard error of the difference of the means (zero if there is only one sample on
+both sides). ``compare`` prints a table per component and exits with 1 if there is any regression.
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import typing
+
+#: Default directory of the baselines
+DEFAULT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+#: Default threshold of a regression in percent
+DEFAULT_THRESHOLD = 5.0
+#: Default number of standard errors as noise
+DEFAULT_Z = 2.0
+
+#: metric: True if larger is better
+METRICS = {
+    "chars_per_sec": True,
+    "p50_ms": False,
+    "p99_ms": False,
+}
+
+# (case, mode, workers, doc_chars)
+__Key__ = typing.Tuple[str, str, int, int]
+
+
+def get_key(result: dict) -> __Key__:
+    """
+    :param result: a result record of :mod:`benchmarks.throughput`
+    :return: the configuration of the result
+    """
+    return result["case"], result["mode"], result["workers"], result["doc_chars"]
+
+
+def load_samples(paths: typing.Iterable[str], metric: str) -> typing.Dict[__Key__, typing.List[float]]:
+    """
+    :param paths: result files of :mod:`benchmarks.throughput`
+    :param metric: name of the metric, see :data:`METRICS`
+    :return: ``{configuration: [value in every file]}``
+    """
+    samples = dict()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for result in json.load(f)["results"]:
+                samples.setdefault(get_key(result), []).append(result[metric])
+    return samples
+
+
+def get_baseline_path(name: str, store: str = DEFAULT_STORE) -> str:
+    """
+    :param name: name of the baseline
+    :param store: directory of the baselines
+    :return: path of the baseline file
+    """
+    return os.path.join(store, name + ".json")
+
+
+def save(name: str, paths: typing.List[str], store: str = DEFAULT_STORE) -> str:
+    """
+    Save result files as a baseline, overwrite the baseline with the same name
+
+    :param name: name of the baseline
+    :param paths: result files of :mod:`benchmarks.throughput`
+    :param store: directory of the baselines
+    :return: path of the baseline file
+    """
+    metas = []
+    results = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            output = json.load(f)
+        metas.append(output.get("meta", dict()))
+        results.extend(output["results"])
+    os.makedirs(store, exist_ok=True)
+    baseline_path = get_baseline_path(name, store)
+    with open(baseline_path, "w", encoding="utf-8") as f:
+        json.dump({"name": name, "time": time.time(), "metas": metas, "results": results}, f, ensure_ascii=False)
+    return baseline_path
+
+
+def load(name: str, store: str = DEFAULT_STORE) -> dict:
+    """
+    :param name: name of the baseline
+    :param store: directory of the baselines
+    :return: the baseline saved by :func:`save`
+    :raises FileNotFoundError: no such baseline
+    """
+    with open(get_baseline_path(name, store), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_samples(
+        baseline: typing.List[float],
+        current: typing.List[float],
+        higher_is_better: bool,
+        threshold: float = DEFAULT_THRESHOLD,
+        z: float = DEFAULT_Z
+) -> typing.Tuple[float, float, str]:
+    """
+    :param baseline: samples of the baseline
+    :param current: samples of the new run
+    :param higher_is_better: direction of the metric
+    :param threshold: threshold of a regression in percent
+    :param z: number of standard errors as noise
+    :return: ``(change in percent, noise in percent, status)`` , a positive change is an improvement,
+        status is one of ``regression``, ``slower``, ``faster``, ``same``
+    """
+    base_mean, current_mean = statistics.mean(baseline), statistics.mean(current)
+    if base_mean == 0:
+        return 0.0, 0.0, "same"
+    change = (current_mean - base_mean) / base_mean * 100
+    if not higher_is_better:
+        change = -change
+    variance = 0.0
+    for samples in (baseline, current):
+        if len(samples) > 1:
+            variance += statistics.variance(samples) / len(samples)
+    noise = z * math.sqrt(variance) / base_mean * 100
+    if abs(change) <= noise:
+        status = "same"
+    elif change < -threshold:
+        status = "regression"
+    elif change < 0:
+        status = "slower"
+    elif change > 0:
+        status = "faster"
+    else:
+        status = "same"
+    return change, noise, status
+
+
+def compare(
+        baseline: dict,
+        paths: typing.List[str],
+        metric: str = "chars_per_sec",
+        threshold: float = DEFAULT_THRESHOLD,
+        z: float = DEFAULT_Z
+) -> typing.List[dict]:
+    """
+    Compare result files with a baseline, configurations not in both sides are ignored
+
+    :param baseline: baseline loaded by :func:`load`
+    :param paths: result files of :mod:`benchmarks.throughput`
+    :param metric: name of the metric, see :data:`METRICS`
+    :param threshold: threshold of a regression in percent
+    :param z: number of standard errors as noise
+    :return: rows of ``{"case", "mode", "workers", "doc_chars", "baseline", "current", "change", "noise", "status"}``
+    """
+    base_samples = dict()
+    for result in baseline["results"]:
+        base_samples.setdefault(get_key(result), []).append(result[metric])
+    current_samples = load_samples(paths, metric)
+    rows = []
+    for key in sorted(set(base_samples) & set(current_samples)):
+        change, noise, status = compare_samples(
+            base_samples[key], current_samples[key], METRICS[metric], threshold, z
+        )
+        case, mode, workers, doc_chars = key
+        rows.append({
+            "case": case,
+            "mode": mode,
+            "workers": workers,
+            "doc_chars": doc_chars,
+            "baseline": statistics.mean(base_samples[key]),
+            "current": statistics.mean(current_samples[key]),
+            "change": change,
+            "noise": noise,
+            "status": status,
+        })
+    return rows
+
+
+def print_tables(rows: typing.List[dict], file: typing.TextIO = sys.stdout):
+    """
+    Print a table for every component, the component is the first part of the case name
+    """
+    components = dict()
+    for row in rows:
+        components.setdefault(row["case"].split(".")[0], []).append(row)
+    for component, component_rows in components.items():
+        print(f"\n== {component} ==", file=file)
+        print(
+            f"{'case':<34}{'mode':>8}{'n':>4}{'chars':>8}{'baseline':>14}{'current':>14}"
+            f"{'change':>10}{'noise':>8}  status",
+            file=file
+        )
+        for row in component_rows:
+            print(
+                f"{row['case']:<34}{row['mode']:>8}{row['workers']:>4}{row['doc_chars']:>8}"
+                f"{row['baseline']:>14.2f}{row['current']:>14.2f}"
+                f"{row['change']:>+9.1f}%{row['noise']:>7.1f}%  {row['status']}",
+                file=file
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--store", default=DEFAULT_STORE, help="directory of the baselines")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+    save_parser = commands.add_parser("save", help="save result files as a baseline")
+    save_parser.add_argument("name")
+    save_parser.add_argument("results", nargs="+")
+    compare_parser = commands.add_parser("compare", help="compare result files with a baseline")
+    compare_parser.add_argument("name")
+    compare_parser.add_argument("results", nargs="+")
+    compare_parser.add_argument("--metric", choices=list(METRICS), default="chars_per_sec")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="regression threshold in percent")
+    compare_parser.add_argument("--z", type=float, default=DEFAULT_Z, help="number of standard errors as noise")
+    commands.add_parser("list", help="list the saved baselines")
+    args = parser.parse_args()
+
+    if args.command == "save":
+        print(save(args.name, args.results, args.store))
+    elif args.command == "list":
+        if os.path.isdir(args.store):
+            for filename in sorted(os.listdir(args.store)):
+                if filename.endswith(".json"):
+                    print(filename[:-len(".json")])
+    else:
+        rows = compare(load(args.name, args.store), args.results, args.metric, args.threshold, args.z)
+        print_tables(rows)
+        regressions = [row for row in rows if row["status"] == "regression"]
+        print(f"\n{len(rows)} compared, {len(regressions)} regression(s) beyond {args.threshold}%")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
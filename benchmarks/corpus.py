@@ -0,0 +1,88 @@
+# coding=utf-8
+"""
+Synthetic corpora for the benchmarks, generated from the bundled word list ``Data/ChnSenti-76005.txt``
+(GBK encoded, a line of word count and then ``word<TAB>label`` lines), or cut from any UTF-8 text file.
+The same seed always gives the same documents, so results of different runs are comparable.
+"""
+import os
+import random
+import typing
+
+from nlpir import PACKAGE_DIR
+
+#: The bundled word list used to generate documents
+DEFAULT_WORD_LIST = os.path.join(PACKAGE_DIR, "Data", "ChnSenti-76005.txt")
+#: Default seed of the generator
+DEFAULT_SEED = 76005
+
+
+def load_words(path: str = DEFAULT_WORD_LIST, encoding: str = "gbk") -> typing.List[str]:
+    """
+    :param path: a word list like ``ChnSenti-76005.txt``
+    :param encoding: encoding of the word list
+    :return: words in the list
+    """
+    words = []
+    with open(path, encoding=encoding, errors="ignore") as f:
+        next(f)
+        for line in f:
+            word = line.split("\t", 1)[0].strip()
+            if word:
+                words.append(word)
+    return words
+
+
+def generate_documents(
+        doc_chars: int,
+        count: int,
+        seed: int = DEFAULT_SEED,
+        words: typing.Optional[typing.List[str]] = None
+) -> typing.List[str]:
+    """
+    Generate documents of random words, clauses are split by ``，`` and sentences end with ``。`` ,
+    every 10 sentences make a paragraph.
+
+    :param doc_chars: length of every document in characters
+    :param count: number of documents
+    :param seed: seed of the random generator
+    :param words: words to use, default is :func:`load_words`
+    :return: documents
+    """
+    if words is None:
+        words = load_words()
+    rand = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        parts, length, sentences = [], 0, 0
+        while length < doc_chars:
+            clause = "".join(rand.choice(words) for _ in range(rand.randint(3, 8)))
+            if rand.random() < 0.3:
+                clause += "。"
+                sentences += 1
+                if sentences % 10 == 0:
+                    clause += "\n"
+            else:
+                clause += "，"
+            parts.append(clause)
+            length += len(clause)
+        documents.append("".join(parts)[:doc_chars - 1] + "。")
+    return documents
+
+
+def cut_documents(path: str, doc_chars: int, count: int, encoding: str = "utf-8") -> typing.List[str]:
+    """
+    Cut documents from a text file, reuse the text from the beginning if it is not long enough
+
+    :param path: a text file
+    :param doc_chars: length of every document in characters
+    :param count: number of documents
+    :param encoding: encoding of the file
+    :return: documents
+    """
+    with open(path, encoding=encoding, errors="ignore") as f:
+        text = f.read()
+    if not text:
+        raise ValueError(f"{path} is empty")
+    while len(text) < doc_chars * count:
+        text += text
+    return [text[i * doc_chars:(i + 1) * doc_chars] for i in range(count)]
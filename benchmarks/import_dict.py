@@ -0,0 +1,56 @@
+# coding=utf-8
+"""
+Time to load a user dictionary, compare :func:`nlpir.import_dict` which calls ``add_user_word`` for every word
+with :func:`nlpir.import_dict_bulk` which imports all words with one native call::
+
+    python -m benchmarks.import_dict --words 100000 --component ictclas
+
+The words are taken from the bundled word list, the user dictionaries are cleaned after every round,
+which also deletes the saved user dictionaries in ``Data``.
+"""
+import argparse
+import importlib
+import time
+import typing
+
+from benchmarks.corpus import load_words
+
+
+def run(words: int = 100000, component: str = "ictclas", repeat: int = 3) -> typing.Dict[str, float]:
+    """
+    :param words: number of words to import
+    :param component: ``ictclas`` , ``key_extract`` or ``doc_extractor``
+    :param repeat: rounds for each way, the best one is reported
+    :return: ``{way: seconds}``
+    """
+    module = importlib.import_module(f"nlpir.{component}")
+    word_list = [f"{word} user" for word in load_words()[:words]]
+    result = dict()
+    for name, func in (("import_dict", module.import_dict), ("import_dict_bulk", module.import_dict_bulk)):
+        best = float("inf")
+        for _ in range(repeat):
+            module.clean_user_dict()
+            module.clean_saved_user_dict()
+            start = time.perf_counter()
+            fail_list = func(word_list)
+            best = min(best, time.perf_counter() - start)
+        result[name] = best
+        print(f"{name}: {len(fail_list)} words failed")
+    module.clean_user_dict()
+    module.clean_saved_user_dict()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=100000)
+    parser.add_argument("--component", default="ictclas", choices=["ictclas", "key_extract", "doc_extractor"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    result = run(args.words, args.component, args.repeat)
+    for name, seconds in result.items():
+        print(f"{name:<20}{seconds:>10.3f} s{args.words / seconds:>14.0f} words/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# coding=utf-8
+"""
+Import time of a high-level module in a fresh interpreter, compare the lazy import of :mod:`nlpir.native`
+with importing all native components like before::
+
+    python -m benchmarks.import_time --module nlpir.ictclas --repeat 20
+"""
+import argparse
+import subprocess
+import sys
+import typing
+
+# print the time of the import and the number of native modules loaded
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(seconds, len([m for m in sys.modules if m.startswith("nlpir.native.")]))
+"""
+
+
+def measure(statement: str, repeat: int) -> typing.Tuple[float, int]:
+    """
+    :param statement: import statement to run in a new interpreter
+    :param repeat: number of interpreters, the best one is reported
+    :return: best seconds and number of native modules loaded
+    """
+    best, modules = float("inf"), 0
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", SCRIPT.format(statement=statement)])
+        seconds, modules = output.split()
+        best = min(best, float(seconds))
+    return best, int(modules)
+
+
+def run(module: str = "nlpir.ictclas", repeat: int = 20) -> typing.Dict[str, typing.Tuple[float, int]]:
+    """
+    :param module: high-level module to import
+    :param repeat: number of interpreters for each way, the best one is reported
+    :return: ``{way: (seconds, native modules loaded)}``
+    """
+    return {
+        "lazy": measure(f"import {module}", repeat),
+        "all components": measure(
+            f"import {module}\nimport nlpir.native\nfor name in nlpir.native.__all__: getattr(nlpir.native, name)",
+            repeat
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="nlpir.ictclas")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    for name, (seconds, modules) in run(args.module, args.repeat).items():
+        print(f"{name:<16}{seconds * 1000:>10.2f} ms{modules:>4} native modules")
+
+
+if __name__ == "__main__":
+    main()
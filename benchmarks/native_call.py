@@ -0,0 +1,57 @@
+# coding=utf-8
+"""
+Per-call overhead of calling native functions through the wrapper,
+compare the old per-call :func:`nlpir.native.nlpir_base.NLPIRBase.get_func` lookup with the
+function table bound at init (:attr:`nlpir.native.nlpir_base.NLPIRBase.funcs`)::
+
+    python -m benchmarks.native_call --number 100000
+"""
+import argparse
+import timeit
+from ctypes import c_char_p, c_int
+
+from nlpir.native import ICTCLAS
+
+
+def run(text: str = "法国", number: int = 100000, repeat: int = 5) -> dict:
+    """
+    Measure the overhead of :func:`nlpir.native.ictclas.ICTCLAS.paragraph_process` for a short text
+
+    :param text: text to segment, a short text makes the overhead visible
+    :param number: calls in one round
+    :param repeat: rounds, the best one is reported
+    :return: nanoseconds per call for each way to call the native function
+    """
+    ictclas = ICTCLAS()
+    paragraph = text.encode(ictclas.encode)
+
+    def get_func_per_call():
+        return ictclas.get_func('NLPIR_ParagraphProcess', [c_char_p, c_int], c_char_p)(paragraph, 1)
+
+    def bound_table():
+        return ictclas.funcs["NLPIR_ParagraphProcess"](paragraph, 1)
+
+    def wrapper():
+        return ictclas.paragraph_process(text, 1)
+
+    result = dict()
+    for name, func in (("get_func per call", get_func_per_call), ("bound table", bound_table), ("wrapper", wrapper)):
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        result[name] = best / number * 1e9
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--text", default="法国")
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    result = run(args.text, args.number, args.repeat)
+    for name, ns in result.items():
+        print(f"{name:<20}{ns:>12.1f} ns/call")
+    print(f"{'saved per call':<20}{result['get_func per call'] - result['bound table']:>12.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# coding=utf-8
+"""
+Speed of parsing the output of segmentation on outputs of about 1 MB, compare the post processors of
+:mod:`nlpir.ictclas` with the way :func:`nlpir.ictclas.process_to_generator` parsed before (``finditer``
+on the whole string, and compiling ``[^ ]+`` on every call)::
+
+    python -m benchmarks.parser --output-bytes 1000000
+    python -m benchmarks.parser --synthetic
+
+The outputs are segmented from generated documents, or generated directly from the word list with
+random POS tags if ``--synthetic`` is given, which does not need the native library.
+"""
+import argparse
+import random
+import re
+import timeit
+import typing
+
+from nlpir import ictclas
+from benchmarks.corpus import DEFAULT_SEED, generate_documents, load_words
+
+#: POS tags used by the synthetic outputs
+SYNTHETIC_POS = ["n", "v", "nsf", "vn", "ude1", "vshi", "wj", "wd", "m", "q", "d", "rz", "nr1", "uguo"]
+
+
+def finditer_generator(text: str, pos_tag: bool) -> typing.Generator:
+    """
+    The old :func:`nlpir.ictclas.process_to_generator`
+    """
+    if pos_tag:
+        for i in ictclas.match_tag.finditer(text):
+            yield i.groups()
+    else:
+        re_split = re.compile(r"[^ ]+")
+        for i in re_split.finditer(text):
+            yield i.group()
+
+
+def segmented_output(output_bytes: int, pos_tagged: bool) -> str:
+    """
+    :param output_bytes: approximate size of the output in bytes
+    :param pos_tagged: POS tagging or not
+    :return: output of :func:`nlpir.ictclas.segment`
+    """
+    # a word is about 3 times of the characters in UTF-8 plus the tag
+    document = generate_documents(output_bytes // (5 if pos_tagged else 4), 1)[0]
+    return ictclas.segment(document, pos_tagged=pos_tagged, post_process=lambda t, _: t)
+
+
+def synthetic_output(output_bytes: int, pos_tagged: bool, seed: int = DEFAULT_SEED) -> str:
+    """
+    :param output_bytes: approximate size of the output in bytes
+    :param pos_tagged: POS tagging or not
+    :param seed: seed of the random generator
+    :return: an output like the output of :func:`nlpir.ictclas.segment`
+    """
+    words = load_words()
+    rand = random.Random(seed)
+    parts, size = [], 0
+    while size < output_bytes:
+        part = f"{rand.choice(words)}/{rand.choice(SYNTHETIC_POS)} " if pos_tagged else f"{rand.choice(words)} "
+        parts.append(part)
+        size += len(part.encode("utf-8"))
+    return "".join(parts)
+
+
+def run(output_bytes: int = 1000000, synthetic: bool = False, repeat: int = 5) -> typing.Dict[str, float]:
+    """
+    :param output_bytes: approximate size of the output in bytes
+    :param synthetic: use synthetic outputs instead of segmenting
+    :param repeat: rounds for each parser, the best one is reported
+    :return: ``{parser: milliseconds}``
+    """
+    result = dict()
+    for pos_tagged in (True, False):
+        text = synthetic_output(output_bytes, pos_tagged) if synthetic else segmented_output(output_bytes, pos_tagged)
+        expected = list(finditer_generator(text, pos_tagged))
+        parsers = {
+            "process_to_list": ictclas.process_to_list,
+            "finditer generator": lambda t, p: list(finditer_generator(t, p)),
+            "process_to_generator": lambda t, p: list(ictclas.process_to_generator(t, p)),
+        }
+        for name, parser in parsers.items():
+            if name != "process_to_list" or pos_tagged:
+                assert parser(text, pos_tagged) == expected, f"{name} gives a different result"
+            seconds = min(timeit.repeat(lambda: parser(text, pos_tagged), number=1, repeat=repeat))
+            result[f"{name}{', pos' if pos_tagged else ''}"] = seconds * 1000
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output-bytes", type=int, default=1000000)
+    parser.add_argument("--synthetic", action="store_true", help="generate the outputs without segmenting")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for name, milliseconds in run(args.output_bytes, args.synthetic, args.repeat).items():
+        print(f"{name:<28}{milliseconds:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
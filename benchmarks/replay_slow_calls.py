@@ -0,0 +1,79 @@
+# coding=utf-8
+"""
+Replay the slowest native calls recorded by :mod:`nlpir.native.slow_call` (with ``capture_input=True``)
+and compare the recorded time with the time now::
+
+    python -m benchmarks.replay_slow_calls slow_calls.jsonl --top 10 --repeat 3
+"""
+import argparse
+import time
+import typing
+
+from nlpir import native
+from nlpir.native.nlpir_base import NLPIRBase
+from nlpir.native.slow_call import load_records, decode_args
+
+
+def get_component(dll_name: str) -> NLPIRBase:
+    """
+    :param dll_name: ``component`` of a record, the :attr:`dll_name` of a native class
+    :return: the instance of the native class, created with default settings
+    :raises ValueError: no native class uses this dll
+    """
+    for name in native.__all__:
+        cls = getattr(native, name)
+        if isinstance(cls, type) and issubclass(cls, NLPIRBase) and cls.dll_name.fget(cls) == dll_name:
+            return cls()
+    raise ValueError(f"Unknown component {dll_name}")
+
+
+def run(path: str, top: int = 10, repeat: int = 3) -> typing.List[dict]:
+    """
+    :param path: the record file
+    :param top: replay the slowest ``top`` records, records with same input are replayed once
+    :param repeat: calls for every record, the best one is reported
+    :return: ``[{"function", "sha1", "input_bytes", "recorded", "replayed"}]`` , times in seconds
+    """
+    records = [record for record in load_records(path) if "args" in record]
+    records.sort(key=lambda record: record["seconds"], reverse=True)
+    result, seen = [], set()
+    for record in records:
+        key = (record["function"], record["sha1"])
+        if key in seen:
+            continue
+        seen.add(key)
+        func = get_component(record["component"]).funcs[record["function"]]
+        args = decode_args(record["args"])
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*args)
+            best = min(best, time.perf_counter() - start)
+        result.append({
+            "function": record["function"],
+            "sha1": record["sha1"],
+            "input_bytes": record["input_bytes"],
+            "recorded": record["seconds"],
+            "replayed": best,
+        })
+        if len(result) >= top:
+            break
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(f"{'function':<32}{'sha1':<14}{'bytes':>10}{'recorded s':>12}{'replayed s':>12}")
+    for row in run(args.path, args.top, args.repeat):
+        print(
+            f"{row['function']:<32}{row['sha1'][:12]:<14}{row['input_bytes']:>10}"
+            f"{row['recorded']:>12.4f}{row['replayed']:>12.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
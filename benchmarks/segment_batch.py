@@ -0,0 +1,83 @@
+# coding=utf-8
+"""
+Documents per second of :func:`nlpir.ictclas.segment_batch` , compare with a Python loop over
+:func:`nlpir.ictclas.segment` , and the batch spread over a :class:`nlpir.pool.Pool`::
+
+    python -m benchmarks.segment_batch --doc-chars 50 --docs 20000 --processes 4
+"""
+import argparse
+import time
+import typing
+
+from nlpir import ictclas
+from nlpir.pool import Pool
+from benchmarks.corpus import generate_documents
+
+
+def loop(documents: typing.List[str], pos_tagged: bool) -> list:
+    return [ictclas.segment(doc, pos_tagged=pos_tagged) for doc in documents]
+
+
+def batch(documents: typing.List[str], pos_tagged: bool) -> list:
+    return ictclas.segment_batch(documents, pos_tagged=pos_tagged)
+
+
+def best_seconds(func: typing.Callable[[], typing.Any], repeat: int) -> float:
+    """
+    :return: best seconds of ``repeat`` calls
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+        doc_chars: int = 50,
+        docs: int = 20000,
+        pos_tagged: bool = True,
+        processes: typing.Iterable[int] = (4,),
+        repeat: int = 3
+) -> typing.Dict[str, float]:
+    """
+    :param doc_chars: length of every document, short documents make the per-call overhead visible
+    :param docs: number of documents
+    :param pos_tagged: POS tagging or not
+    :param processes: process counts of the pool, use an empty list to skip the pool
+    :param repeat: rounds for each way, the best one is reported
+    :return: ``{way: documents per second}``
+    """
+    documents = generate_documents(doc_chars, docs)
+    assert loop(documents[:100], pos_tagged) == batch(documents[:100], pos_tagged)
+    result = {
+        "loop over segment": docs / best_seconds(lambda: loop(documents, pos_tagged), repeat),
+        "segment_batch": docs / best_seconds(lambda: batch(documents, pos_tagged), repeat),
+    }
+    for n in processes:
+        with Pool([ictclas], processes=n) as pool:
+            # wait for all workers to init the component
+            pool.map(ictclas.segment, documents[:n], chunksize=1)
+            seconds = best_seconds(
+                lambda: ictclas.segment_batch(documents, pos_tagged=pos_tagged, pool=pool), repeat
+            )
+        result[f"segment_batch, pool of {n}"] = docs / seconds
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--doc-chars", type=int, default=50)
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--no-pos", action="store_true", help="segment without POS tagging")
+    parser.add_argument("--processes", nargs="*", type=int, default=[4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    result = run(args.doc_chars, args.docs, not args.no_pos, args.processes, args.repeat)
+    for name, docs_per_sec in result.items():
+        print(f"{name:<28}{docs_per_sec:>14.0f} docs/s")
+
+
+if __name__ == "__main__":
+    main()
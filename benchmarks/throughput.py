@@ -0,0 +1,233 @@
+# coding=utf-8
+"""
+Throughput and latency of the high-level functions of every component, at several document sizes,
+thread counts and process counts (:class:`nlpir.pool.Pool`), results are written as JSON::
+
+    python -m benchmarks.throughput --sizes 100 1000 10000 --threads 1 4 --processes 4 -o result.json
+    python -m benchmarks.throughput --cases ictclas.segment key_extract.get_key_words
+
+Components need a trained model or user rules (deep classifier, classifier, cluster, key scanner,
+eye checker) are not included. The output looks like::
+
+    {
+        "meta": {"time": ..., "python": ..., "platform": ..., "nlpir": ..., "args": {...}},
+        "results": [
+            {"case": "ictclas.segment", "mode": "thread", "workers": 4, "doc_chars": 1000, "docs": 200,
+             "seconds": 0.5, "chars_per_sec": 400000.0, "mean_ms": 9.8, "p50_ms": 9.5, "p99_ms": 15.1},
+            ...
+        ]
+    }
+"""
+import argparse
+import concurrent.futures
+import json
+import math
+import platform
+import sys
+import time
+import typing
+
+import nlpir
+from nlpir import ictclas, key_extract, summary, text_similarity, sentiment_analysis, doc_extractor, new_word_finder
+from nlpir.pool import Pool
+from benchmarks.corpus import generate_documents, cut_documents
+
+
+def segment(text: str):
+    return ictclas.segment(text)
+
+
+def segment_pos_tagged(text: str):
+    return ictclas.segment(text, pos_tagged=True)
+
+
+def get_key_words(text: str):
+    return key_extract.get_key_words(text, max_key=50)
+
+
+def summarization(text: str):
+    return summary.summarization(text)
+
+
+def similarity(text: str):
+    # compare with the text which the two halves are swapped
+    half = len(text) // 2
+    return text_similarity.similarity(text, text[half:] + text[:half])
+
+
+def get_emotion(text: str):
+    return sentiment_analysis.get_emotion(text)
+
+
+def extract(text: str):
+    result = doc_extractor.extract(text, [])
+    return result.get_result()
+
+
+def find_new_words(text: str):
+    return new_word_finder.find_new_words(text, 50)
+
+
+#: name of case: (high-level module, function to call with a document)
+CASES: typing.Dict[str, typing.Tuple[str, typing.Callable[[str], typing.Any]]] = {
+    "ictclas.segment": ("nlpir.ictclas", segment),
+    "ictclas.segment_pos_tagged": ("nlpir.ictclas", segment_pos_tagged),
+    "key_extract.get_key_words": ("nlpir.key_extract", get_key_words),
+    "summary.summarization": ("nlpir.summary", summarization),
+    "text_similarity.similarity": ("nlpir.text_similarity", similarity),
+    "sentiment_analysis.get_emotion": ("nlpir.sentiment_analysis", get_emotion),
+    "doc_extractor.extract": ("nlpir.doc_extractor", extract),
+    "new_word_finder.find_new_words": ("nlpir.new_word_finder", find_new_words),
+}
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_THREADS = [1, 4]
+DEFAULT_PROCESSES = [4]
+#: characters processed in every configuration, decide the number of documents
+DEFAULT_CHARS = 500000
+#: minimum number of documents in every configuration
+MIN_DOCS = 20
+
+
+def timed_call(text: str, case: str) -> float:
+    """
+    :param text: document
+    :param case: name of the case in :data:`CASES`
+    :return: seconds cost by the call
+    """
+    func = CASES[case][1]
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def percentile(sorted_values: typing.Sequence[float], q: float) -> float:
+    """
+    :param sorted_values: sorted values
+    :param q: percentile in [0, 100]
+    :return: the nearest-rank percentile
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(case: str, mode: str, workers: int, documents: typing.List[str], seconds: float,
+              latencies: typing.List[float]) -> dict:
+    """
+    :return: a result record, see the module description
+    """
+    latencies = sorted(latencies)
+    chars = sum(len(doc) for doc in documents)
+    return {
+        "case": case,
+        "mode": mode,
+        "workers": workers,
+        "doc_chars": len(documents[0]) if documents else 0,
+        "docs": len(documents),
+        "seconds": seconds,
+        "chars_per_sec": chars / seconds if seconds > 0 else 0.0,
+        "mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_threads(case: str, documents: typing.List[str], threads: int) -> dict:
+    """
+    Call the case for every document in a thread pool of current process
+    """
+    # init the component and warm up outside of the timing
+    timed_call(documents[0], case)
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        latencies = list(executor.map(timed_call, documents, [case] * len(documents)))
+        seconds = time.perf_counter() - start
+    return summarize(case, "thread", threads, documents, seconds, latencies)
+
+
+def run_processes(case: str, documents: typing.List[str], processes: int) -> dict:
+    """
+    Call the case for every document in a :class:`nlpir.pool.Pool`
+    """
+    with Pool([CASES[case][0]], processes=processes) as pool:
+        # wait for all workers to init the component
+        pool.map(timed_call, documents[:processes], chunksize=1, case=case)
+        start = time.perf_counter()
+        latencies = pool.map(timed_call, documents, case=case)
+        seconds = time.perf_counter() - start
+    return summarize(case, "process", processes, documents, seconds, latencies)
+
+
+def run(
+        cases: typing.Optional[typing.Iterable[str]] = None,
+        sizes: typing.Iterable[int] = DEFAULT_SIZES,
+        threads: typing.Iterable[int] = DEFAULT_THREADS,
+        processes: typing.Iterable[int] = DEFAULT_PROCESSES,
+        chars: int = DEFAULT_CHARS,
+        source: typing.Optional[str] = None,
+        log: typing.Optional[typing.TextIO] = None
+) -> typing.List[dict]:
+    """
+    Run every case at every document size in every thread and process count
+
+    :param cases: names in :data:`CASES` , default is all
+    :param sizes: document sizes in characters
+    :param threads: thread counts
+    :param processes: process counts, use an empty list to skip the process pool
+    :param chars: characters processed in every configuration
+    :param source: cut documents from this UTF-8 text file instead of generating them
+    :param log: print the progress to it
+    :return: result records, see the module description
+    """
+    results = []
+    cases = list(CASES) if cases is None else list(cases)
+    for size in sizes:
+        count = max(MIN_DOCS, chars // size)
+        documents = generate_documents(size, count) if source is None else cut_documents(source, size, count)
+        for case in cases:
+            configs = [(run_threads, n) for n in threads] + [(run_processes, n) for n in processes]
+            for func, workers in configs:
+                result = func(case, documents, workers)
+                results.append(result)
+                if log is not None:
+                    print(
+                        f"{case:<34}{result['mode']:>8}{workers:>4}{size:>8}"
+                        f"{result['chars_per_sec']:>14.0f} c/s"
+                        f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f} ms",
+                        file=log
+                    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=None)
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--threads", nargs="*", type=int, default=DEFAULT_THREADS)
+    parser.add_argument("--processes", nargs="*", type=int, default=DEFAULT_PROCESSES)
+    parser.add_argument("--chars", type=int, default=DEFAULT_CHARS)
+    parser.add_argument("--source", default=None, help="cut documents from this UTF-8 text file")
+    parser.add_argument("-o", "--output", default=None, help="write JSON to this file instead of stdout")
+    args = parser.parse_args()
+    results = run(args.cases, args.sizes, args.threads, args.processes, args.chars, args.source, log=sys.stderr)
+    output = {
+        "meta": {
+            "time": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "nlpir": nlpir.__version__,
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    if args.output is None:
+        json.dump(output, sys.stdout, ensure_ascii=False, indent=2)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# coding=utf-8
+"""
+Documents per second of :func:`nlpir.ictclas.tokenize_for_ir_batch` , compare with calling
+:func:`nlpir.native.ictclas.ICTCLAS.tokenizer_for_ir` and ``json.loads`` for every document,
+and the bytes kept for the results::
+
+    python -m benchmarks.tokenize_for_ir --doc-chars 500 --docs 5000 --processes 4
+    python -m benchmarks.tokenize_for_ir --synthetic
+
+With ``--synthetic`` the tokenizer outputs are generated from the word list with random POS tags and replayed
+instead of calling the native library, which measures the Python side only (parsing and keeping the results),
+the pool is not used.
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+import typing
+
+from nlpir import ictclas
+from nlpir.pool import Pool
+from benchmarks.corpus import DEFAULT_SEED, generate_documents, load_words
+
+#: POS tags used by the synthetic outputs
+SYNTHETIC_POS = ["n", "v", "nsf", "vn", "ude1", "vshi", "wj", "wd", "m", "q", "d", "rz", "nr1", "uguo"]
+
+
+class ReplayTokenizer:
+    """
+    Stands for the native instance of :mod:`nlpir.ictclas` , returns the recorded outputs of
+    ``NLPIR_Tokenizer4IR``
+
+    :param outputs: ``{encoded document: output}``
+    """
+    encode = "utf-8"
+
+    def __init__(self, outputs: typing.Dict[bytes, bytes]):
+        self.outputs = outputs
+        self.funcs = {"NLPIR_Tokenizer4IR": lambda text, fine: self.outputs[text]}
+
+    def tokenizer_for_ir(self, text: str, fine: bool = False) -> str:
+        return self.outputs[text.encode(self.encode)].decode(self.encode)
+
+
+def synthetic_documents(
+        doc_chars: int,
+        docs: int,
+        seed: int = DEFAULT_SEED
+) -> typing.Tuple[typing.List[str], ReplayTokenizer]:
+    """
+    :param doc_chars: length of every document
+    :param docs: number of documents
+    :param seed: seed of the random generator
+    :return: the documents, and the tokenizer replaying an output like ``NLPIR_Tokenizer4IR`` for each of them
+    """
+    words = load_words()
+    rand = random.Random(seed)
+    documents, outputs = [], dict()
+    while len(documents) < docs:
+        parts, tokens, begin = [], [], 0
+        while sum(len(part) for part in parts) < doc_chars:
+            word = rand.choice(words)
+            end = begin + len(word.encode("utf-8"))
+            parts.append(word)
+            tokens.append({"text": word, "begin": begin, "end": end, "pos": rand.choice(SYNTHETIC_POS)})
+            begin = end
+        document = "".join(parts)
+        if document.encode("utf-8") not in outputs:
+            documents.append(document)
+            outputs[document.encode("utf-8")] = json.dumps(tokens, ensure_ascii=False).encode("utf-8")
+    return documents, ReplayTokenizer(outputs)
+
+
+def naive(documents: typing.List[str], fine: bool) -> list:
+    tokenizer = ictclas.get_native_instance()
+    return [json.loads(tokenizer.tokenizer_for_ir(doc, fine)) for doc in documents]
+
+
+def best_seconds(func: typing.Callable[[], typing.Any], repeat: int) -> float:
+    """
+    :return: best seconds of ``repeat`` calls
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def kept_bytes(build: typing.Callable[[], typing.Any]) -> int:
+    """
+    :return: bytes allocated by the kept results
+    """
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run(
+        doc_chars: int = 500,
+        docs: int = 5000,
+        fine: bool = False,
+        processes: typing.Iterable[int] = (4,),
+        repeat: int = 3,
+        synthetic: bool = False
+) -> typing.Dict[str, typing.Tuple[float, int]]:
+    """
+    :param doc_chars: length of every document
+    :param docs: number of documents
+    :param fine: finer segment or not
+    :param processes: process counts of the pool, use an empty list to skip the pool
+    :param repeat: rounds for each way, the best one is reported
+    :param synthetic: replay generated outputs instead of calling the native library
+    :return: ``{way: (documents per second, bytes kept)}``
+    """
+    if synthetic:
+        documents, ictclas.__instance__ = synthetic_documents(doc_chars, docs)
+        processes = ()
+    else:
+        documents = generate_documents(doc_chars, docs)
+    postings = ictclas.tokenize_for_ir_batch(documents[:100], fine)
+    for i, tokens in enumerate(naive(documents[:100], fine)):
+        assert postings.document(i) == [(t["text"], t["begin"], t["end"], t["pos"]) for t in tokens]
+    result = {
+        "json.loads per document": (
+            docs / best_seconds(lambda: naive(documents, fine), repeat), kept_bytes(lambda: naive(documents, fine))
+        ),
+        "tokenize_for_ir_batch": (
+            docs / best_seconds(lambda: ictclas.tokenize_for_ir_batch(documents, fine), repeat),
+            kept_bytes(lambda: ictclas.tokenize_for_ir_batch(documents, fine))
+        ),
+    }
+    for n in processes:
+        with Pool([ictclas], processes=n) as pool:
+            # wait for all workers to init the component
+            pool.map(ictclas.segment, documents[:n], chunksize=1)
+            seconds = best_seconds(lambda: ictclas.tokenize_for_ir_batch(documents, fine, pool=pool), repeat)
+        result[f"tokenize_for_ir_batch, pool of {n}"] = (docs / seconds, result["tokenize_for_ir_batch"][1])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--doc-chars", type=int, default=500)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--fine", action="store_true", help="finer segment")
+    parser.add_argument("--processes", nargs="*", type=int, default=[4])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--synthetic", action="store_true", help="replay generated outputs, no native library")
+    args = parser.parse_args()
+    result = run(args.doc_chars, args.docs, args.fine, args.processes, args.repeat, args.synthetic)
+    for name, (docs_per_sec, size) in result.items():
+        print(f"{name:<36}{docs_per_sec:>12.0f} docs/s{size / 1024 / 1024:>10.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# coding=utf-8
+"""
+Memory used to keep segmentation results, compare the list of ``(word, pos)`` tuples of
+:func:`nlpir.ictclas.process_to_list` with the interned POS tags of :func:`nlpir.ictclas.process_to_interned` ,
+the POS ids of :func:`nlpir.ictclas.process_to_pos_ids` and :class:`nlpir.tokens.Tokens` of
+:func:`nlpir.ictclas.process_to_tokens`::
+
+    python -m benchmarks.tokens_memory --doc-chars 1000 --docs 2000
+"""
+import argparse
+import gc
+import tracemalloc
+import typing
+
+from nlpir import ictclas
+from benchmarks.corpus import generate_documents
+
+
+def measure(build: typing.Callable[[], typing.Any]) -> int:
+    """
+    :param build: build and return the results to keep
+    :return: bytes allocated by the kept results
+    """
+    gc.collect()
+    tracemalloc.start()
+    results = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def run(doc_chars: int = 1000, docs: int = 2000, pos_tagged: bool = True) -> typing.Dict[str, typing.Tuple[int, float]]:
+    """
+    :param doc_chars: length of every document
+    :param docs: number of documents
+    :param pos_tagged: POS tagging or not
+    :return: ``{way: (bytes, bytes per token)}``
+    """
+    documents = generate_documents(doc_chars, docs)
+    # segment outside of the measurement, only the post process is measured
+    outputs = ictclas.segment_batch(documents, pos_tagged=pos_tagged, post_process=lambda t, _: t)
+    tokens = sum(len(ictclas.process_to_tokens(output, pos_tagged)) for output in outputs)
+    result = dict()
+    for name, post_process in (
+            ("list", ictclas.process_to_list),
+            ("interned", ictclas.process_to_interned),
+            ("pos ids", ictclas.process_to_pos_ids),
+            ("Tokens", ictclas.process_to_tokens),
+    ):
+        size = measure(lambda: [post_process(output, pos_tagged) for output in outputs])
+        result[name] = (size, size / tokens)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--doc-chars", type=int, default=1000)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--no-pos", action="store_true", help="segment without POS tagging")
+    args = parser.parse_args()
+    for name, (size, per_token) in run(args.doc_chars, args.docs, not args.no_pos).items():
+        print(f"{name:<10}{size / 1024 / 1024:>10.2f} MB{per_token:>10.1f} bytes/token")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,11 @@ import re
 import logging
 import sys
 import functools
+import importlib
+import time
+import tempfile
+import types
+import concurrent.futures
 from .exception import NLPIRException
 
 __version__ = "0.9.15.2"
@@ -111,6 +116,77 @@ def init_setting(
     return init_module
 
 
+#: 预热时对各个模块进行的一次简单调用, ``{module name: (function name, args)}``
+#: tiny calls to fault in the pages of dictionaries and models, used by :func:`warmup`
+__warmup_calls__ = {
+    "nlpir.ictclas": ("segment", ("预热中文分词组件。",)),
+    "nlpir.key_extract": ("get_key_words", ("预热关键词提取组件。",)),
+    "nlpir.summary": ("summarization", ("预热摘要组件。预热摘要组件。",)),
+    "nlpir.doc_extractor": ("extract", ("预热文档抽取组件。", [])),
+    "nlpir.sentiment_analysis": ("get_emotion", ("预热情感分析组件。",)),
+    "nlpir.text_similarity": ("similarity", ("预热文本相似度组件。", "预热组件。")),
+    "nlpir.new_word_finder": ("find_new_words", ("预热新词发现组件。", 1)),
+}
+
+
+def warmup(
+        modules: typing.Iterable[typing.Union[types.ModuleType, str]],
+        dummy_call: bool = True,
+        max_workers: typing.Optional[int] = None
+) -> typing.Dict[str, typing.Dict[str, float]]:
+    """
+    Init the high-level modules concurrently in threads, so the first request does not pay for the init,
+    can be used in the startup or readiness probe of a service. Modules already initialized are not initialized
+    again, their ``init`` is the time to get the existing instance, the dummy call is still run.
+    The settings set by :func:`init_setting` are used.
+
+    在多个线程中同时初始化指定的高层模块, 可选的对每个模块进行一次简单调用, 返回每个模块的初始化耗时::
+
+        timings = nlpir.warmup([ictclas, key_extract, summary, doc_extractor])
+        # {"nlpir.ictclas": {"init": 1.2, "call": 0.01}, ...}
+
+    :param modules: high-level modules or the names of them, like ``nlpir.ictclas`` or ``ictclas``
+    :param dummy_call: run a tiny call on every module after init to fault in the pages of
+        dictionaries and models, modules without a dummy call in :data:`__warmup_calls__` are only initialized
+    :param max_workers: number of threads, default is the number of modules
+    :return: ``{module name: {"init": seconds, "call": seconds}}`` , ``call`` only exists if a dummy call is run
+    :raises NLPIRException: init or dummy call of any module failed, raised after all modules finished
+    """
+    modules = {
+        module.__name__: module for module in (
+            importlib.import_module(m if m.startswith("nlpir.") else "nlpir." + m) if isinstance(m, str) else m
+            for m in modules
+        )
+    }
+
+    def warmup_module(module: types.ModuleType) -> typing.Dict[str, float]:
+        timing = dict()
+        start = time.perf_counter()
+        module.get_native_instance()
+        timing["init"] = time.perf_counter() - start
+        if dummy_call and module.__name__ in __warmup_calls__:
+            func_name, args = __warmup_calls__[module.__name__]
+            start = time.perf_counter()
+            getattr(module, func_name)(*args)
+            timing["call"] = time.perf_counter() - start
+        return timing
+
+    timings, errors = dict(), list()
+    if not modules:
+        return timings
+    with concurrent.futures.ThreadPoolExecutor(max_workers or len(modules)) as executor:
+        futures = {name: executor.submit(warmup_module, module) for name, module in modules.items()}
+        for name, future in futures.items():
+            try:
+                timings[name] = future.result()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Warmup {name} failed: {e}")
+                errors.append(f"{name}: {e}")
+    if errors:
+        raise NLPIRException("Warmup failed, " + "; ".join(errors))
+    return timings
+
+
 def import_dict(word_list: list, instance) -> list:
     """
     Temporary add word as dictionary, will loss it when restart the Program.
@@ -136,7 +212,77 @@ def import_dict(word_list: list, instance) -> list:
     fail_list = list()
     for word in word_list:
         if 0 != instance.add_user_word(word):
-            fail_list.append(word_list)
+            fail_list.append(word)
+    return fail_list
+
+
+# a user dict entry, ``word`` or ``word pos``
+__user_word__ = re.compile(r"^(\S+)(?: ([a-zA-Z0-9_]+))?$")
+
+
+def parse_user_word(entry: str) -> typing.Optional[typing.Tuple[str, str]]:
+    """
+    :param entry: an entry of the user dictionary, ``word`` or ``word pos``
+    :return: ``(word, pos)`` , the POS is ``n`` if not given, None if the format is wrong
+    """
+    match = __user_word__.match(entry.strip()) if isinstance(entry, str) else None
+    if match is None:
+        return None
+    return match.group(1), match.group(2) or "n"
+
+
+def import_dict_bulk(word_list: typing.Iterable[str], instance, overwrite: bool = False) -> list:
+    """
+    Add a lot of words with one native call, much faster than :func:`import_dict` which calls
+    ``add_user_word`` for every word.
+
+    批量导入用户词典, 所有词写入一个 ``word pos`` 格式的临时文件后调用一次 ``import_user_dict`` 导入.
+    词的格式与 :func:`import_dict` 相同, 没有词性时使用 ``n`` , 同一个词出现多次时使用最后一次的词性.
+
+    与 :func:`import_dict` 添加的临时词不同, 通过 ``import_user_dict`` 导入的词会保存在 Data 文件夹下,
+    只能用 :func:`clean_saved_user_dict` 删除.
+
+    格式不正确或者无法使用组件的编码表示的词不会导入, 直接作为失败返回. ``import_user_dict`` 返回失败时, 若组件支持
+    ``is_user_word`` (如 :class:`nlpir.native.ictclas.ICTCLAS`), 逐个检查找出未导入的词, 否则所有的词都作为失败返回.
+    失败的词不会再次添加.
+
+    :param word_list: words want to add, ``word`` or ``word pos``
+    :param instance: instance to execute the function, which has ``import_user_dict``
+    :param overwrite: overwrite the current user dict or not
+    :return: the words fail to add
+    """
+    if not hasattr(instance, "import_user_dict"):
+        raise NLPIRException("This instance not support this method")
+    fail_list = list()
+    entries = dict()
+    for word in word_list:
+        parsed = parse_user_word(word)
+        if parsed is None:
+            fail_list.append(word)
+            continue
+        try:
+            parsed[0].encode(instance.encode)
+        except UnicodeEncodeError:
+            fail_list.append(word)
+            continue
+        entries[parsed[0]] = (word, parsed[1])
+    if not entries:
+        return fail_list
+    with tempfile.NamedTemporaryFile(
+            "w", encoding=instance.encode, suffix=".txt", prefix="nlpir_user_dict_", delete=False
+    ) as f:
+        for entry, (_, pos) in entries.items():
+            f.write(f"{entry} {pos}\n")
+    try:
+        # 1 success, else failed, see ICTCLAS.import_user_dict
+        success = instance.import_user_dict(f.name, overwrite) == 1
+    finally:
+        os.remove(f.name)
+    if not success:
+        if hasattr(instance, "is_user_word"):
+            fail_list.extend(word for entry, (word, _) in entries.items() if instance.is_user_word(entry) != 1)
+        else:
+            fail_list.extend(word for word, _ in entries.values())
     return fail_list
 
 
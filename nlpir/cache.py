@@ -0,0 +1,743 @@
+#! coding=utf-8
+"""
+Result cache for the high-level functions
+
+重复的文本(转载, 模板生成的新闻等)每次都会调用动态链接库重新处理, 开启缓存后, 以文本内容的哈希, 调用参数以及组件配置
+(编码, 标注集, 用户词典版本)作为键, 缓存动态链接库返回的结果, 后处理(如 :func:`nlpir.ictclas.segment` 的
+``post_process``)仍然每次执行.
+
+Cache the native results of duplicate texts, keyed by a hash of the text, the parameters of the call and
+the config of the component (encoding, POS map, user dictionary version, see
+:func:`nlpir.native.nlpir_base.NLPIRBase.get_cache_config`), so a change of the POS map or user dictionaries
+never returns stale results. Functions can be cached:
+
+- :func:`nlpir.ictclas.segment`
+- :func:`nlpir.key_extract.get_key_words`
+- :func:`nlpir.summary.summarization`
+- :func:`nlpir.sentiment_analysis.get_emotion`
+- :func:`nlpir.doc_extractor.extract`
+
+Example::
+
+    from nlpir import cache
+
+    # for all functions above, share one cache of 256MB
+    cache.enable(max_bytes=256 * 1024 * 1024)
+    # or only for some of them, with a cache of their own
+    cache.enable(["ictclas.segment"], cache=cache.MemoryCache(64 * 1024 * 1024))
+    ...
+    print(cache.stats())
+    cache.disable()
+
+The cache backend is pluggable, any object implements the interface of :class:`Cache` can be used.
+:class:`DiskCache` keeps the results in a sqlite3 database across runs, and is cleared automatically when
+the files in ``Data`` (include the saved user dictionaries) or ``lib`` change, put it under a
+:class:`MemoryCache` with :class:`TieredCache` for the expensive functions::
+
+    cache.enable(
+        ["summary.summarization", "key_extract.get_key_words", "doc_extractor.extract"],
+        cache=cache.TieredCache(cache.MemoryCache(), cache.DiskCache("/var/cache/nlpir.sqlite3"))
+    )
+
+:class:`SharedMemoryCache` (Python 3.8+) is a fixed-size hash table in :mod:`multiprocessing.shared_memory`
+that all processes on a host can read and write, so the workers of :class:`nlpir.pool.Pool` process a
+repeated text once per host instead of once per worker::
+
+    shared = cache.SharedMemoryCache("nlpir_cache", max_bytes=256 * 1024 * 1024)
+    with Pool([ictclas], processes=8, cache=shared) as pool:
+        pool.map(ictclas.segment, texts)
+    shared.unlink()
+"""
+import collections
+import hashlib
+import os
+import pickle
+import re
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import typing
+from nlpir import PACKAGE_DIR
+from nlpir.exception import NLPIRException
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+__all__ = [
+    "CACHEABLE_FUNCTIONS",
+    "DEFAULT_MAX_BYTES",
+    "Cache",
+    "MemoryCache",
+    "DiskCache",
+    "TieredCache",
+    "SharedMemoryCache",
+    "get_fingerprint",
+    "enable",
+    "disable",
+    "get_cache",
+    "stats",
+    "make_key",
+    "cached_call",
+]
+
+#: Names of the functions can be cached
+CACHEABLE_FUNCTIONS = (
+    "ictclas.segment",
+    "key_extract.get_key_words",
+    "summary.summarization",
+    "sentiment_analysis.get_emotion",
+    "doc_extractor.extract",
+)
+
+#: Default size limit of :class:`MemoryCache`
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+#: Default size limit of :class:`DiskCache`
+DEFAULT_DISK_MAX_BYTES = 1024 * 1024 * 1024
+#: Default directories watched by :class:`DiskCache`
+DEFAULT_WATCH_PATHS = (os.path.join(PACKAGE_DIR, "Data"), os.path.join(PACKAGE_DIR, "lib"))
+
+#: Default size of :class:`SharedMemoryCache`
+DEFAULT_SHARED_MAX_BYTES = 128 * 1024 * 1024
+#: Default slot size of :class:`SharedMemoryCache` , pickled values larger than it are not cached
+DEFAULT_SLOT_SIZE = 8192
+
+# log files written by the components, not part of the fingerprint
+__log_file__ = re.compile(r"(\d{8}\.(log|err)|err.*)$")
+
+
+def get_size(value: typing.Any) -> int:
+    """
+    :param value: a cached value
+    :return: estimated memory size of the value in bytes
+    """
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class Cache:
+    """
+    Interface of a cache backend, keys are 16 bytes digests made by :func:`make_key`
+    """
+
+    def get(self, key: bytes) -> typing.Tuple[bool, typing.Any]:
+        """
+        :param key: key of the value
+        :return: ``(found, value)``
+        """
+        raise NotImplementedError
+
+    def set(self, key: bytes, value: typing.Any) -> None:
+        """
+        :param key: key of the value
+        :param value: the native result to cache
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Remove all values
+        """
+        raise NotImplementedError
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        :return: statistics of the backend, at least ``hits`` and ``misses``
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """
+    A thread safe in-process LRU cache bounded by the estimated size of the values
+
+    :param max_bytes: size limit of the cached keys and values, the least recently used ones are
+        evicted when exceed, a single value larger than it is not cached
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.items: typing.MutableMapping[bytes, typing.Tuple[typing.Any, int]] = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def __reduce__(self):
+        # an empty cache of the same size in another process
+        return type(self), (self.max_bytes,)
+
+    def get(self, key: bytes) -> typing.Tuple[bool, typing.Any]:
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                self.misses += 1
+                return False, None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return True, item[0]
+
+    def set(self, key: bytes, value: typing.Any) -> None:
+        size = get_size(value) + sys.getsizeof(key)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            old = self.items.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.items[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self.items.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+            self.bytes = 0
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        with self.lock:
+            return {
+                "type": type(self).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "items": len(self.items),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def get_fingerprint(paths: typing.Iterable[str], ignore: typing.Iterable[str] = ()) -> str:
+    """
+    A fingerprint of the files in the directories, changes if any file is added, removed or modified,
+    log files of the components are ignored
+
+    :param paths: directories or files
+    :param ignore: files to ignore, like the cache database itself
+    :return: hex digest of the paths, sizes and modification times
+    """
+    ignore = {os.path.abspath(path) for path in ignore}
+    digest = hashlib.blake2b(digest_size=16)
+    for root_path in paths:
+        root_path = os.path.abspath(root_path)
+        if os.path.isfile(root_path):
+            files = [root_path]
+        else:
+            files = []
+            for dir_path, dir_names, file_names in os.walk(root_path):
+                dir_names.sort()
+                files.extend(os.path.join(dir_path, name) for name in sorted(file_names))
+        for path in files:
+            if path in ignore or __log_file__.match(os.path.basename(path)):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class DiskCache(Cache):
+    """
+    A persistent cache in a sqlite3 database, can be shared by threads and processes.
+    Values are pickled, the least recently used ones are evicted when the database exceeds ``max_bytes`` .
+
+    All values are removed when the fingerprint (see :func:`get_fingerprint`) of ``watch_paths`` changes,
+    it is checked when open the database and every ``check_interval`` seconds. The user dictionaries saved
+    by the components are in the ``Data`` directory, so they are covered by the default ``watch_paths`` ,
+    the unsaved changes are covered by the cache key, see
+    :func:`nlpir.native.nlpir_base.NLPIRBase.get_cache_config` .
+
+    :param path: path of the database file
+    :param max_bytes: size limit of the pickled values
+    :param watch_paths: directories and files the cached results depend on, default is the ``Data`` and
+        ``lib`` directories of the package, add the custom ``data_path`` if set by :func:`nlpir.init_setting`
+    :param check_interval: seconds between two checks of the fingerprint
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+            watch_paths: typing.Iterable[str] = DEFAULT_WATCH_PATHS,
+            check_interval: float = 60.0
+    ):
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.watch_paths = list(watch_paths)
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.pid: typing.Optional[int] = None
+        self.connection: typing.Optional[sqlite3.Connection] = None
+        self.checked = 0.0
+
+    def __reduce__(self):
+        return type(self), (self.path, self.max_bytes, self.watch_paths, self.check_interval)
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        :return: the connection of current process, open the database and check the fingerprint if not opened
+        """
+        if self.pid != os.getpid():
+            # do not share a connection with the parent process after fork
+            self.pid = os.getpid()
+            self.connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False, isolation_level=None)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key BLOB PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, atime REAL NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS cache_atime ON cache (atime)")
+            self.checked = 0.0
+        if time.monotonic() - self.checked > self.check_interval:
+            self.check_fingerprint()
+        return self.connection
+
+    def check_fingerprint(self) -> None:
+        """
+        Remove all values if the fingerprint of ``watch_paths`` changed
+        """
+        fingerprint = get_fingerprint(self.watch_paths, ignore=[self.path, self.path + "-wal", self.path + "-shm"])
+        row = self.connection.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            with self.connection:
+                self.connection.execute("BEGIN IMMEDIATE")
+                self.connection.execute("DELETE FROM cache")
+                self.connection.execute("REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+            if row is not None:
+                self.invalidations += 1
+        self.bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        self.checked = time.monotonic()
+
+    def get(self, key: bytes) -> typing.Tuple[bool, typing.Any]:
+        with self.lock:
+            connection = self.connect()
+            row = connection.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            connection.execute("UPDATE cache SET atime = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return True, pickle.loads(row[0])
+
+    def set(self, key: bytes, value: typing.Any) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                row = connection.execute("SELECT size FROM cache WHERE key = ?", (key,)).fetchone()
+                connection.execute("REPLACE INTO cache VALUES (?, ?, ?, ?)", (key, data, len(data), time.time()))
+            # a replaced value no longer takes space
+            self.bytes += len(data) - (row[0] if row is not None else 0)
+            if self.bytes > self.max_bytes:
+                self.evict(connection)
+
+    def evict(self, connection: sqlite3.Connection) -> None:
+        """
+        Remove the least recently used values until the size is below 90% of ``max_bytes`` ,
+        leave some space so it is not run for every new value
+        """
+        self.bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        target = self.max_bytes * 0.9
+        while self.bytes > target:
+            rows = connection.execute("SELECT key, size FROM cache ORDER BY atime LIMIT 256").fetchall()
+            if not rows:
+                break
+            keys = []
+            for key, size in rows:
+                keys.append((key,))
+                self.bytes -= size
+                if self.bytes <= target:
+                    break
+            connection.executemany("DELETE FROM cache WHERE key = ?", keys)
+            self.evictions += len(keys)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.connect().execute("DELETE FROM cache")
+            self.bytes = 0
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        with self.lock:
+            items = self.connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            return {
+                "type": type(self).__name__,
+                "path": self.path,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "items": items,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class TieredCache(Cache):
+    """
+    Caches in layers, e.g. a :class:`MemoryCache` over a :class:`DiskCache` , values found in a lower
+    layer are copied to the upper ones, new values are set in all layers
+
+    :param tiers: caches from the fastest to the slowest
+    """
+
+    def __init__(self, *tiers: Cache):
+        self.tiers = tiers
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> typing.Tuple[bool, typing.Any]:
+        for i, tier in enumerate(self.tiers):
+            found, value = tier.get(key)
+            if found:
+                for upper in self.tiers[:i]:
+                    upper.set(key, value)
+                self.hits += 1
+                return True, value
+        self.misses += 1
+        return False, None
+
+    def set(self, key: bytes, value: typing.Any) -> None:
+        for tier in self.tiers:
+            tier.set(key, value)
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "type": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "tiers": [tier.stats() for tier in self.tiers],
+        }
+
+
+class SharedMemoryCache(Cache):
+    """
+    A cache in a named shared memory block, can be read and written by all processes on a host, only available
+    on Python 3.8+. The block is created by the first process uses the name and attached by the others,
+    the size and layout are read from the block, so the parameters of the later ones are ignored.
+
+    The memory is a fixed-size hash table of slots, every key is mapped to a bucket of ``ways`` slots,
+    a new value replaces the least recently used one in the bucket. Access is lock-free: every slot has a
+    checksum of the key and value, written after them, a slot being written by another process at the same
+    time does not match its checksum and is treated as a miss, so a value is never read half-written.
+
+    The block is not removed when the processes exit, call :func:`unlink` in the owner when it is no longer
+    needed. The object can be pickled and sent to other processes, it attaches the same block by name.
+
+    :param name: name of the shared memory block
+    :param max_bytes: size of the shared memory block
+    :param slot_size: size of a slot, pickled values larger than ``slot_size - 36`` bytes are not cached
+    :param ways: number of slots in a bucket
+    :raises NLPIRException: :mod:`multiprocessing.shared_memory` is not available
+    """
+    #: magic, version, buckets, ways, slot size
+    HEADER = struct.Struct("<8sIIII")
+    #: checksum, key, last access time, length of value
+    SLOT_HEADER = struct.Struct("<8s16sQI")
+    MAGIC = b"NLPIRSMC"
+    VERSION = 1
+
+    def __init__(
+            self,
+            name: str = "nlpir_cache",
+            max_bytes: int = DEFAULT_SHARED_MAX_BYTES,
+            slot_size: int = DEFAULT_SLOT_SIZE,
+            ways: int = 4
+    ):
+        if shared_memory is None:
+            raise NLPIRException("SharedMemoryCache needs multiprocessing.shared_memory of Python 3.8+")
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.memory = self.open(name, max_bytes, slot_size, ways)
+        self.buf = self.memory.buf
+        _, _, self.buckets, self.ways, self.slot_size = self.HEADER.unpack_from(self.buf, 0)
+        self.capacity = self.slot_size - self.SLOT_HEADER.size
+
+    @classmethod
+    def open(cls, name: str, max_bytes: int, slot_size: int, ways: int) -> "shared_memory.SharedMemory":
+        """
+        Create the shared memory block, or attach it if exists
+
+        :return: the shared memory block with the header initialized
+        """
+        buckets = max(1, (max_bytes - cls.HEADER.size) // (slot_size * ways))
+        size = cls.HEADER.size + buckets * ways * slot_size
+        try:
+            memory = cls.shared_memory(name, create=True, size=size)
+            cls.HEADER.pack_into(memory.buf, 0, cls.MAGIC, cls.VERSION, buckets, ways, slot_size)
+            return memory
+        except FileExistsError:
+            memory = cls.shared_memory(name)
+        # wait for the creator to write the header
+        deadline = time.monotonic() + 5
+        while bytes(memory.buf[:len(cls.MAGIC)]) != cls.MAGIC:
+            if time.monotonic() > deadline:
+                memory.close()
+                raise NLPIRException(f"Shared memory {name} is not a cache created by SharedMemoryCache")
+            time.sleep(0.001)
+        return memory
+
+    @staticmethod
+    def shared_memory(name: str, create: bool = False, size: int = 0) -> "shared_memory.SharedMemory":
+        """
+        Open a shared memory block without tracking it, otherwise the resource tracker removes the block
+        when the process exits, even if other processes are using it
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+        memory = shared_memory.SharedMemory(name, create=create, size=size)
+        try:
+            from multiprocessing import resource_tracker
+            # noinspection PyProtectedMember
+            resource_tracker.unregister(memory._name, "shared_memory")
+        except (ImportError, AttributeError):
+            pass
+        return memory
+
+    def __reduce__(self):
+        return type(self), (self.name, self.memory.size, self.slot_size, self.ways)
+
+    def checksum(self, key: bytes, data: bytes) -> bytes:
+        """
+        :return: checksum of a slot
+        """
+        return hashlib.blake2b(key + data, digest_size=8, person=len(data).to_bytes(4, "little")).digest()
+
+    def get_offsets(self, key: bytes) -> range:
+        """
+        :return: offsets of the slots in the bucket of the key
+        """
+        start = self.HEADER.size + int.from_bytes(key[:8], "little") % self.buckets * self.ways * self.slot_size
+        return range(start, start + self.ways * self.slot_size, self.slot_size)
+
+    def get(self, key: bytes) -> typing.Tuple[bool, typing.Any]:
+        for offset in self.get_offsets(key):
+            checksum, slot_key, _, length = self.SLOT_HEADER.unpack_from(self.buf, offset)
+            if slot_key != key or length > self.capacity:
+                continue
+            start = offset + self.SLOT_HEADER.size
+            data = bytes(self.buf[start:start + length])
+            if checksum != self.checksum(slot_key, data):
+                # being written by another process
+                continue
+            struct.pack_into("<Q", self.buf, offset + 24, time.time_ns())
+            self.hits += 1
+            return True, pickle.loads(data)
+        self.misses += 1
+        return False, None
+
+    def set(self, key: bytes, value: typing.Any) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.capacity:
+            self.skipped += 1
+            return
+        target, oldest = None, None
+        for offset in self.get_offsets(key):
+            _, slot_key, stamp, _ = self.SLOT_HEADER.unpack_from(self.buf, offset)
+            if slot_key == key:
+                target = offset
+                break
+            if oldest is None or stamp < oldest:
+                target, oldest = offset, stamp
+        # clear the checksum first, readers miss the slot until the new checksum is written
+        self.buf[target:target + 8] = bytes(8)
+        start = target + self.SLOT_HEADER.size
+        self.buf[start:start + len(data)] = data
+        self.SLOT_HEADER.pack_into(self.buf, target, bytes(8), key, time.time_ns(), len(data))
+        self.buf[target:target + 8] = self.checksum(key, data)
+
+    def clear(self) -> None:
+        for offset in range(self.HEADER.size, self.memory.size - self.slot_size + 1, self.slot_size):
+            self.buf[offset:offset + self.SLOT_HEADER.size] = bytes(self.SLOT_HEADER.size)
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        ``hits``, ``misses`` and ``skipped`` (values too large) are counted in current process,
+        ``items`` is counted from the shared memory
+        """
+        items = 0
+        for offset in range(self.HEADER.size, self.memory.size - self.slot_size + 1, self.slot_size):
+            if self.buf[offset + 24:offset + 32] != bytes(8):
+                items += 1
+        return {
+            "type": type(self).__name__,
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "items": items,
+            "slots": self.buckets * self.ways,
+            "slot_size": self.slot_size,
+            "bytes": self.memory.size,
+        }
+
+    def close(self) -> None:
+        """
+        Detach the shared memory block in current process
+        """
+        self.buf.release()
+        self.memory.close()
+
+    def unlink(self) -> None:
+        """
+        Remove the shared memory block, the processes attached can still use it until they close it
+        """
+        if sys.version_info < (3, 13):
+            try:
+                from multiprocessing import resource_tracker
+                # unlink() unregisters the block, register it again since it is untracked by shared_memory()
+                # noinspection PyProtectedMember
+                resource_tracker.register(self.memory._name, "shared_memory")
+            except (ImportError, AttributeError):
+                pass
+        self.memory.unlink()
+
+
+# cache for all functions, set by enable()
+__default__: typing.Optional[Cache] = None
+# function name: cache or None (disabled), override the default one
+__caches__: typing.Dict[str, typing.Optional[Cache]] = dict()
+# function name: [hits, misses]
+__counters__: typing.Dict[str, typing.List[int]] = {name: [0, 0] for name in CACHEABLE_FUNCTIONS}
+__lock__ = threading.Lock()
+
+
+def __check_functions__(functions: typing.Iterable[str]) -> typing.List[str]:
+    functions = list(functions)
+    for function in functions:
+        if function not in CACHEABLE_FUNCTIONS:
+            raise ValueError(f"{function} can not be cached, should be one of {CACHEABLE_FUNCTIONS}")
+    return functions
+
+
+def enable(
+        functions: typing.Optional[typing.Iterable[str]] = None,
+        cache: typing.Optional[Cache] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES
+) -> Cache:
+    """
+    Enable the cache
+
+    :param functions: names in :data:`CACHEABLE_FUNCTIONS` , None for all of them
+    :param cache: the cache backend, default is a new :class:`MemoryCache`
+    :param max_bytes: size limit of the new :class:`MemoryCache`
+    :return: the cache backend
+    :raises ValueError: some of the functions can not be cached
+    """
+    global __default__
+    if cache is None:
+        cache = MemoryCache(max_bytes)
+    if functions is None:
+        __caches__.clear()
+        __default__ = cache
+    else:
+        for function in __check_functions__(functions):
+            __caches__[function] = cache
+    return cache
+
+
+def disable(functions: typing.Optional[typing.Iterable[str]] = None) -> None:
+    """
+    Disable the cache, the cached values are kept in the backend
+
+    :param functions: names in :data:`CACHEABLE_FUNCTIONS` , None for all of them
+    """
+    global __default__
+    if functions is None:
+        __caches__.clear()
+        __default__ = None
+    else:
+        for function in __check_functions__(functions):
+            __caches__[function] = None
+
+
+def get_cache(function: str) -> typing.Optional[Cache]:
+    """
+    :param function: name in :data:`CACHEABLE_FUNCTIONS`
+    :return: the cache backend used by the function, None if disabled
+    """
+    return __caches__.get(function, __default__)
+
+
+def stats() -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """
+    :return: ``{function: {"hits": ..., "misses": ..., "hit_rate": ..., "cache": backend stats or None}}``
+    """
+    result = dict()
+    with __lock__:
+        counters = {name: list(counter) for name, counter in __counters__.items()}
+    for function, (hits, misses) in counters.items():
+        cache = get_cache(function)
+        result[function] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "cache": None if cache is None else cache.stats(),
+        }
+    return result
+
+
+def make_key(function: str, config: tuple, params: tuple, text: str) -> bytes:
+    """
+    :param function: name of the function
+    :param config: config of the component, see :func:`nlpir.native.nlpir_base.NLPIRBase.get_cache_config`
+    :param params: parameters of the call except the text
+    :param text: the text to process
+    :return: a 16 bytes digest
+    """
+    data = text.encode("utf-8", errors="surrogatepass")
+    # the length of the text separates it from the parameters
+    digest = hashlib.blake2b(len(data).to_bytes(8, "little"), digest_size=16)
+    digest.update(data)
+    digest.update(repr((function, config, params)).encode("utf-8"))
+    return digest.digest()
+
+
+def cached_call(function: str, instance, func: typing.Callable, text: str, *params) -> typing.Any:
+    """
+    Call ``func(text, *params)`` , return the cached value if the function is cached and the
+    same text has been processed with the same parameters and config
+
+    :param function: name in :data:`CACHEABLE_FUNCTIONS`
+    :param instance: the native instance, provides :func:`nlpir.native.nlpir_base.NLPIRBase.get_cache_config`
+    :param func: the native function
+    :param text: the text to process
+    :param params: other parameters of ``func``
+    :return: result of ``func``
+    """
+    cache = get_cache(function)
+    if cache is None:
+        return func(text, *params)
+    key = make_key(function, instance.get_cache_config(), params, text)
+    found, value = cache.get(key)
+    with __lock__:
+        __counters__[function][0 if found else 1] += 1
+    if found:
+        return value
+    value = func(text, *params)
+    cache.set(key, value)
+    return value
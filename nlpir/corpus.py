@@ -0,0 +1,305 @@
+#! coding=utf-8
+"""
+Parallel segmentation of large corpora
+
+一个目录(递归包含其中所有文件)或一个大文件按照字节范围切分为多个分片(shard), 分片的边界对齐到行首,
+在 :class:`nlpir.pool.Pool` 的多个工作进程中分别使用 :func:`nlpir.ictclas.segment_batch` 逐行分词,
+输出的每一行对应输入的一行, 最后按原始的顺序合并为与输入的目录结构相同的输出文件.
+
+每个分片完成后写入输出目录下的 ``.shards`` 目录作为检查点, 中断后使用相同的参数再次运行会跳过已完成的分片::
+
+    from nlpir import corpus
+
+    report = corpus.segment_corpus("corpus/", "segmented/", processes=16, pos_tagged=True)
+    print(report["bytes_per_sec"])
+
+也可以作为命令行使用::
+
+    python -m nlpir.corpus corpus/ segmented/ --processes 16 --pos-tagged
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+import typing
+from nlpir import ictclas
+from nlpir.exception import NLPIRException
+from nlpir.pool import Pool
+
+__all__ = [
+    "Shard",
+    "DEFAULT_SHARD_SIZE",
+    "list_files",
+    "make_shards",
+    "segment_shard",
+    "segment_corpus",
+]
+
+#: Default size of a shard in bytes
+DEFAULT_SHARD_SIZE = 64 * 1024 * 1024
+#: Lines segmented at once in a worker
+BATCH_LINES = 1000
+#: Name of the checkpoint directory in the output directory
+SHARDS_DIR = ".shards"
+
+
+class Shard(typing.NamedTuple):
+    """
+    A byte range ``[start, end)`` of a file, start and end are at the beginning of a line
+    """
+    #: index of the shard in the corpus
+    index: int
+    #: path of the file
+    path: str
+    #: path relative to the corpus, used as the path of the output
+    name: str
+    start: int
+    end: int
+
+
+def list_files(source: str) -> typing.List[typing.Tuple[str, str]]:
+    """
+    :param source: a directory or a file
+    :return: ``[(path, path relative to the source)]`` of all files, sorted by the relative path,
+        the relative path of a single file is its name
+    """
+    if os.path.isfile(source):
+        return [(source, os.path.basename(source))]
+    if not os.path.isdir(source):
+        raise NLPIRException(f"{source} is not a file or directory")
+    files = []
+    for root, dirs, filenames in os.walk(source):
+        dirs.sort()
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            files.append((path, os.path.relpath(path, source)))
+    return sorted(files, key=lambda item: item[1])
+
+
+def make_shards(source: str, shard_size: int = DEFAULT_SHARD_SIZE) -> typing.List[Shard]:
+    """
+    Split the files into shards of about ``shard_size`` bytes, every boundary is moved to the beginning of
+    the next line, so a shard never cuts a line. Empty files have one empty shard, so they have outputs too.
+
+    :param source: a directory or a file
+    :param shard_size: size of a shard in bytes
+    :return: shards in the order of the files and the positions
+    """
+    shards = []
+    for path, name in list_files(source):
+        size = os.path.getsize(path)
+        bounds = [0]
+        with open(path, "rb") as f:
+            position = shard_size
+            while position < size:
+                f.seek(position)
+                f.readline()
+                bound = f.tell()
+                if bound >= size:
+                    break
+                bounds.append(bound)
+                position = bound + shard_size
+        bounds.append(size)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            shards.append(Shard(len(shards), path, name, start, end))
+    return shards
+
+
+def get_part_path(shards_dir: str, index: int) -> str:
+    """
+    :return: path of the output of a shard
+    """
+    return os.path.join(shards_dir, f"{index:08d}.part")
+
+
+def segment_shard(
+        shard: Shard,
+        shards_dir: str,
+        pos_tagged: bool = False,
+        encoding: str = "utf-8",
+        errors: str = "strict"
+) -> typing.Tuple[int, int, int]:
+    """
+    Segment every line of a shard and write the result to the shards directory, the output is renamed to
+    its final name after it is complete, so an existing output always means the shard is done.
+    Called in the workers.
+
+    :param shard: the shard
+    :param shards_dir: directory of the outputs of the shards
+    :param pos_tagged: POS tagging or not
+    :param encoding: encoding of the input and output
+    :param errors: how to handle the bytes can not be decoded, same as :meth:`bytes.decode`
+    :return: ``(index, bytes, lines)`` of the shard
+    """
+    path = get_part_path(shards_dir, shard.index)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    lines = 0
+
+    def write(batch: typing.List[str]):
+        for result in ictclas.segment_batch(batch, pos_tagged=pos_tagged, post_process=lambda t, _: t):
+            output.write(result)
+            output.write("\n")
+
+    with open(shard.path, "rb") as f, open(tmp_path, "w", encoding=encoding) as output:
+        f.seek(shard.start)
+        batch = []
+        while f.tell() < shard.end:
+            line = f.readline()
+            if not line:
+                break
+            batch.append(line.rstrip(b"\r\n").decode(encoding, errors=errors))
+            if len(batch) >= BATCH_LINES:
+                write(batch)
+                lines += len(batch)
+                batch = []
+        write(batch)
+        lines += len(batch)
+    os.replace(tmp_path, path)
+    return shard.index, shard.end - shard.start, lines
+
+
+def get_manifest(
+        source: str,
+        shards: typing.List[Shard],
+        shard_size: int,
+        pos_tagged: bool,
+        encoding: str,
+        errors: str
+) -> dict:
+    """
+    :return: the parameters of a run, a checkpoint can only be resumed by a run with the same manifest
+    """
+    files = dict()
+    for shard in shards:
+        if shard.name not in files:
+            stat = os.stat(shard.path)
+            files[shard.name] = [stat.st_size, stat.st_mtime]
+    return {
+        "source": os.path.abspath(source),
+        "files": files,
+        "shards": len(shards),
+        "shard_size": shard_size,
+        "pos_tagged": pos_tagged,
+        "encoding": encoding,
+        "errors": errors,
+    }
+
+
+def segment_corpus(
+        source: str,
+        output: str,
+        processes: typing.Optional[int] = None,
+        pos_tagged: bool = False,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        resume: bool = True,
+        keep_shards: bool = False,
+        log: typing.Optional[typing.TextIO] = None
+) -> dict:
+    """
+    Segment a directory or a large file in a process pool, see the module description
+
+    :param source: a directory or a file
+    :param output: output directory, every input file has an output file with the same relative path
+    :param processes: number of workers, default is the number of CPUs
+    :param pos_tagged: POS tagging or not
+    :param shard_size: size of a shard in bytes
+    :param encoding: encoding of the input and output
+    :param errors: how to handle the bytes can not be decoded, same as :meth:`bytes.decode` , a shard with
+        such bytes fails the run by default
+    :param resume: skip the shards done by an interrupted run with the same parameters,
+        start over if it is False
+    :param keep_shards: keep the outputs of the shards after they are merged
+    :param log: print the progress to it
+    :return: report of the run, ``{"files", "shards", "resumed", "bytes", "lines", "seconds", "bytes_per_sec"}`` ,
+        ``bytes`` , ``lines`` and ``bytes_per_sec`` only count the shards processed in this run
+    :raises NLPIRException: the checkpoint is from a run with different parameters
+    """
+    start_time = time.perf_counter()
+    shards = make_shards(source, shard_size)
+    shards_dir = os.path.join(output, SHARDS_DIR)
+    manifest = get_manifest(source, shards, shard_size, pos_tagged, encoding, errors)
+    manifest_path = os.path.join(shards_dir, "manifest.json")
+    if not resume and os.path.isdir(shards_dir):
+        shutil.rmtree(shards_dir)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            if json.load(f) != manifest:
+                raise NLPIRException(
+                    f"the checkpoint in {shards_dir} is from a run with different source or parameters, "
+                    f"use resume=False to start over"
+                )
+    else:
+        os.makedirs(shards_dir, exist_ok=True)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+    todo = [shard for shard in shards if not os.path.exists(get_part_path(shards_dir, shard.index))]
+    total_bytes, total_lines = 0, 0
+    if todo:
+        with Pool([ictclas], processes=processes) as pool:
+            for index, size, lines in pool.imap(
+                    segment_shard, todo, chunksize=1, shards_dir=shards_dir, pos_tagged=pos_tagged, encoding=encoding,
+                    errors=errors
+            ):
+                total_bytes += size
+                total_lines += lines
+                if log is not None:
+                    seconds = time.perf_counter() - start_time
+                    print(
+                        f"shard {index + 1}/{len(shards)} {shards[index].name} "
+                        f"{total_bytes / seconds / 1024 / 1024:.2f} MB/s",
+                        file=log
+                    )
+
+    # merge the shards of every file in order
+    names = dict()
+    for shard in shards:
+        names.setdefault(shard.name, []).append(shard.index)
+    for name, indexes in names.items():
+        path = os.path.join(output, name)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            for index in indexes:
+                with open(get_part_path(shards_dir, index), "rb") as part:
+                    shutil.copyfileobj(part, f)
+        os.replace(path + ".tmp", path)
+    if not keep_shards:
+        shutil.rmtree(shards_dir)
+
+    seconds = time.perf_counter() - start_time
+    return {
+        "files": len(names),
+        "shards": len(shards),
+        "resumed": len(shards) - len(todo),
+        "bytes": total_bytes,
+        "lines": total_lines,
+        "seconds": seconds,
+        "bytes_per_sec": total_bytes / seconds if seconds > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Segment a directory or a large file in a process pool")
+    parser.add_argument("source", help="a directory or a file")
+    parser.add_argument("output", help="output directory")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--pos-tagged", action="store_true")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="size of a shard in bytes")
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--errors", default="strict", help="how to handle the bytes can not be decoded, like ignore")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start over")
+    parser.add_argument("--keep-shards", action="store_true")
+    args = parser.parse_args()
+    report = segment_corpus(
+        args.source, args.output, args.processes, args.pos_tagged, args.shard_size, args.encoding, args.errors,
+        resume=not args.restart, keep_shards=args.keep_shards, log=sys.stderr
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
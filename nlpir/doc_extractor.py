@@ -6,6 +6,7 @@ import re
 import typing
 import nlpir
 from nlpir import get_instance as __get_instance__
+from nlpir.cache import cached_call as __cached_call__, get_cache as __get_cache__
 from nlpir import native
 
 # class and class instance
@@ -24,6 +25,12 @@ __nlpir_encode__ = native.UTF8_CODE
 class ExtractResult:
     """
     A class for retrieve result from Document Extractor's handle
+
+    :param handle: handle returned by :func:`nlpir.native.doc_extractor.DocExtractor.pares_doc_e` ,
+        None if ``raw_result`` is given
+    :param user_retrieve_type: user defined pos
+    :param raw_result: the native results of all retrieve types fetched from a handle, used when the
+        result is cached, see :mod:`nlpir.cache` , ``{"results": {retrieve type: str}, "sentiment": int}``
     """
     #: Types map can be retrieved from DocExtractor
     retrieve_type_map: typing.Dict[str, int] = {
@@ -43,11 +50,17 @@ class ExtractResult:
         "user": native.doc_extractor.DOC_EXTRACT_TYPE_USER
     }
 
-    def __init__(self, handle: int, user_retrieve_type: typing.List[str]):
-        self.handle: int = handle
+    def __init__(
+            self,
+            handle: typing.Optional[int],
+            user_retrieve_type: typing.List[str],
+            raw_result: typing.Optional[dict] = None
+    ):
+        self.handle: typing.Optional[int] = handle
+        self.raw_result = raw_result
         # add user defined pos
         self.user_retrieve_type_map: typing.Dict[str, int] = {
-            _: self.retrieve_type_map["user"] + i for i, _ in user_retrieve_type
+            _: self.retrieve_type_map["user"] + i for i, _ in enumerate(user_retrieve_type)
         }
         self.retrieve_types: typing.List[int] = [
             native.doc_extractor.DOC_EXTRACT_TYPE_PERSON,
@@ -134,9 +147,12 @@ class ExtractResult:
             self.set_retrieve_types(retrieve_types)
         result_dict = dict()
         for retrieve_type in self.retrieve_types:
-            result = __instance__.get_result(
-                handle=self.handle, doc_extract_type=retrieve_type
-            )
+            if self.raw_result is not None:
+                result = self.raw_result["results"].get(retrieve_type)
+            else:
+                result = __instance__.get_result(
+                    handle=self.handle, doc_extract_type=retrieve_type
+                )
             re_, func = self.re_result_map.get(retrieve_type, self.re_sharp_split)
             result = re_.findall("" if result is None else result)
             result_list = list()
@@ -158,11 +174,14 @@ class ExtractResult:
 
         :return:
         """
+        if self.raw_result is not None:
+            return self.raw_result["sentiment"]
         return __instance__.get_sentiment_score(self.handle)
 
     @__get_instance__
     def __del__(self):
-        return __instance__.release_handle(self.handle)
+        if self.handle is not None:
+            return __instance__.release_handle(self.handle)
 
 
 @__get_instance__
@@ -178,13 +197,46 @@ def get_native_instance() -> native.doc_extractor.DocExtractor:
 @__get_instance__
 def extract(text: str, user_define_pos: typing.List[str]) -> ExtractResult:
     """
+    若对 ``doc_extractor.extract`` 开启了缓存(见 :mod:`nlpir.cache`), 会一次取出所有类型的结果并释放handle,
+    之后从缓存的结果中读取.
+
+    If the cache is enabled for ``doc_extractor.extract`` , the results of all types are fetched at once
+    and the handle is released, the returned :class:`ExtractResult` reads from the cached results.
 
     :param text:
     :param user_define_pos:
     :return:
     """
+    if __get_cache__("doc_extractor.extract") is None:
+        handle = __instance__.pares_doc_e(text, "#".join(user_define_pos))
+        return ExtractResult(handle=handle, user_retrieve_type=user_define_pos)
+    raw_result = __cached_call__(
+        "doc_extractor.extract", __instance__, __extract_raw__, text, tuple(user_define_pos)
+    )
+    return ExtractResult(handle=None, user_retrieve_type=user_define_pos, raw_result=raw_result)
+
+
+def __extract_raw__(text: str, user_define_pos: typing.Tuple[str, ...]) -> dict:
+    """
+    Extract and fetch the results of all retrieve types, so the result can be cached
+
+    :return: ``raw_result`` of :class:`ExtractResult`
+    """
     handle = __instance__.pares_doc_e(text, "#".join(user_define_pos))
-    return ExtractResult(handle=handle, user_retrieve_type=user_define_pos)
+    try:
+        retrieve_types = [
+            retrieve_type for name, retrieve_type in ExtractResult.retrieve_type_map.items() if name != "user"
+        ]
+        retrieve_types += [ExtractResult.retrieve_type_map["user"] + i for i in range(len(user_define_pos))]
+        return {
+            "results": {
+                retrieve_type: __instance__.get_result(handle=handle, doc_extract_type=retrieve_type)
+                for retrieve_type in retrieve_types
+            },
+            "sentiment": __instance__.get_sentiment_score(handle),
+        }
+    finally:
+        __instance__.release_handle(handle)
 
 
 @__get_instance__
@@ -198,6 +250,18 @@ def import_dict(word_list: list) -> list:
     return nlpir.import_dict(word_list=word_list, instance=__instance__)
 
 
+@__get_instance__
+def import_dict_bulk(word_list: typing.Iterable[str], overwrite: bool = False) -> list:
+    """
+    See :func:`nlpir.import_dict_bulk`
+
+    :param word_list: words want to add, ``word`` or ``word pos``
+    :param overwrite: overwrite the current user dict or not
+    :return: the words fail to add
+    """
+    return nlpir.import_dict_bulk(word_list=word_list, instance=__instance__, overwrite=overwrite)
+
+
 @__get_instance__
 def clean_user_dict() -> bool:
     """
@@ -2,10 +2,20 @@
 """
 high-level toolbox for Chinese Word Segmentation
 """
+import array
+import collections
+import heapq
+import itertools
+import json
+import queue
 import re
+import threading
 import typing
 import nlpir
 from nlpir import get_instance as __get_instance__
+from nlpir.cache import cached_call as __cached_call__, get_cache as __get_cache__
+from nlpir.tokens import Tokens, get_pos_id as __get_pos_id__, get_pos_tags as __get_pos_tags__
+from nlpir.tokens import __pos_ids__, __pos_names__
 from nlpir import native
 
 # class and class instance
@@ -32,6 +42,20 @@ def get_native_instance() -> native.ictclas.ICTCLAS:
 
 
 match_tag = re.compile(r"(.+?)/([a-z0-9A-Z]+) ")
+# the end of a word/pos which always ends a match of match_tag, used to cut the string into chunks
+match_tag_end = re.compile(r"[^ \n]/[a-z0-9A-Z]+ ")
+#: Characters parsed at once by :func:`process_to_generator`
+GENERATOR_CHUNK_SIZE = 65536
+
+# an item of the result of word_freq_stat, "word/pos/freq#", the POS may be absent
+match_freq = re.compile(r"(.+?)(?:/([a-z0-9A-Z]+))?/([0-9]+)(?:#|$)")
+
+#: Characters read from the file at once by :func:`segment_file_iter`
+FILE_CHUNK_SIZE = 1024 * 1024
+#: Records longer than it are cut at the sentence boundaries by :func:`segment_file_iter`
+MAX_RECORD_CHARS = 100000
+#: Sentence boundaries used to cut the long records
+SENTENCE_ENDS = "。！？；!?;"
 
 
 def process_to_list(txt: str, pos_tag: bool) -> list:
@@ -88,13 +112,91 @@ def process_to_generator(text: str, pos_tag: bool) -> typing.Generator:
     :param pos_tag:
     :return:
     """
+    start = 0
     if pos_tag:
-        for i in match_tag.finditer(text):
-            yield i.groups()
+        # findall on chunks is faster than finditer, a chunk ends where a match of the whole string ends,
+        # so the result is the same as match_tag.findall(text)
+        while True:
+            end = match_tag_end.search(text, start + GENERATOR_CHUNK_SIZE)
+            if end is None:
+                yield from match_tag.findall(text, start)
+                return
+            yield from match_tag.findall(text, start, end.end())
+            start = end.end()
     else:
-        re_split = re.compile(r"[^ ]+")
-        for i in re_split.finditer(text):
-            yield i.group()
+        while True:
+            end = text.find(" ", start + GENERATOR_CHUNK_SIZE)
+            if end < 0:
+                yield from filter(None, text[start:].split(" "))
+                return
+            yield from filter(None, text[start:end].split(" "))
+            start = end + 1
+
+
+def process_to_tokens(text: str, pos_tag: bool) -> Tokens:
+    """
+    Same as :func:`process_to_list` , return a compact :class:`nlpir.tokens.Tokens` , which saves memory
+    when keeping a lot of results, empty words are dropped
+
+    :func:`nlpir.ictclas.segment` 的内置的处理函数, 非默认值. 结果为 :class:`nlpir.tokens.Tokens`, 所有的词保存在一个
+    字符串中, 每个词只占用约10字节, 适合在内存中保存大量的分词结果
+
+    :param text: Segmented string
+    :param pos_tag: The segmented string has POS tag or not
+    :return: the tokens
+    """
+    if pos_tag:
+        pairs = match_tag.findall(text)
+        return Tokens.from_words([word for word, _ in pairs], [pos for _, pos in pairs])
+    return Tokens.from_words([word for word in text.split(" ") if word])
+
+
+def process_to_pos_ids(text: str, pos_tag: bool) -> list:
+    """
+    Same as :func:`process_to_list` , but the POS tags are replaced by their ids, see :func:`nlpir.tokens.get_pos_id`
+
+    :func:`nlpir.ictclas.segment` 的内置的处理函数, 非默认值. 结果为 ``[(word, pos_id)]`` , 可以直接用于按词性过滤和统计,
+    不标注词性时与 :func:`process_to_list` 相同. 只有 :data:`nlpir.tokens.POS_TAGS` 中的词性编号在所有进程中相同,
+    其他词性(如用户词典的 ``user``)的编号在每个进程中分别分配, 在进程间传递结果前需要用
+    :func:`nlpir.tokens.get_pos_name` 转换为词性
+
+    :param text: Segmented string
+    :param pos_tag: The segmented string has POS tag or not
+    :return: list of ``(word, pos_id)``
+    """
+    if not pos_tag:
+        return text.split(" ")
+    ids = __pos_ids__
+    return [(word, ids[pos] if pos in ids else __get_pos_id__(pos)) for word, pos in match_tag.findall(text)]
+
+
+def process_to_interned(text: str, pos_tag: bool) -> list:
+    """
+    Same as :func:`process_to_list` , but the POS tags are interned strings shared by all results,
+    which saves memory when keeping a lot of results
+
+    :func:`nlpir.ictclas.segment` 的内置的处理函数, 非默认值. 结果中相同的词性为同一个字符串对象
+
+    :param text: Segmented string
+    :param pos_tag: The segmented string has POS tag or not
+    :return: list of ``(word, pos)``
+    """
+    if not pos_tag:
+        return text.split(" ")
+    ids, names = __pos_ids__, __pos_names__
+    return [
+        (word, names[ids[pos]] if pos in ids else names[__get_pos_id__(pos)]) for word, pos in match_tag.findall(text)
+    ]
+
+
+@__get_instance__
+def get_pos_tags() -> typing.Tuple[str, ...]:
+    """
+    当前使用的标注集中的所有词性, 标注集由 :func:`nlpir.native.ictclas.ICTCLAS.set_pos_map` 修改
+
+    :return: POS tags of the pos map in use, see :func:`nlpir.tokens.get_pos_tags`
+    """
+    return __get_pos_tags__(__instance__.pos_map)
 
 
 @__get_instance__
@@ -108,6 +210,18 @@ def import_dict(word_list: list) -> list:
     return nlpir.import_dict(word_list=word_list, instance=__instance__)
 
 
+@__get_instance__
+def import_dict_bulk(word_list: typing.Iterable[str], overwrite: bool = False) -> list:
+    """
+    See :func:`nlpir.import_dict_bulk`
+
+    :param word_list: words want to add, ``word`` or ``word pos``
+    :param overwrite: overwrite the current user dict or not
+    :return: the words fail to add
+    """
+    return nlpir.import_dict_bulk(word_list=word_list, instance=__instance__, overwrite=overwrite)
+
+
 @__get_instance__
 def clean_user_dict() -> bool:
     """
@@ -202,7 +316,171 @@ def segment(txt: str, pos_tagged: bool = False, post_process: callable = process
     :param pos_tagged: POS tagging or not
     :param post_process: The post process function, in order to get different result
     """
-    return post_process(__instance__.paragraph_process(txt, pos_tagged=1 if pos_tagged else 0), pos_tagged)
+    result = __cached_call__(
+        "ictclas.segment", __instance__, __instance__.paragraph_process, txt, 1 if pos_tagged else 0
+    )
+    return post_process(result, pos_tagged)
+
+
+def segment_batch(
+        texts: typing.Iterable[str],
+        pos_tagged: bool = False,
+        post_process: callable = process_to_list,
+        pool: typing.Optional["nlpir.pool.Pool"] = None,
+        chunksize: typing.Optional[int] = None
+) -> list:
+    """
+    批量分词, 结果与对每个文本调用 :func:`segment` 相同, 但只在开始时获取一次组件实例和原生函数,
+    省去每次调用时装饰器, 编码转换包装器等的开销, 适合大量的短文本.
+
+    传入 ``pool`` 时将文本分块交给 :class:`nlpir.pool.Pool` 的工作进程, 每个工作进程对一块文本调用本函数,
+    结果按照输入的顺序返回, 此时 ``post_process`` 需要可以被 :mod:`pickle` 序列化 (不能是lambda表达式)::
+
+        from nlpir.pool import Pool
+
+        words = ictclas.segment_batch(texts, pos_tagged=True)
+        with Pool([ictclas], processes=8) as pool:
+            words = ictclas.segment_batch(texts, pos_tagged=True, pool=pool)
+
+    :param texts: list or iterable of strings want to be segmented
+    :param pos_tagged: POS tagging or not
+    :param post_process: The post process function, same as :func:`segment`
+    :param pool: a :class:`nlpir.pool.Pool` initialized with :mod:`nlpir.ictclas` , None to segment in
+        current process
+    :param chunksize: number of texts sent to a worker at once, default is decided by the pool
+    :return: list of results of ``post_process`` , in the order of ``texts``
+    """
+    if pool is not None:
+        if not hasattr(texts, "__len__"):
+            texts = list(texts)
+        size = pool.get_chunksize(texts, chunksize)
+        it = iter(texts)
+        chunks = iter(lambda: list(itertools.islice(it, size)), [])
+        results = []
+        for chunk_result in pool.imap(
+                segment_batch, chunks, chunksize=1, pos_tagged=pos_tagged, post_process=post_process
+        ):
+            results.extend(chunk_result)
+        return results
+    return __segment_batch__(texts, pos_tagged, post_process)
+
+
+@__get_instance__
+def __segment_batch__(texts: typing.Iterable[str], pos_tagged: bool, post_process: callable) -> list:
+    """
+    :func:`segment_batch` in current process, the instance is only initialized here, so a process handing
+    the texts to a pool does not load the component
+    """
+    flag = 1 if pos_tagged else 0
+    if __get_cache__("ictclas.segment") is not None:
+        return [
+            post_process(
+                __cached_call__("ictclas.segment", __instance__, __instance__.paragraph_process, txt, flag),
+                pos_tagged
+            ) for txt in texts
+        ]
+    encode = __instance__.encode
+    process = __instance__.funcs["NLPIR_ParagraphProcess"]
+    return [
+        post_process(process(txt.encode(encode), flag).decode(encode, errors="ignore"), pos_tagged)
+        for txt in texts
+    ]
+
+
+# NumPy is installed or not, checked on the first call of __has_numpy__
+__numpy_installed__: typing.Optional[bool] = None
+
+
+def __has_numpy__() -> bool:
+    """
+    :return: NumPy is installed or not, without importing it
+    """
+    global __numpy_installed__
+    if __numpy_installed__ is None:
+        import importlib.util
+        __numpy_installed__ = importlib.util.find_spec("numpy") is not None
+    return __numpy_installed__
+
+
+def get_char_offsets(encoded: bytes, encoding: str, use_numpy: bool = False) -> typing.Sequence[int]:
+    """
+    Get a table to convert the byte offsets in the encoded text to the character offsets, the table is
+    computed at once for all offsets (with NumPy, vectorized), instead of decoding the text before every offset
+
+    :param encoded: the encoded text
+    :param encoding: encoding of the text
+    :param use_numpy: return a NumPy array, so offsets in a NumPy array can be converted by ``table[offsets]``
+    :return: ``table[byte offset]`` is the character offset, the length is ``len(encoded) + 1``
+    :raises UnicodeDecodeError: the text is not valid in the encoding
+    :raises ValueError: the encoding is stateful, the offsets can not be computed character by character
+    """
+    if encoding == "utf-8":
+        # every byte not like 0b10xxxxxx starts a character
+        if use_numpy:
+            import numpy
+            table = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+            numpy.cumsum((numpy.frombuffer(encoded, dtype=numpy.uint8) & 0xC0) != 0x80, out=table[1:])
+            return table
+        table = array.array("I", [0])
+        table.extend(itertools.accumulate((b & 0xC0) != 0x80 for b in encoded))
+        return table
+    # decode strictly, a dropped byte would shift all offsets after it
+    text = encoded.decode(encoding)
+    table = array.array("I")
+    for i, char in enumerate(text):
+        table.extend([i] * len(char.encode(encoding)))
+    table.append(len(text))
+    if len(table) != len(encoded) + 1:
+        raise ValueError(f"the characters of the text are not encoded one by one in {encoding}")
+    if use_numpy:
+        import numpy
+        return numpy.asarray(table, dtype=numpy.int64)
+    return table
+
+
+@__get_instance__
+def segment_with_offsets(
+        txt: str,
+        user_dict: bool = True,
+        use_numpy: typing.Optional[bool] = None
+) -> typing.List[typing.Tuple[str, str, int, int]]:
+    """
+    分词并返回每个词在原文中的位置, 基于 :func:`nlpir.native.ictclas.ICTCLAS.paragraph_process_a` ,
+    直接读取原生的 ``result_t`` 数组, 不需要解析分词结果的字符串. 原生接口返回的是字节偏移,
+    通过 :func:`get_char_offsets` 一次性转换为字符偏移, 安装了NumPy时转换是向量化的.
+
+    Example::
+
+        >>> ictclas.segment_with_offsets("法国启蒙思想家")
+        [('法国', 'nsf', 0, 2), ('启蒙', 'vn', 2, 4), ('思想家', 'n', 4, 7)]
+
+    :param txt: The string want to be segmented
+    :param user_dict: use user dictionary or not
+    :param use_numpy: read the result with NumPy, default is using NumPy if it is installed
+    :return: list of ``(word, pos, start, end)`` , ``txt[start:end] == word``
+    """
+    if use_numpy is None:
+        use_numpy = __has_numpy__()
+    encoding = __instance__.encode
+    encoded = txt.encode(encoding)
+    result, count = __instance__.paragraph_process_a(encoded, user_dict)
+    if count <= 0:
+        return []
+    table = get_char_offsets(encoded, encoding, use_numpy)
+    if use_numpy:
+        view = __instance__.result_numpy(result, count)
+        starts = table[view["start"]].tolist()
+        ends = table[view["start"] + view["length"]].tolist()
+        tags = view["sPOS"].tolist()
+    else:
+        view = __instance__.result_array(result, count)
+        starts = [table[item.start] for item in view]
+        ends = [table[item.start + item.length] for item in view]
+        tags = [item.sPOS for item in view]
+    return [
+        (txt[start:end], tag.decode(encoding, errors="ignore"), start, end)
+        for start, end, tag in zip(starts, ends, tags)
+    ]
 
 
 @__get_instance__
@@ -215,3 +493,422 @@ def file_segment(src_path: str, tgt_path: str, pos_tagged: bool = False) -> floa
     :return: time to process
     """
     return __instance__.file_process(source_filename=src_path, result_filename=tgt_path, pos_tagged=pos_tagged)
+
+
+def cut_record(record: str, max_chars: int = MAX_RECORD_CHARS) -> typing.List[str]:
+    """
+    Cut a record longer than ``max_chars`` after the last sentence boundary (:data:`SENTENCE_ENDS`)
+    in the limit, or at the limit if there is no boundary
+
+    :param record: a line of text
+    :param max_chars: max length of a piece
+    :return: pieces of the record, join them to get the record
+    """
+    pieces = []
+    while len(record) > max_chars:
+        end = max(record.rfind(c, 0, max_chars) for c in SENTENCE_ENDS) + 1
+        end = end if end > 0 else max_chars
+        pieces.append(record[:end])
+        record = record[end:]
+    pieces.append(record)
+    return pieces
+
+
+def read_records(
+        file: typing.TextIO,
+        chunk_size: int = FILE_CHUNK_SIZE,
+        max_chars: int = MAX_RECORD_CHARS
+) -> typing.Generator[typing.List[str], None, None]:
+    """
+    Read a text file in chunks and yield the lines (without the line break) of every chunk,
+    lines longer than ``max_chars`` are cut by :func:`cut_record` , so the memory used is bounded
+    by ``chunk_size`` and ``max_chars`` no matter how large the file is
+
+    :param file: a file opened in text mode
+    :param chunk_size: characters read at once
+    :param max_chars: max length of a record
+    :return: generator of lists of records
+    """
+    rest = ""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        lines = (rest + chunk).split("\n")
+        rest = lines.pop()
+        records = []
+        for line in lines:
+            records.extend(cut_record(line, max_chars))
+        if len(rest) > max_chars:
+            # a very long line, keep the last piece to join the next chunk
+            pieces = cut_record(rest, max_chars)
+            rest = pieces.pop()
+            records.extend(pieces)
+        if records:
+            yield records
+    if rest:
+        yield cut_record(rest, max_chars)
+
+
+@__get_instance__
+def segment_file_iter(
+        path: str,
+        pos_tagged: bool = False,
+        post_process: callable = process_to_list,
+        encoding: str = "utf-8",
+        chunk_size: int = FILE_CHUNK_SIZE,
+        max_chars: int = MAX_RECORD_CHARS,
+        queue_size: int = 4,
+        errors: str = "strict"
+) -> typing.Generator[typing.Any, None, None]:
+    """
+    逐行对一个文本文件进行分词, 返回一个生成器, 每一行(记录)产生一个分词结果. 与 :func:`file_segment` 不同,
+    文件按块读取, 结果在被使用时才计算, 内存占用与文件大小无关, 适合处理GB级别的语料. 文件在后台线程中读取,
+    读取与分词同时进行.
+
+    长度超过 ``max_chars`` 的行在句子边界处被切分为多条记录, 见 :func:`cut_record`.
+
+    Example::
+
+        for words in ictclas.segment_file_iter("corpus.txt", pos_tagged=True):
+            ...
+
+    :param path: path of the text file
+    :param pos_tagged: POS tagging or not
+    :param post_process: The post process function, same as :func:`segment`
+    :param encoding: encoding of the file
+    :param chunk_size: characters read at once
+    :param max_chars: max length of a record
+    :param queue_size: max chunks read ahead by the reader thread
+    :param errors: how to handle the bytes can not be decoded, same as :func:`open` , raise
+        :class:`UnicodeDecodeError` by default
+    :return: generator of results of ``post_process`` , in the order of the records in the file
+    """
+    chunks = queue.Queue(queue_size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def reader():
+        try:
+            with open(path, encoding=encoding, errors=errors) as f:
+                for records in read_records(f, chunk_size, max_chars):
+                    if not put(records):
+                        return
+        except BaseException as e:
+            put(e)
+        finally:
+            # always wake up the consumer
+            put(None)
+
+    thread = threading.Thread(target=reader, name="segment_file_iter", daemon=True)
+    thread.start()
+    try:
+        while True:
+            records = chunks.get()
+            if records is None:
+                break
+            if isinstance(records, BaseException):
+                raise records
+            yield from segment_batch(records, pos_tagged=pos_tagged, post_process=post_process)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def parse_word_freq(result: str, with_pos: bool = False) -> typing.Counter:
+    """
+    Parse the result of :func:`nlpir.native.ictclas.ICTCLAS.word_freq_stat` , like
+    ``张华平/nr/10#博士/n/9#分词/n/8``
+
+    :param result: result of ``word_freq_stat``
+    :param with_pos: count ``(word, pos)`` , or count words and add up the counts of different POS
+    :return: the counts
+    """
+    counter = collections.Counter()
+    if with_pos:
+        for word, pos, freq in match_freq.findall(result):
+            counter[(word, pos)] += int(freq)
+    else:
+        for word, _, freq in match_freq.findall(result):
+            counter[word] += int(freq)
+    return counter
+
+
+@__get_instance__
+def word_freq_counter(
+        texts: typing.Iterable[str],
+        stop_word_remove: bool = True,
+        with_pos: bool = False
+) -> typing.Counter:
+    """
+    The counts of words in the texts, used by :func:`word_freq` in the workers
+
+    :param texts: texts to count
+    :param stop_word_remove: remove the stop words or not
+    :param with_pos: count ``(word, pos)`` or words
+    :return: the counts of all texts
+    """
+    counter = collections.Counter()
+    for text in texts:
+        counter.update(parse_word_freq(__instance__.word_freq_stat(text, stop_word_remove), with_pos))
+    return counter
+
+
+class CountMinSketch:
+    """
+    Approximate counts in fixed memory, ``depth`` rows of ``width`` counters, an estimate is never less than
+    the real count, and more than it by at most ``e / width`` of the total count with probability
+    ``1 - exp(-depth)``
+
+    :param width: counters in a row
+    :param depth: number of rows
+    """
+
+    def __init__(self, width: int, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.rows = [array.array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def indexes(self, key) -> typing.Iterator[typing.Tuple[array.array, int]]:
+        # double hashing, the i-th index is h1 + i * h2
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i, row in enumerate(self.rows):
+            yield row, (h1 + i * h2) % self.width
+
+    def add(self, key, count: int = 1) -> int:
+        """
+        :return: the estimate of the key after adding
+        """
+        estimate = None
+        for row, index in self.indexes(key):
+            row[index] += count
+            estimate = row[index] if estimate is None else min(estimate, row[index])
+        return estimate
+
+    def estimate(self, key) -> int:
+        return min(row[index] for row, index in self.indexes(key))
+
+
+def word_freq(
+        corpus_iter: typing.Iterable[str],
+        workers: typing.Optional[int] = None,
+        top_k: typing.Optional[int] = None,
+        stop_word_remove: bool = True,
+        with_pos: bool = False,
+        pool: typing.Optional["nlpir.pool.Pool"] = None,
+        chunksize: int = 100,
+        sketch_width: typing.Optional[int] = None,
+        sketch_depth: int = 4
+) -> typing.List[typing.Tuple[typing.Any, int]]:
+    """
+    语料库词频统计, 对每个文本调用 :func:`nlpir.native.ictclas.ICTCLAS.word_freq_stat` 并合并结果.
+
+    文本按 ``chunksize`` 分块交给工作进程, 每个工作进程统计一块文本的词频(:func:`word_freq_counter`),
+    主进程依次合并各块的计数, 语料只被读取一次, 不需要全部放入内存::
+
+        top = ictclas.word_freq(open("corpus.txt", encoding="utf-8"), workers=8, top_k=100)
+
+    精确统计时主进程保存所有词的计数, 词的种类很多时可以使用 ``sketch_width`` , 所有词的计数保存在
+    :class:`CountMinSketch` 中, 只保留 ``2 * top_k`` 个候选词, 返回的计数为估计值(不小于实际值).
+
+    :param corpus_iter: iterable of texts, like a file object
+    :param workers: number of workers of a new :class:`nlpir.pool.Pool` , None or 0 to count in current process
+    :param top_k: return the most common ``top_k`` words, None to return all
+    :param stop_word_remove: remove the stop words or not
+    :param with_pos: count ``(word, pos)`` or words
+    :param pool: a :class:`nlpir.pool.Pool` initialized with :mod:`nlpir.ictclas` , used instead of ``workers``
+    :param chunksize: number of texts counted by a worker at once
+    :param sketch_width: width of the count-min sketch, None for exact counts, ``top_k`` is required if it is given
+    :param sketch_depth: depth of the count-min sketch
+    :return: ``[(word, count)]`` in the descending order of the counts, the word is ``(word, pos)`` if ``with_pos``
+    """
+    if sketch_width is not None and top_k is None:
+        raise ValueError("top_k is required when using the count-min sketch")
+    it = iter(corpus_iter)
+    chunks = iter(lambda: list(itertools.islice(it, chunksize)), [])
+    if pool is None and workers:
+        from nlpir.pool import Pool
+        with Pool([__name__], processes=workers) as new_pool:
+            return word_freq(
+                it, top_k=top_k, stop_word_remove=stop_word_remove, with_pos=with_pos,
+                pool=new_pool, chunksize=chunksize, sketch_width=sketch_width, sketch_depth=sketch_depth
+            )
+    if pool is not None:
+        counters = pool.imap(
+            word_freq_counter, chunks, chunksize=1, stop_word_remove=stop_word_remove, with_pos=with_pos
+        )
+    else:
+        counters = (word_freq_counter(chunk, stop_word_remove, with_pos) for chunk in chunks)
+
+    if sketch_width is None:
+        total = collections.Counter()
+        for counter in counters:
+            total.update(counter)
+        if top_k is None:
+            return total.most_common()
+        return heapq.nlargest(top_k, total.items(), key=lambda item: item[1])
+
+    sketch = CountMinSketch(sketch_width, sketch_depth)
+    capacity = 2 * top_k
+    # candidates of the most common words: estimate, and a min heap of (estimate, word) which may be outdated
+    candidates: typing.Dict[typing.Any, int] = dict()
+    heap: typing.List[typing.Tuple[int, typing.Any]] = []
+    for counter in counters:
+        for word, count in counter.items():
+            estimate = sketch.add(word, count)
+            if word in candidates:
+                candidates[word] = estimate
+                continue
+            if len(candidates) >= capacity:
+                # drop the outdated heap items, the top is the real minimum after it
+                while heap[0][0] != candidates[heap[0][1]]:
+                    least, least_word = heapq.heappop(heap)
+                    heapq.heappush(heap, (candidates[least_word], least_word))
+                if estimate <= heap[0][0]:
+                    continue
+                del candidates[heapq.heappop(heap)[1]]
+            candidates[word] = estimate
+            heapq.heappush(heap, (estimate, word))
+    return heapq.nlargest(top_k, candidates.items(), key=lambda item: item[1])
+
+
+class Postings(typing.NamedTuple):
+    """
+    Tokens of a batch of documents given by :func:`tokenize_for_ir_batch` , in flat arrays ready for an indexer.
+    The tokens of the i-th document are ``[offsets[i], offsets[i + 1])`` of the arrays.
+    """
+    #: term of every term id
+    terms: typing.List[str]
+    #: POS tag of every POS id
+    pos: typing.List[str]
+    #: ``array('I')`` , term id of every token
+    term_ids: array.array
+    #: ``array('H')`` , POS id of every token
+    pos_ids: array.array
+    #: ``array('I')`` , begin offset of every token in its document
+    begins: array.array
+    #: ``array('I')`` , end offset of every token in its document
+    ends: array.array
+    #: ``array('Q')`` , start of the tokens of every document, and the number of all tokens at the end
+    offsets: array.array
+
+    @property
+    def document_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def document(self, index: int) -> typing.List[typing.Tuple[str, int, int, str]]:
+        """
+        :param index: index of the document
+        :return: ``[(text, begin, end, pos)]`` of the tokens of the document, same as the result of
+            :func:`nlpir.native.ictclas.ICTCLAS.tokenizer_for_ir`
+        """
+        start, end = self.offsets[index], self.offsets[index + 1]
+        terms, pos = self.terms, self.pos
+        return [
+            (terms[term_id], begin, end, pos[pos_id]) for term_id, pos_id, begin, end in zip(
+                self.term_ids[start:end], self.pos_ids[start:end], self.begins[start:end], self.ends[start:end]
+            )
+        ]
+
+
+@__get_instance__
+def tokenize_for_ir_chunk(
+        texts: typing.Iterable[str],
+        fine: bool = False,
+        vocab: typing.Optional[typing.Dict[str, int]] = None
+) -> Postings:
+    """
+    Tokenize the texts by :func:`nlpir.native.ictclas.ICTCLAS.tokenizer_for_ir` in current process,
+    used by :func:`tokenize_for_ir_batch`
+
+    :param texts: texts to tokenize
+    :param fine: finer segment or not
+    :param vocab: ``{term: term id}`` , new terms are added to it, the ids must be ``0, 1, 2 ...`` in the order of
+        insertion, None to use a new one
+    :return: the tokens
+    """
+    encode = __instance__.encode
+    tokenize = __instance__.funcs["NLPIR_Tokenizer4IR"]
+    vocab = dict() if vocab is None else vocab
+    pos_vocab = dict()
+    add_term, add_pos = vocab.setdefault, pos_vocab.setdefault
+    term_ids, pos_ids = array.array("I"), array.array("H")
+    begins, ends, offsets = array.array("I"), array.array("I"), array.array("Q", [0])
+    for text in texts:
+        result = tokenize(text.encode(encode), fine)
+        # json.loads is faster than any parser written in Python for this JSON
+        for token in json.loads(result.decode(encode, errors="ignore")) if result and result.strip() else ():
+            term_ids.append(add_term(token["text"], len(vocab)))
+            pos_ids.append(add_pos(token["pos"], len(pos_vocab)))
+            begins.append(token["begin"])
+            ends.append(token["end"])
+        offsets.append(len(term_ids))
+    return Postings(list(vocab), list(pos_vocab), term_ids, pos_ids, begins, ends, offsets)
+
+
+def tokenize_for_ir_batch(
+        texts: typing.Iterable[str],
+        fine: bool = False,
+        workers: typing.Optional[int] = None,
+        pool: typing.Optional["nlpir.pool.Pool"] = None,
+        chunksize: int = 100,
+        vocab: typing.Optional[typing.Dict[str, int]] = None
+) -> Postings:
+    """
+    搜索引擎模式批量分词, 对每个文本调用 :func:`nlpir.native.ictclas.ICTCLAS.tokenizer_for_ir` ,
+    结果不是每个词一个 dict, 而是保存在几个数组中(见 :class:`Postings`), 词用编号表示, 可以直接用于建立索引::
+
+        postings = ictclas.tokenize_for_ir_batch(texts, workers=8)
+        for i in range(postings.document_count):
+            start, end = postings.offsets[i], postings.offsets[i + 1]
+            for term_id, begin in zip(postings.term_ids[start:end], postings.begins[start:end]):
+                ...
+
+    与逐个文本调用 ``json.loads`` 相比, Python 端的处理慢约 40%, 保存结果的内存约为其 1/7 到 1/20,
+    见 ``benchmarks/tokenize_for_ir.py`` .
+
+    传入 ``workers`` 或 ``pool`` 时文本按 ``chunksize`` 分块在工作进程中处理, 主进程将各块的词编号映射到统一的编号.
+    多次调用之间传入同一个 ``vocab`` 可以使词的编号保持一致.
+
+    :param texts: iterable of texts
+    :param fine: finer segment or not
+    :param workers: number of workers of a new :class:`nlpir.pool.Pool` , None or 0 to tokenize in current process
+    :param pool: a :class:`nlpir.pool.Pool` initialized with :mod:`nlpir.ictclas` , used instead of ``workers``
+    :param chunksize: number of texts tokenized by a worker at once
+    :param vocab: ``{term: term id}`` shared by the calls, see :func:`tokenize_for_ir_chunk`
+    :return: the tokens of all texts, in the order of ``texts``
+    """
+    if pool is None and workers:
+        from nlpir.pool import Pool
+        with Pool([__name__], processes=workers) as new_pool:
+            return tokenize_for_ir_batch(texts, fine=fine, pool=new_pool, chunksize=chunksize, vocab=vocab)
+    if pool is None:
+        return tokenize_for_ir_chunk(texts, fine, vocab)
+
+    it = iter(texts)
+    chunks = iter(lambda: list(itertools.islice(it, chunksize)), [])
+    vocab = dict() if vocab is None else vocab
+    pos_vocab = dict()
+    add_term, add_pos = vocab.setdefault, pos_vocab.setdefault
+    term_ids, pos_ids = array.array("I"), array.array("H")
+    begins, ends, offsets = array.array("I"), array.array("I"), array.array("Q", [0])
+    for part in pool.imap(tokenize_for_ir_chunk, chunks, chunksize=1, fine=fine):
+        # map the ids of the chunk to the ids of the batch
+        term_map = [add_term(term, len(vocab)) for term in part.terms]
+        pos_map = [add_pos(pos, len(pos_vocab)) for pos in part.pos]
+        term_ids.extend([term_map[term_id] for term_id in part.term_ids])
+        pos_ids.extend([pos_map[pos_id] for pos_id in part.pos_ids])
+        begins.extend(part.begins)
+        ends.extend(part.ends)
+        base = offsets[-1]
+        offsets.extend([base + offset for offset in part.offsets[1:]])
+    return Postings(list(vocab), list(pos_vocab), term_ids, pos_ids, begins, ends, offsets)
@@ -5,6 +5,7 @@ high-level toolbox for Chinese Key-word Extraction
 # pylint: disable=duplicate-code
 
 from nlpir import get_instance as __get_instance__
+from nlpir.cache import cached_call as __cached_call__
 from nlpir import native
 import typing
 import nlpir
@@ -44,6 +45,18 @@ def import_dict(word_list: list) -> list:
     return nlpir.import_dict(word_list=word_list, instance=__instance__)
 
 
+@__get_instance__
+def import_dict_bulk(word_list: typing.Iterable[str], overwrite: bool = False) -> list:
+    """
+    See :func:`nlpir.import_dict_bulk`
+
+    :param word_list: words want to add, ``word`` or ``word pos``
+    :param overwrite: overwrite the current user dict or not
+    :return: the words fail to add
+    """
+    return nlpir.import_dict_bulk(word_list=word_list, instance=__instance__, overwrite=overwrite)
+
+
 @__get_instance__
 def clean_user_dict() -> bool:
     """
@@ -157,7 +170,9 @@ def get_key_words(text: str, max_key: int = 50) -> typing.List[dict]:
 
 
     """
-    result = __instance__.get_keywords(line=text, max_key_limit=max_key, format_opt=native.OUTPUT_FORMAT_JSON)
+    result = __cached_call__(
+        "key_extract.get_key_words", __instance__, __instance__.get_keywords, text, max_key, native.OUTPUT_FORMAT_JSON
+    )
     try:
         result = json.loads(result)
         if result is not None:
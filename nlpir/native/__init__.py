@@ -1,15 +1,10 @@
-from .ictclas import ICTCLAS
-from .new_word_finder import NewWordFinder
-from .key_extract import KeyExtract
-from .classifier import Classifier
-from .sentiment import SentimentAnalysis, SentimentNew
-from .summary import Summary
-from .deep_classifier import DeepClassifier
-from .doc_extractor import DocExtractor
-from .key_scanner import KeyScanner
-from .cluster import Cluster
-from .eye_checker import EyeChecker
-from .text_similarity import TextSimilarity
+"""
+Native components, the component classes and their modules are imported on first attribute access,
+e.g. ``nlpir.native.ICTCLAS`` or ``nlpir.native.ictclas`` , so a process only loads the components it uses.
+On Python < 3.7, which does not support module ``__getattr__`` , all of them are imported at once.
+"""
+import importlib
+import sys
 from .nlpir_base import UNKNOWN_CODE, GBK_CODE, UTF8_CODE, BIG5_CODE, GBK_FANTI_CODE, UTF8_FANTI_CODE
 from .nlpir_base import OUTPUT_FORMAT_SHARP, OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_EXCEL
 
@@ -37,3 +32,44 @@ __all__ = (
     'OUTPUT_FORMAT_JSON',
     'OUTPUT_FORMAT_EXCEL'
 )
+
+#: component class: module which defines it
+__lazy_classes__ = {
+    'ICTCLAS': 'ictclas',
+    'NewWordFinder': 'new_word_finder',
+    'KeyExtract': 'key_extract',
+    'Classifier': 'classifier',
+    'SentimentAnalysis': 'sentiment',
+    'SentimentNew': 'sentiment',
+    'Summary': 'summary',
+    'DeepClassifier': 'deep_classifier',
+    'DocExtractor': 'doc_extractor',
+    'KeyScanner': 'key_scanner',
+    'Cluster': 'cluster',
+    'EyeChecker': 'eye_checker',
+    'TextSimilarity': 'text_similarity',
+}
+
+#: submodules can be accessed as attributes of this package
+__lazy_modules__ = frozenset(__lazy_classes__.values()) | {'instrumentation', 'slow_call'}
+
+
+def __getattr__(name: str):
+    if name in __lazy_classes__:
+        value = getattr(importlib.import_module('.' + __lazy_classes__[name], __name__), name)
+    elif name in __lazy_modules__:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__lazy_classes__) | __lazy_modules__)
+
+
+if sys.version_info < (3, 7):
+    for _name in __lazy_classes__:
+        __getattr__(_name)
+    del _name
@@ -14,6 +14,18 @@ class StDoc(Structure):
 
 
 class Classifier(NLPIRBase):
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "classifier_init": ([c_char_p, c_char_p, c_int, c_char_p], c_bool),
+        "classifier_exit": ([], None),
+        "classifier_GetLastErrorMsg": ([], c_char_p),
+        "classifier_exec1": ([POINTER(StDoc), c_int], c_char_p),
+        "classifier_exec": ([c_char_p, c_char_p, c_int], c_char_p),
+        "classifier_execFile": ([c_char_p, c_int], c_char_p),
+        "classifier_detail": ([c_char_p], c_char_p),
+        "classifier_setsimthresh": ([c_float], c_int),
+    }
+
     @property
     def dll_name(self):
         return "LJClassifier"
@@ -28,8 +40,8 @@ class Classifier(NLPIRBase):
         :param license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func("classifier_init", [c_char_p, c_char_p, c_int, c_char_p], c_bool)(
-            "rulelist.xml", data_path, encode, license_code)
+        return self.funcs["classifier_init"](
+            b"rulelist.xml", data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -38,11 +50,11 @@ class Classifier(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func("classifier_exit", None, None)()
+        return self.funcs["classifier_exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
-        return self.get_func("classifier_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["classifier_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def exec_1(self, data: StDoc, out_type: int = 0):
@@ -56,7 +68,7 @@ class Classifier(NLPIRBase):
         :return:  主题类别串  各类之间用\t隔开，类名按照置信度从高到低排序
             举例：“要闻	敏感	诉讼”, “要闻 1.00	敏感 0.95	诉讼 0.82”
         """
-        return self.get_func("classifier_exec1", [POINTER(StDoc), c_int], c_char_p)(data, out_type)
+        return self.funcs["classifier_exec1"](data, out_type)
 
     @NLPIRBase.byte_str_transform
     def exec(self, title: str, content: str, out_type: int):
@@ -70,7 +82,21 @@ class Classifier(NLPIRBase):
         :param out_type: 输出知否包括置信度,同 :func:`exec_1`
         :return: 同 :func:`exec_1`
         """
-        return self.get_func("classifier_exec", [c_char_p, c_char_p, c_int], c_char_p)(title, content, out_type)
+        return self.funcs["classifier_exec"](title, content, out_type)
+
+    @NLPIRBase.byte_buffer_transform
+    def exec_bytes(self, title: bytes, content: bytes, out_type: int) -> bytes:
+        """
+        Call **classifier_exec**
+
+        Same as :func:`exec`, take and return bytes without transcoding
+
+        :param title: 编码后的文章标题
+        :param content: 编码后的文章内容
+        :param out_type: 输出知否包括置信度,同 :func:`exec_1`
+        :return: 同 :func:`exec_1`
+        """
+        return self.funcs["classifier_exec"](title, content, out_type)
 
     @NLPIRBase.byte_str_transform
     def exec_file(self, filename: str, out_type: int) -> str:
@@ -82,7 +108,7 @@ class Classifier(NLPIRBase):
         :return: 主题类别串  各类之间用\t隔开，类名按照置信度从高到低排序
             举例：“要闻	敏感	诉讼”, “要闻 1.00	敏感 0.95	诉讼 0.82”
         """
-        return self.get_func("classifier_execFile", [c_char_p, c_int], c_char_p)(filename, out_type)
+        return self.funcs["classifier_execFile"](filename, out_type)
 
     @NLPIRBase.byte_str_transform
     def detail(self, class_name: str):
@@ -101,7 +127,7 @@ class Classifier(NLPIRBase):
             SUBRULE2: 股市 1	基金 3	股票 8
             SUBRULE3: 书摘 2
         """
-        return self.get_func("classifier_detail", [c_char_p], c_char_p)(class_name)
+        return self.funcs["classifier_detail"](class_name)
 
     @NLPIRBase.byte_str_transform
     def set_sim_thresh(self, sim: float):
@@ -113,4 +139,4 @@ class Classifier(NLPIRBase):
         :param sim: 阈值
         :return:
         """
-        return self.get_func("classifier_setsimthresh", [c_float])(sim)
+        return self.funcs["classifier_setsimthresh"](sim)
@@ -7,6 +7,19 @@ import typing
 class Cluster(NLPIRBase):
     load_mode = NLPIRBase.RTLD_LAZY
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "CLUS_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "CLUS_Exit": ([], None),
+        "CLUS_GetLastErrorMsg": ([], c_char_p),
+        "CLUS_SetParameter": ([c_int, c_int], c_bool),
+        "CLUS_AddContent": ([c_char_p, c_char_p], c_bool),
+        "CLUS_AddFile": ([c_char_p], c_bool),
+        "CLUS_GetLatestResult": ([c_char_p, c_char_p], c_bool),
+        "CLUS_GetLatestResultE": ([c_char_p], c_char_p),
+        "CLUS_CleanData": ([], None),
+    }
+
     @property
     def dll_name(self):
         return "LJCluster"
@@ -21,7 +34,7 @@ class Cluster(NLPIRBase):
         :param license_code:
         :return: 1 success Other fail
         """
-        return self.get_func("CLUS_Init", [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["CLUS_Init"](data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -30,7 +43,7 @@ class Cluster(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func("CLUS_Exit", None, None)()
+        return self.funcs["CLUS_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -39,7 +52,7 @@ class Cluster(NLPIRBase):
 
         :return:
         """
-        return self.get_func("CLUS_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["CLUS_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def set_parameter(self, max_clus: int, max_doc: int) -> bool:
@@ -52,7 +65,7 @@ class Cluster(NLPIRBase):
         :param max_doc: 最大文档数
         :return: 是否成功
         """
-        return self.get_func("CLUS_SetParameter", [c_int, c_int], c_bool)(max_clus, max_doc)
+        return self.funcs["CLUS_SetParameter"](max_clus, max_doc)
 
     @NLPIRBase.byte_str_transform
     def add_content(self, text: str, signature: str) -> bool:
@@ -65,7 +78,20 @@ class Cluster(NLPIRBase):
         :param signature: 唯一标识
         :return: 是否成功
         """
-        return self.get_func("CLUS_AddContent", [c_char_p, c_char_p], c_bool)(text, signature)
+        return self.funcs["CLUS_AddContent"](text, signature)
+
+    @NLPIRBase.byte_buffer_transform
+    def add_content_bytes(self, text: bytes, signature: bytes) -> bool:
+        """
+        Call **CLUS_AddContent**
+
+        Same as :func:`add_content`, take bytes without transcoding
+
+        :param text: encoded text
+        :param signature: encoded signature
+        :return:
+        """
+        return self.funcs["CLUS_AddContent"](text, signature)
 
     @NLPIRBase.byte_str_transform
     def add_file(self, filename: str):
@@ -77,7 +103,7 @@ class Cluster(NLPIRBase):
         :param filename: 正文文件
         :return: 是否成功
         """
-        return self.get_func("CLUS_AddFile", [c_char_p], c_bool)(filename)
+        return self.funcs["CLUS_AddFile"](filename)
 
     @NLPIRBase.byte_str_transform
     def get_latest_result(
@@ -123,7 +149,7 @@ class Cluster(NLPIRBase):
         :param result_path: 输出路径, 按照聚类结果作为不同子目录存储
         :return: 是否成功
         """
-        status = self.get_func("CLUS_GetLatestResult", [c_char_p, c_char_p], c_bool)(xml_filename, result_path)
+        status = self.funcs["CLUS_GetLatestResult"](xml_filename, result_path)
         return status
 
     @NLPIRBase.byte_str_transform
@@ -136,7 +162,7 @@ class Cluster(NLPIRBase):
         :param result_path:
         :return: xml like :func:`get_latest_result`
         """
-        return self.get_func("CLUS_GetLatestResultE", [c_char_p], c_char_p)(result_path)
+        return self.funcs["CLUS_GetLatestResultE"](result_path)
 
     @NLPIRBase.byte_str_transform
     def clean_data(self) -> None:
@@ -147,4 +173,4 @@ class Cluster(NLPIRBase):
 
         :return:
         """
-        return self.get_func("CLUS_CleanData", None, None)()
+        return self.funcs["CLUS_CleanData"]()
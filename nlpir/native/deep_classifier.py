@@ -1,6 +1,6 @@
 # coding=utf-8
 from nlpir.native.nlpir_base import NLPIRBase
-from ctypes import c_bool, c_char_p, c_int, POINTER
+from ctypes import c_bool, c_char_p, c_int, c_void_p, POINTER
 
 
 class DeepClassifier(NLPIRBase):
@@ -9,6 +9,24 @@ class DeepClassifier(NLPIRBase):
     """
     FEATURE_COUNT = 800
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "DeepClassifier_Init": ([c_char_p, c_int, c_int, c_char_p], c_int),
+        "DeepClassifier_Exit": ([], c_int),
+        "DeepClassifier_GetLastErrorMsg": ([], c_char_p),
+        "DeepClassifier_NewInstance": ([c_int], POINTER(c_int)),
+        "DeepClassifier_DeleteInstance": ([c_void_p], c_int),
+        "DeepClassifier_AddTrain": ([c_char_p, c_char_p, c_void_p], c_bool),
+        "DeepClassifier_AddTrainFile": ([c_char_p, c_char_p, c_void_p], c_int),
+        "DeepClassifier_Train": ([c_void_p], c_int),
+        "DeepClassifier_LoadTrainResult": ([c_void_p], c_int),
+        "DeepClassifier_ExportFeatures": ([c_char_p, c_void_p], c_int),
+        "DeepClassifier_Classify": ([c_char_p, c_void_p], c_char_p),
+        "DeepClassifier_ClassifyEx": ([c_char_p, c_void_p], c_char_p),
+        "DeepClassifier_ClassifyFile": ([c_char_p, c_void_p], c_char_p),
+        "DeepClassifier_ClassifyExFile": ([c_char_p, c_void_p], c_char_p),
+    }
+
     @property
     def dll_name(self):
         return "DeepClassifier"
@@ -25,7 +43,7 @@ class DeepClassifier(NLPIRBase):
         :param license_code:
         :return:
         """
-        return self.get_func("DeepClassifier_Init", [c_char_p, c_int, c_int, c_int, c_char_p], c_int)(
+        return self.funcs["DeepClassifier_Init"](
             data_path,
             encode,
             self.FEATURE_COUNT,
@@ -39,7 +57,7 @@ class DeepClassifier(NLPIRBase):
 
         :return:
         """
-        return self.get_func("DeepClassifier_Exit", None, c_int)()
+        return self.funcs["DeepClassifier_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -48,7 +66,7 @@ class DeepClassifier(NLPIRBase):
 
         :return:
         """
-        return self.get_func("DeepClassifier_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["DeepClassifier_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def new_instance(self, feature_count: int) -> int:
@@ -62,7 +80,7 @@ class DeepClassifier(NLPIRBase):
         :param feature_count: Feature count
         :return: DeepClassifier Handle if success; otherwise return -1;
         """
-        return self.get_func("DeepClassifier_NewInstance", [c_int], POINTER(c_int))(feature_count)
+        return self.funcs["DeepClassifier_NewInstance"](feature_count)
 
     @NLPIRBase.byte_str_transform
     def delete_instance(self, instance: int) -> int:
@@ -75,7 +93,7 @@ class DeepClassifier(NLPIRBase):
         :param instance: DeepClassifier Handle
         :return:
         """
-        return self.get_func("DeepClassifier_DeleteInstance", [POINTER(c_int)], c_int)(instance)
+        return self.funcs["DeepClassifier_DeleteInstance"](instance)
 
     @NLPIRBase.byte_str_transform
     def add_train(self, classname: str, text: str, handler: int = 0) -> bool:
@@ -89,11 +107,7 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: add success or not
         """
-        return self.get_func(
-            "DeepClassifier_AddTrain",
-            [c_char_p, c_char_p, POINTER(c_int)],
-            c_bool
-        )(classname, text, handler)
+        return self.funcs["DeepClassifier_AddTrain"](classname, text, handler)
 
     @NLPIRBase.byte_str_transform
     def add_train_file(self, classname: str, filename: str, handler: int = 0) -> int:
@@ -107,7 +121,7 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: success or fail
         """
-        return self.get_func("DeepClassifier_AddTrainFile", [c_char_p, c_char_p, POINTER(c_int)], c_int)(
+        return self.funcs["DeepClassifier_AddTrainFile"](
             classname, filename, handler)
 
     @NLPIRBase.byte_str_transform
@@ -122,7 +136,7 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: success or not
         """
-        return self.get_func("DeepClassifier_Train", [POINTER(c_int)], c_int)(handler)
+        return self.funcs["DeepClassifier_Train"](handler)
 
     @NLPIRBase.byte_str_transform
     def load_train_result(self, handler: int = 0) -> int:
@@ -134,7 +148,7 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: success or not
         """
-        return self.get_func("DeepClassifier_LoadTrainResult", None, c_int)(handler)
+        return self.funcs["DeepClassifier_LoadTrainResult"](handler)
 
     @NLPIRBase.byte_str_transform
     def export_features(self, filename: str, handler: int = 0) -> int:
@@ -147,7 +161,7 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: success or not
         """
-        return self.get_func("DeepClassifier_ExportFeatures", None, c_int)(filename, handler)
+        return self.funcs["DeepClassifier_ExportFeatures"](filename, handler)
 
     @NLPIRBase.byte_str_transform
     def classify(self, text: str, handler: int = 0) -> str:
@@ -160,7 +174,20 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: classify result , a class name
         """
-        return self.get_func("DeepClassifier_Classify", [c_char_p, POINTER(c_int)], c_char_p)(text, handler)
+        return self.funcs["DeepClassifier_Classify"](text, handler)
+
+    @NLPIRBase.byte_buffer_transform
+    def classify_bytes(self, text: bytes, handler: int = 0) -> bytes:
+        """
+        Call **DeepClassifier_Classify**
+
+        Same as :func:`classify`, take and return bytes without transcoding
+
+        :param text: encoded text
+        :param handler: classifier handler
+        :return: classify result , a class name
+        """
+        return self.funcs["DeepClassifier_Classify"](text, handler)
 
     @NLPIRBase.byte_str_transform
     def classify_ex(self, text: str, handler: POINTER(c_int) = 0):
@@ -175,7 +202,7 @@ class DeepClassifier(NLPIRBase):
         :return: result with weight, For instance: ``政治/1.20##经济/1.10,``
             ``bookyzjs/7.00##bookxkfl/6.00##booktslx/5.00##bookny-xyfl/4.00##``
         """
-        return self.get_func("DeepClassifier_ClassifyEx", [c_char_p, POINTER(c_int)], c_char_p)(text, handler)
+        return self.funcs["DeepClassifier_ClassifyEx"](text, handler)
 
     @NLPIRBase.byte_str_transform
     def classify_file(self, filename: str, handler: int = 0):
@@ -188,7 +215,7 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: result same as :func:`classify`
         """
-        return self.get_func("DeepClassifier_ClassifyFile", [c_char_p, POINTER(c_int)], c_char_p)(filename, handler)
+        return self.funcs["DeepClassifier_ClassifyFile"](filename, handler)
 
     @NLPIRBase.byte_str_transform
     def classify_file_ex(self, filename: str, handler: int = 0):
@@ -201,4 +228,4 @@ class DeepClassifier(NLPIRBase):
         :param handler: classifier handler
         :return: result same as :func:`classify_ex`
         """
-        return self.get_func("DeepClassifier_ClassifyExFile", [filename, handler], c_char_p)(filename, handler)
+        return self.funcs["DeepClassifier_ClassifyExFile"](filename, handler)
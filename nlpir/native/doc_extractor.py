@@ -44,6 +44,25 @@ class DocExtractor(NLPIRBase):
     DOC_EXTRACT_DELIMITER = "#"  #: 分隔符
     DOC_EXTRACT_TYPE_MAX_LENGTH = 600  # 最大长度
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "DE_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "DE_Exit": ([], c_bool),
+        "DE_GetLastErrorMsg": ([], c_char_p),
+        "DE_ParseDocE": ([c_char_p, c_char_p, c_bool, c_uint], c_size_t),
+        "DE_ReleaseHandle": ([c_size_t], None),
+        "DE_GetResult": ([c_size_t, c_int], c_char_p),
+        "DE_GetSentimentScore": ([c_size_t], c_int),
+        "DE_ComputeSentimentDoc": ([c_char_p], c_int),
+        "DE_ImportSentimentDict": ([c_char_p], c_int),
+        "DE_ImportUserDict": ([c_char_p, c_bool], c_uint),
+        "DE_AddUserWord": ([c_char_p], c_int),
+        "DE_CleanUserWord": ([], c_int),
+        "DE_SaveTheUsrDic": ([], c_int),
+        "DE_DelUsrWord": ([c_char_p], c_int),
+        "DE_ImportKeyBlackList": ([c_char_p, c_char_p], c_uint),
+    }
+
     @property
     def dll_name(self) -> str:
         return "DocExtractor"
@@ -58,7 +77,7 @@ class DocExtractor(NLPIRBase):
         :param str license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func('DE_Init', [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["DE_Init"](data_path, encode, license_code)
 
     def exit_lib(self) -> bool:
         """
@@ -66,7 +85,7 @@ class DocExtractor(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func('DE_Exit', restype=c_bool)()
+        return self.funcs["DE_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -75,7 +94,7 @@ class DocExtractor(NLPIRBase):
 
         :return: error message
         """
-        return self.get_func("DE_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["DE_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def pares_doc_e(
@@ -96,10 +115,30 @@ class DocExtractor(NLPIRBase):
         :param func_required:
         :return: 用于获取内容的handle, 获取内容完毕后应使用 :func:`release_handle` 释放对应资源
         """
-        return self.get_func("DE_ParseDocE", [c_char_p, c_char_p, c_bool, c_uint], c_size_t)(
+        return self.funcs["DE_ParseDocE"](
             text, user_def_pos, summary_needed, func_required
         )
 
+    @NLPIRBase.byte_buffer_transform
+    def pares_doc_e_bytes(
+            self, text: bytes,
+            user_def_pos: bytes,
+            summary_needed: bool = True,
+            func_required: int = ALL_REQUIRED
+    ) -> int:
+        """
+        Call **DE_ParseDocE**
+
+        Same as :func:`pares_doc_e`, take bytes without transcoding
+
+        :param text: 编码后的文档内容
+        :param user_def_pos: 编码后的用户自定义的词性标记, see :func:`pares_doc_e`
+        :param summary_needed: 是否需要计算摘要
+        :param func_required:
+        :return: 用于获取内容的handle, 获取内容完毕后应使用 :func:`release_handle` 释放对应资源
+        """
+        return self.funcs["DE_ParseDocE"](text, user_def_pos, summary_needed, func_required)
+
     @NLPIRBase.byte_str_transform
     def release_handle(self, handle: int) -> None:
         """
@@ -110,7 +149,7 @@ class DocExtractor(NLPIRBase):
         :param handle: :func:`parse_doc_e` 执行后返回的HANDLE
         :return:
         """
-        return self.get_func("DE_ReleaseHandle", [c_size_t], None)(handle)
+        return self.funcs["DE_ReleaseHandle"](handle)
 
     @NLPIRBase.byte_str_transform
     def get_result(self, handle: int, doc_extract_type: int) -> str:
@@ -123,7 +162,20 @@ class DocExtractor(NLPIRBase):
         :param doc_extract_type: 获取的抽取类型，从DOC_EXTRACT_TYPE_PERSON开始的结果
         :return:
         """
-        return self.get_func("DE_GetResult", [c_size_t, c_int], c_char_p)(handle, doc_extract_type)
+        return self.funcs["DE_GetResult"](handle, doc_extract_type)
+
+    @NLPIRBase.byte_buffer_transform
+    def get_result_bytes(self, handle: int, doc_extract_type: int) -> bytes:
+        """
+        Call **DE_GetResult**
+
+        Same as :func:`get_result`, return bytes without transcoding
+
+        :param handle: :func:`parse_doc_e` 执行后返回的HANDLE
+        :param doc_extract_type: 获取的抽取类型，从DOC_EXTRACT_TYPE_PERSON开始的结果
+        :return:
+        """
+        return self.funcs["DE_GetResult"](handle, doc_extract_type)
 
     @NLPIRBase.byte_str_transform
     def get_sentiment_score(self, handle: int) -> int:
@@ -135,7 +187,7 @@ class DocExtractor(NLPIRBase):
         :param handle: :func:`parse_doc_e` 执行后返回的HANDLE
         :return: 情感正负得分
         """
-        return self.get_func("DE_GetSentimentScore", [c_size_t], c_int)(handle)
+        return self.funcs["DE_GetSentimentScore"](handle)
 
     @NLPIRBase.byte_str_transform
     def compute_sentiment_doc(self, text: str) -> int:
@@ -147,8 +199,9 @@ class DocExtractor(NLPIRBase):
         :param text: 文档内容
         :return:
         """
-        return self.get_func("DE_ComputeSentimentDoc", [c_char_p], c_int)(text)
+        return self.funcs["DE_ComputeSentimentDoc"](text)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_sentiment_dict(self, filename: str) -> int:
         """
@@ -161,8 +214,9 @@ class DocExtractor(NLPIRBase):
         :param filename:
         :return:
         """
-        return self.get_func("DE_ImportSentimentDict", [c_size_t], c_int)(filename)
+        return self.funcs["DE_ImportSentimentDict"](filename)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_user_dict(self, filename: str, overwrite: bool = False) -> int:
         """
@@ -174,8 +228,9 @@ class DocExtractor(NLPIRBase):
         :param overwrite:
         :return:
         """
-        return self.get_func("DE_ImportUserDict", [c_char_p, c_bool], c_uint)(filename, overwrite)
+        return self.funcs["DE_ImportUserDict"](filename, overwrite)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def add_user_word(self, word: str) -> int:
         """
@@ -186,8 +241,9 @@ class DocExtractor(NLPIRBase):
         :param word:
         :return:
         """
-        return self.get_func("DE_AddUserWord", [c_char_p], c_int)(word)
+        return self.funcs["DE_AddUserWord"](word)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def clean_user_word(self) -> int:
         """
@@ -197,7 +253,7 @@ class DocExtractor(NLPIRBase):
 
         :return:
         """
-        return self.get_func("DE_CleanUserWord", None, c_int)()
+        return self.funcs["DE_CleanUserWord"]()
 
     @NLPIRBase.byte_str_transform
     def save_the_usr_dic(self) -> int:
@@ -207,8 +263,9 @@ class DocExtractor(NLPIRBase):
         Save in-memory dict to user dict, see :func:`nlpir.native.ictclas.ICTCLAS.save_the_usr_dic`
         :return:
         """
-        return self.get_func("DE_SaveTheUsrDic", None, c_int)()
+        return self.funcs["DE_SaveTheUsrDic"]()
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def del_usr_word(self, word: str) -> int:
         """
@@ -219,8 +276,9 @@ class DocExtractor(NLPIRBase):
         :param word:
         :return:
         """
-        return self.get_func("DE_DelUsrWord", [c_char_p], c_int)(word)
+        return self.funcs["DE_DelUsrWord"](word)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_key_blacklist(self, filename: str, pos_blacklist: str) -> int:
         """
@@ -232,4 +290,4 @@ class DocExtractor(NLPIRBase):
         :param pos_blacklist:
         :return:
         """
-        return self.get_func("DE_ImportKeyBlackList", [c_char_p, c_char_p], c_uint)(filename, pos_blacklist)
+        return self.funcs["DE_ImportKeyBlackList"](filename, pos_blacklist)
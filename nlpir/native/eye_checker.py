@@ -37,6 +37,41 @@ class EyeChecker(nlpir_base.NLPIRBase):
     DOC_EXTRACT_TYPE_MAX_LENGTH = 600  # 最大长度
     load_mode = nlpir_base.NLPIRBase.RTLD_LAZY
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "NERICS_Init": ([c_char_p, c_char_p], c_int),
+        "NERICS_Exit": ([], c_bool),
+        "NERICS_GetLastErrorMsg": ([], c_char_p),
+        "NERICS_ImportFieldDict": ([c_char_p, c_bool, c_bool], c_int),
+        "NERICS_NewInstance": ([], c_int),
+        "NERICS_DeleteInstance": ([c_int], c_int),
+        "NERICS_ImportDoc": ([c_char_p, c_char_p, c_int], c_char_p),
+        "NERICS_LoadDocResult": ([c_char_p, c_int], c_size_t),
+        "NERICS_CheckReportF": ([c_char_p, c_char_p, c_char_p, c_int, c_int, c_int], c_char_p),
+        "NERICS_CheckReportM": ([c_char_p, c_char_p, c_char_p, c_int, c_int, c_int], c_char_p),
+        "NERICS_ExtractKnowledge": ([c_char_p, c_int], c_char_p),
+        "NERICS_GetResult": ([c_int, c_int], c_char_p),
+        "NERICS_AddAuditRule": ([c_char_p, c_int], c_int),
+        "NERICS_CheckReportDir": ([c_char_p, c_char_p, c_int, c_int, c_int], c_size_t),
+        "NERICS_ReviseReportF": ([c_char_p, c_int], c_char_p),
+        "NERICS_ShowHtmlError": ([c_char_p, c_int], c_char_p),
+        "NERICS_ImportTemplate": ([c_char_p, c_int, c_char_p, c_char_p, c_char_p], c_int),
+        "NERICS_EditTemplate": ([c_int, c_char_p, c_int, c_char_p, c_char_p, c_char_p], c_int),
+        "NERICS_FindTemplate": ([c_int, c_char_p, c_char_p, c_char_p], c_int),
+        "NERICS_DeleteTemplate": ([c_int], c_int),
+        "NERICS_GetTemplate": ([c_int], c_char_p),
+        "NERICS_GetTemplateCount": ([c_int], c_size_t),
+        "NERICS_GetCurTemplateInfo": ([c_int], c_char_p),
+        "NERICS_GetTemplateList": ([c_int, c_char_p], c_char_p),
+        "NERICS_ReCheckFormat": ([c_char_p, c_int, c_int, c_int], c_char_p),
+        "NERICS_ImportKGBRules": ([c_char_p, c_bool, c_int], c_int),
+        "NERICS_ImportKGBRulesFromMem": ([c_char_p, c_bool, c_int], c_int),
+        "NERICS_ImportErrorMsg": ([c_char_p], c_int),
+        "NERICS_ImportSimDict": ([c_char_p], c_int),
+        "NERICS_ImportSpellErrorDict": ([c_char_p], c_int),
+        "NERICS_ImportUserDict": ([c_char_p], c_int),
+    }
+
     @property
     def dll_name(self) -> str:
         return "EyeCheckerAPI"
@@ -51,7 +86,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param str license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func('NERICS_Init', [c_char_p, c_char_p], c_int)(data_path, license_code)
+        return self.funcs["NERICS_Init"](data_path, license_code)
 
     def exit_lib(self) -> bool:
         """
@@ -59,7 +94,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func('NERICS_Exit', restype=c_bool)()
+        return self.funcs["NERICS_Exit"]()
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -68,7 +103,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
 
         :return: error message
         """
-        return self.get_func("NERICS_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["NERICS_GetLastErrorMsg"]()
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def import_field_dict(self, field_dict_file: str, pinyin_abbrev_needed: bool = False,
@@ -81,7 +116,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param overwrite:
         :return:
         """
-        return self.get_func("NERICS_ImportFieldDict", [c_char_p, c_bool, c_bool], c_int)(
+        return self.funcs["NERICS_ImportFieldDict"](
             field_dict_file, pinyin_abbrev_needed, overwrite
         )
 
@@ -98,7 +133,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
               1.create 2016-11-15
         :return:
         """
-        return self.get_func("NERICS_NewInstance", [], c_int)()
+        return self.funcs["NERICS_NewInstance"]()
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def delete_instance(self, handle: int) -> int:
@@ -107,7 +142,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_DeleteInstance", [c_int], c_int)(handle)
+        return self.funcs["NERICS_DeleteInstance"](handle)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def import_doc(self, report_file: str, url_prefix: str = "", handle: int = 0) -> str:
@@ -129,7 +164,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_ImportDoc", [c_char_p, c_char_p, c_int], c_char_p)(
+        return self.funcs["NERICS_ImportDoc"](
             report_file, url_prefix, handle
         )
 
@@ -152,7 +187,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_LoadDocResult", [c_char_p, c_int], c_size_t)(
+        return self.funcs["NERICS_LoadDocResult"](
             result_xml_file, handle
         )
 
@@ -192,7 +227,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_CheckReportF", [c_char_p, c_char_p, c_char_p, c_int, c_int, c_int], c_char_p)(
+        return self.funcs["NERICS_CheckReportF"](
             report_file,
             url_prefix,
             organization,
@@ -237,7 +272,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_CheckReportM", [c_char_p, c_char_p, c_char_p, c_int, c_int, c_int], c_char_p)(
+        return self.funcs["NERICS_CheckReportM"](
             report_text,
             url_prefix,
             organization,
@@ -275,11 +310,24 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param report_type:
         :return:
         """
-        return self.get_func("NERICS_ExtractKnowledge", [c_char_p, c_int], c_char_p)(
+        return self.funcs["NERICS_ExtractKnowledge"](
             report_text,
             report_type,
         )
 
+    @nlpir_base.NLPIRBase.byte_buffer_transform
+    def extract_knowledge_bytes(self, report_text: bytes, report_type: int = RPT_UNSPECIFIC) -> bytes:
+        """
+        Call **NERICS_ExtractKnowledge**
+
+        Same as :func:`extract_knowledge`, take and return bytes without transcoding
+
+        :param report_text: encoded text
+        :param report_type:
+        :return:
+        """
+        return self.funcs["NERICS_ExtractKnowledge"](report_text, report_type)
+
     @nlpir_base.NLPIRBase.byte_str_transform
     def get_result(self, result_type: int, handle: int = 0) -> str:
         """
@@ -301,7 +349,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_GetResult", [c_char_p, c_int], c_char_p)(result_type, handle)
+        return self.funcs["NERICS_GetResult"](result_type, handle)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def add_audit_rule(self, audit_rule: str, report_type: int = RPT_UNSPECIFIC) -> int:
@@ -324,7 +372,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param report_type:
         :return:
         """
-        return self.get_func("NERICS_AddAuditRule", [c_char_p, c_int], c_int)(audit_rule, report_type)
+        return self.funcs["NERICS_AddAuditRule"](audit_rule, report_type)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def check_report_dir(
@@ -356,7 +404,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param thread_count:
         :return:
         """
-        return self.get_func("NERICS_CheckReportDir", [c_char_p, c_char_p, c_int, c_int, c_int], c_size_t)(
+        return self.funcs["NERICS_CheckReportDir"](
             report_dir, organization, report_type, format_opt, thread_count
         )
 
@@ -381,7 +429,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_ReviseReportF", [c_char_p, c_int], c_char_p)(revise_xml_file, handle)
+        return self.funcs["NERICS_ReviseReportF"](revise_xml_file, handle)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def show_html_error(self, revise_xml_file: str, handle: int = 0) -> str:
@@ -402,7 +450,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_ShowHtmlError", [c_char_p, c_int], c_char_p)(revise_xml_file, handle)
+        return self.funcs["NERICS_ShowHtmlError"](revise_xml_file, handle)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def import_template(
@@ -437,7 +485,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param argument:
         :return:
         """
-        return self.get_func("NERICS_ImportTemplate", [c_char_p, c_int, c_char_p, c_char_p, c_char_p])(
+        return self.funcs["NERICS_ImportTemplate"](
             template_file, report_type, org, area, argument
         )
 
@@ -478,7 +526,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param org:
         :return:
         """
-        return self.get_func("NERICS_EditTemplate", [c_int, c_char_p, c_int, c_char_p, c_char_p, c_char_p], c_int)(
+        return self.funcs["NERICS_EditTemplate"](
             template_id, template_file, report_type, org, area, argument
         )
 
@@ -508,7 +556,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param argument:
         :return:
         """
-        return self.get_func("NERICS_FindTemplate", [c_int, c_char_p, c_char_p, c_char_p], c_int)(
+        return self.funcs["NERICS_FindTemplate"](
             report_type, org, area, argument
         )
 
@@ -529,7 +577,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param template_id:
         :return:
         """
-        return self.get_func("NERICS_DeleteTemplate", [c_int], c_int)(template_id)
+        return self.funcs["NERICS_DeleteTemplate"](template_id)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def get_template(self, template_id: int) -> str:
@@ -549,7 +597,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param template_id:
         :return:
         """
-        return self.get_func("NERICS_GetTemplate", [c_int], c_char_p)(template_id)
+        return self.funcs["NERICS_GetTemplate"](template_id)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def get_template_count(self, template_id: int) -> str:
@@ -569,7 +617,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param template_id:
         :return:
         """
-        return self.get_func("NERICS_GetTemplateCount", [c_int], c_size_t)(template_id)
+        return self.funcs["NERICS_GetTemplateCount"](template_id)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def get_current_template_info(self, handle: int = 0) -> str:
@@ -588,7 +636,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_GetCurTemplateInfo", [c_int], c_char_p)(handle)
+        return self.funcs["NERICS_GetCurTemplateInfo"](handle)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def get_template_list(self, doc_type: int, organization: str) -> c_char_p:
@@ -610,7 +658,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param organization:
         :return:
         """
-        return self.get_func("NERICS_GetTemplateList", [c_int, c_char_p], c_char_p)(doc_type, organization)
+        return self.funcs["NERICS_GetTemplateList"](doc_type, organization)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def re_check_format(
@@ -643,7 +691,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("NERICS_ReCheckFormat", [c_char_p, c_int, c_int, c_int], c_char_p)(
+        return self.funcs["NERICS_ReCheckFormat"](
             check_xml, template_id, format_opt, handle
         )
 
@@ -668,7 +716,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param report_type:
         :return:
         """
-        return self.get_func("NERICS_ImportKGBRules", [c_char_p, c_bool, c_int], c_int)(
+        return self.funcs["NERICS_ImportKGBRules"](
             rule_file,
             overwrite,
             report_type
@@ -696,7 +744,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param report_type:
         :return:
         """
-        return self.get_func("NERICS_ImportKGBRulesFromMem", [c_char_p, c_bool, c_int], c_int)(
+        return self.funcs["NERICS_ImportKGBRulesFromMem"](
             rule_text,
             overwrite,
             report_type
@@ -720,7 +768,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param error_list_file:
         :return:
         """
-        return self.get_func("NERICS_ImportErrorMsg", [c_char_p], c_int)(error_list_file)
+        return self.funcs["NERICS_ImportErrorMsg"](error_list_file)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def import_sim_dict(self, sim_dict_file: str) -> c_int:
@@ -741,7 +789,7 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param sim_dict_file:
         :return:
         """
-        return self.get_func("NERICS_ImportSimDict", [c_char_p], c_int)(sim_dict_file)
+        return self.funcs["NERICS_ImportSimDict"](sim_dict_file)
 
     @nlpir_base.NLPIRBase.byte_str_transform
     def import_spell_error_dict(self, spell_error_dict: str) -> int:
@@ -761,8 +809,9 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param spell_error_dict:
         :return:
         """
-        return self.get_func("NERICS_ImportSpellErrorDict", [c_char_p], c_int)(spell_error_dict)
+        return self.funcs["NERICS_ImportSpellErrorDict"](spell_error_dict)
 
+    @nlpir_base.NLPIRBase.user_dict_change
     @nlpir_base.NLPIRBase.byte_str_transform
     def import_user_dict(self, user_dict: str):
         """
@@ -782,4 +831,4 @@ class EyeChecker(nlpir_base.NLPIRBase):
         :param user_dict:
         :return:
         """
-        return self.get_func("NERICS_ImportUserDict", [c_char_p], c_int)(user_dict)
+        return self.funcs["NERICS_ImportUserDict"](user_dict)
@@ -1,8 +1,12 @@
 # coding=utf-8
 from nlpir.native.nlpir_base import NLPIRBase
-from ctypes import c_bool, c_char, c_char_p, c_double, c_int, c_uint, POINTER, Structure, byref
+from nlpir.exception import NLPIRException
+from ctypes import c_bool, c_char, c_char_p, c_double, c_int, c_uint, POINTER, Structure, byref, cast
 import typing
 
+if typing.TYPE_CHECKING:
+    import numpy
+
 
 class ResultT(Structure):
     """The NLPIR ``result_t`` structure. copy from pynlpir"""
@@ -29,6 +33,18 @@ class ResultT(Structure):
     ]
 
 
+#: Fields of a NumPy dtype with the same layout as :class:`ResultT`
+RESULT_DTYPE_FIELDS = [
+    ("start", "<i4"),
+    ("length", "<i4"),
+    ("sPOS", "S40"),
+    ("iPOS", "<i4"),
+    ("word_ID", "<i4"),
+    ("word_type", "<i4"),
+    ("weight", "<i4"),
+]
+
+
 class ICTCLAS(NLPIRBase):
     """
     A dynamic link library native class for Chinese Segmentation
@@ -40,6 +56,35 @@ class ICTCLAS(NLPIRBase):
     PKU_POS_MAP_FIRST = 3  # 北大一级标注集
     POS_SIZE = 40
 
+    #: 当前使用的标注集, 由 :func:`set_pos_map` 修改 the pos map in use, changed by :func:`set_pos_map`
+    pos_map = ICT_POS_MAP_SECOND
+
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "NLPIR_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "NLPIR_Exit": ([], c_bool),
+        "NLPIR_ParagraphProcess": ([c_char_p, c_int], c_char_p),
+        "NLPIR_ParagraphProcessA": ([c_char_p, POINTER(c_int), c_bool], POINTER(ResultT)),
+        "NLPIR_FileProcess": ([c_char_p, c_char_p, c_int], c_double),
+        "NLPIR_ImportUserDict": ([c_char_p, c_bool], c_uint),
+        "NLPIR_AddUserWord": ([c_char_p], c_int),
+        "NLPIR_CleanUserWord": ([], c_int),
+        "NLPIR_CleanCurrentUserWord": ([], c_int),
+        "NLPIR_SaveTheUsrDic": ([], c_int),
+        "NLPIR_DelUsrWord": ([c_char_p], c_int),
+        "NLPIR_GetUniProb": ([c_char_p], c_double),
+        "NLPIR_IsWord": ([c_char_p], c_int),
+        "NLPIR_IsUserWord": ([c_char_p, c_bool], c_int),
+        "NLPIR_GetWordPOS": ([c_char_p], c_char_p),
+        "NLPIR_SetPOSmap": ([c_int], c_int),
+        "NLPIR_FinerSegment": ([c_char_p], c_char_p),
+        "NLPIR_GetEngWordOrign": ([c_char_p], c_char_p),
+        "NLPIR_WordFreqStat": ([c_char_p, c_bool], c_char_p),
+        "NLPIR_FileWordFreqStat": ([c_char_p, c_bool], c_char_p),
+        "NLPIR_GetLastErrorMsg": ([], c_char_p),
+        "NLPIR_Tokenizer4IR": ([c_char_p, c_bool], c_char_p),
+    }
+
     @property
     def dll_name(self) -> str:
         return "NLPIR"
@@ -54,7 +99,7 @@ class ICTCLAS(NLPIRBase):
         :param str license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func('NLPIR_Init', [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["NLPIR_Init"](data_path, encode, license_code)
 
     def exit_lib(self) -> bool:
         """
@@ -62,7 +107,7 @@ class ICTCLAS(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func('NLPIR_Exit', restype=c_bool)()
+        return self.funcs["NLPIR_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def paragraph_process(self, paragraph: str, pos_tagged: int = 1) -> str:
@@ -75,7 +120,21 @@ class ICTCLAS(NLPIRBase):
         :param int pos_tagged: show the pos tag or not 1-> True, 0-> False
         :return: segmented string
         """
-        return self.get_func('NLPIR_ParagraphProcess', [c_char_p, c_int], c_char_p)(paragraph, pos_tagged)
+        return self.funcs["NLPIR_ParagraphProcess"](paragraph, pos_tagged)
+
+    @NLPIRBase.byte_buffer_transform
+    def paragraph_process_bytes(self, paragraph: bytes, pos_tagged: int = 1) -> bytes:
+        """
+        Call **NLPIR_ParagraphProcess**
+
+        Same as :func:`paragraph_process`, but take and return bytes in the encoding set at init,
+        without encoding the input and decoding the output
+
+        :param bytes paragraph: the encoded string want to be segmented, ``bytearray`` and ``memoryview`` are accepted
+        :param int pos_tagged: show the pos tag or not 1-> True, 0-> False
+        :return: segmented bytes
+        """
+        return self.funcs["NLPIR_ParagraphProcess"](paragraph, pos_tagged)
 
     @NLPIRBase.byte_str_transform
     def paragraph_process_a(self, paragraph: str, user_dict: bool = True) -> typing.Tuple[ResultT, int]:
@@ -84,19 +143,65 @@ class ICTCLAS(NLPIRBase):
 
         Segment paragraph to an Array of ResultT, get more detail info
 
+        The result is a buffer in the library, it is overwritten by the next call in the same thread,
+        use :func:`result_array` , :func:`result_memoryview` or :func:`result_numpy` to read it without copying,
+        the offsets are in bytes of the encoded paragraph, ``bytes`` in the encoding set at init is accepted
+        as the paragraph to get the bytes used in the offsets. See :func:`nlpir.ictclas.segment_with_offsets`.
+
         :param str paragraph: the string want to be segmented
         :param bool user_dict: use user dictionary or not
         :return: a result of segment, an array of ResultT and the length of the ResultT
         """
-        self.logger.warning("not recommended, use paragraph_process instead")
         result_count = c_int()
-        result = self.get_func('NLPIR_ParagraphProcessA', [c_char_p, POINTER(c_int), c_bool], POINTER(ResultT))(
+        result = self.funcs["NLPIR_ParagraphProcessA"](
             paragraph,
             byref(result_count),
             user_dict
         )
         return result, result_count.value
 
+    @staticmethod
+    def result_array(result: POINTER(ResultT), count: int) -> typing.Sequence[ResultT]:
+        """
+        A ctypes array over the result of :func:`paragraph_process_a` without copying
+
+        :param result: the pointer returned by :func:`paragraph_process_a`
+        :param count: the length returned by :func:`paragraph_process_a`
+        :return: ``ResultT * count`` array
+        """
+        if count <= 0 or not result:
+            return (ResultT * 0)()
+        return cast(result, POINTER(ResultT * count)).contents
+
+    @staticmethod
+    def result_memoryview(result: POINTER(ResultT), count: int) -> memoryview:
+        """
+        Same as :func:`result_array` , return a memoryview of :class:`ResultT` items
+
+        :param result: the pointer returned by :func:`paragraph_process_a`
+        :param count: the length returned by :func:`paragraph_process_a`
+        :return: memoryview of the native buffer
+        """
+        return memoryview(ICTCLAS.result_array(result, count))
+
+    @staticmethod
+    def result_numpy(result: POINTER(ResultT), count: int) -> "numpy.ndarray":
+        """
+        Same as :func:`result_array` , return a NumPy structured array of :data:`RESULT_DTYPE_FIELDS` ,
+        fields can be read as columns like ``array["start"]`` . NumPy is imported on the first call,
+        it is not required by other functions
+
+        :param result: the pointer returned by :func:`paragraph_process_a`
+        :param count: the length returned by :func:`paragraph_process_a`
+        :return: structured array over the native buffer
+        :raises NLPIRException: NumPy is not installed
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise NLPIRException("NumPy is required to get the result as an array")
+        return numpy.frombuffer(ICTCLAS.result_memoryview(result, count).cast("B"), dtype=RESULT_DTYPE_FIELDS)
+
     @NLPIRBase.byte_str_transform
     def get_paragraph_process_a_word_count(self, paragraph: str) -> int:
         raise NotImplementedError("Not recommended, use paragraph_process")
@@ -116,12 +221,13 @@ class ICTCLAS(NLPIRBase):
         :param str result_filename: the path to save the result of segmentation
         :param int pos_tagged: show the pos tag or not 1->True, 0->False
         """
-        return self.get_func('NLPIR_FileProcess', [c_char_p, c_char_p, c_int], c_double)(
+        return self.funcs["NLPIR_FileProcess"](
             source_filename,
             result_filename,
             pos_tagged
         )
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_user_dict(self, filename: str, overwrite: bool = False) -> int:
         """
@@ -141,8 +247,9 @@ class ICTCLAS(NLPIRBase):
         :param bool overwrite: overwrite the current user dict or not
         :return: import success or not  1->True 2->False
         """
-        return self.get_func('NLPIR_ImportUserDict', [c_char_p, c_bool], c_uint)(filename, overwrite)
+        return self.funcs["NLPIR_ImportUserDict"](filename, overwrite)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def add_user_word(self, word: str) -> int:
         """
@@ -163,8 +270,9 @@ class ICTCLAS(NLPIRBase):
         :param str word:
         :return: 1,true ; 0,false
         """
-        return self.get_func('NLPIR_AddUserWord', [c_char_p], c_int)(word)
+        return self.funcs["NLPIR_AddUserWord"](word)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def clean_user_word(self) -> int:
         """
@@ -174,8 +282,9 @@ class ICTCLAS(NLPIRBase):
         TODO figure out the return value
         :return: 1,true ; 0,false
         """
-        return self.get_func('NLPIR_CleanUserWord', None, c_int)()
+        return self.funcs["NLPIR_CleanUserWord"]()
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def clean_current_user_word(self) -> int:
         """
@@ -186,7 +295,7 @@ class ICTCLAS(NLPIRBase):
 
         :return: 1,true; 2,false
         """
-        return self.get_func('NLPIR_CleanCurrentUserWord', None, c_int)()
+        return self.funcs["NLPIR_CleanCurrentUserWord"]()
 
     @NLPIRBase.byte_str_transform
     def save_the_usr_dic(self) -> int:
@@ -197,8 +306,9 @@ class ICTCLAS(NLPIRBase):
 
         :return: 1,true; 2,false
         """
-        return self.get_func('NLPIR_SaveTheUsrDic', None, c_int)()
+        return self.funcs["NLPIR_SaveTheUsrDic"]()
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def del_usr_word(self, word: str) -> int:
         """
@@ -209,7 +319,7 @@ class ICTCLAS(NLPIRBase):
         :param str word: the word to delete
         :return: -1, the word not exist in the user dictionary; else, the handle of the word deleted
         """
-        return self.get_func('NLPIR_DelUsrWord', [c_char_p], c_int)(word)
+        return self.funcs["NLPIR_DelUsrWord"](word)
 
     @NLPIRBase.byte_str_transform
     def get_uni_prob(self, word) -> float:
@@ -222,7 +332,7 @@ class ICTCLAS(NLPIRBase):
         :return: The unitary probability of a word.
         """
 
-        return self.get_func("NLPIR_GetUniProb", [c_char_p], c_double)(word)
+        return self.funcs["NLPIR_GetUniProb"](word)
 
     @NLPIRBase.byte_str_transform
     def is_word(self, word: str) -> int:
@@ -234,7 +344,7 @@ class ICTCLAS(NLPIRBase):
         :param str word: input word
         :return: 1: exists; 0: no exists
         """
-        return self.get_func("NLPIR_IsWord", [c_char_p], c_int)(word)
+        return self.funcs["NLPIR_IsWord"](word)
 
     @NLPIRBase.byte_str_transform
     def is_user_word(self, word: str, is_ascii: bool = False) -> int:
@@ -247,7 +357,7 @@ class ICTCLAS(NLPIRBase):
         :param bool is_ascii: is ascii encode or not
         :return: 1: exists; 0: no exists
         """
-        return self.get_func("NLPIR_IsUserWord", [c_char_p], c_int)(word, is_ascii)
+        return self.funcs["NLPIR_IsUserWord"](word, is_ascii)
 
     @NLPIRBase.byte_str_transform
     def get_word_pos(self, word: str) -> str:
@@ -259,7 +369,7 @@ class ICTCLAS(NLPIRBase):
         :param str word: input word
         :return: pos tagging
         """
-        return self.get_func("NLPIR_GetWordPOS", [c_char_p], c_char_p)(word)
+        return self.funcs["NLPIR_GetWordPOS"](word)
 
     def set_pos_map(self, pos_map: int) -> int:
         """
@@ -277,7 +387,18 @@ class ICTCLAS(NLPIRBase):
         :param int pos_map:
         :return: 0, failed; else, success
         """
-        return self.get_func("NLPIR_SetPOSmap")(pos_map)
+        result = self.funcs["NLPIR_SetPOSmap"](pos_map)
+        if result != 0:
+            self.pos_map = pos_map
+        return result
+
+    def get_cache_config(self) -> tuple:
+        """
+        See :func:`nlpir.native.nlpir_base.NLPIRBase.get_cache_config`
+
+        :return: ``(encode, user_dict_version, user_dict_session, pos_map)``
+        """
+        return super().get_cache_config() + (self.pos_map,)
 
     @NLPIRBase.byte_str_transform
     def finer_segment(self, line: str) -> str:
@@ -291,7 +412,19 @@ class ICTCLAS(NLPIRBase):
         :param str line: string need to be segmented
         :return: segmented string, return null string if line cannot be segmented
         """
-        return self.get_func("NLPIR_FinerSegment", [c_char_p], c_char_p)(line)
+        return self.funcs["NLPIR_FinerSegment"](line)
+
+    @NLPIRBase.byte_buffer_transform
+    def finer_segment_bytes(self, line: bytes) -> bytes:
+        """
+        Call **NLPIR_FinerSegment**
+
+        Same as :func:`finer_segment`, take and return bytes without transcoding
+
+        :param bytes line: encoded string need to be segmented
+        :return: segmented bytes, return null bytes if line cannot be segmented
+        """
+        return self.funcs["NLPIR_FinerSegment"](line)
 
     @NLPIRBase.byte_str_transform
     def get_eng_word_origin(self, word: str) -> str:
@@ -305,7 +438,7 @@ class ICTCLAS(NLPIRBase):
         :param str word: word to be stemmed
         :return: the stemmed word
         """
-        return self.get_func("NLPIR_GetEngWordOrign", [c_char_p], c_char_p)(word)
+        return self.funcs["NLPIR_GetEngWordOrign"](word)
 
     @NLPIRBase.byte_str_transform
     def word_freq_stat(self, text: str, stop_word_remove: bool = True) -> str:
@@ -322,7 +455,20 @@ class ICTCLAS(NLPIRBase):
 
             张华平/nr/10#博士/n/9#分词/n/8
         """
-        return self.get_func("NLPIR_WordFreqStat", [c_char_p, c_bool], c_char_p)(text, stop_word_remove)
+        return self.funcs["NLPIR_WordFreqStat"](text, stop_word_remove)
+
+    @NLPIRBase.byte_buffer_transform
+    def word_freq_stat_bytes(self, text: bytes, stop_word_remove: bool = True) -> bytes:
+        """
+        Call **NLPIR_WordFreqStat**
+
+        Same as :func:`word_freq_stat`, take and return bytes without transcoding
+
+        :param bytes text: 输入的文本内容
+        :param bool stop_word_remove: true-去除停用词 false-不去除停用词
+        :return: same as :func:`word_freq_stat`, in bytes
+        """
+        return self.funcs["NLPIR_WordFreqStat"](text, stop_word_remove)
 
     @NLPIRBase.byte_str_transform
     def file_word_freq_stat(self, filename: str, stop_word_remove: bool = True) -> str:
@@ -335,7 +481,7 @@ class ICTCLAS(NLPIRBase):
         :param bool stop_word_remove: remove stop words or not
         :return: same as :func:`word_freq_stat`
         """
-        return self.get_func("NLPIR_FileWordFreqStat", [c_char_p, c_bool], c_char_p)(filename, stop_word_remove)
+        return self.funcs["NLPIR_FileWordFreqStat"](filename, stop_word_remove)
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -344,7 +490,7 @@ class ICTCLAS(NLPIRBase):
 
         :return: error message
         """
-        return self.get_func("NLPIR_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["NLPIR_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def tokenizer_for_ir(self, text: str, fine_segment: bool = False) -> str:
@@ -394,4 +540,17 @@ class ICTCLAS(NLPIRBase):
                 }
             ]
         """
-        return self.get_func("NLPIR_Tokenizer4IR", [c_char_p, c_bool], c_char_p)(text, fine_segment)
+        return self.funcs["NLPIR_Tokenizer4IR"](text, fine_segment)
+
+    @NLPIRBase.byte_buffer_transform
+    def tokenizer_for_ir_bytes(self, text: bytes, fine_segment: bool = False) -> bytes:
+        """
+        Call **NLPIR_Tokenizer4IR**
+
+        Same as :func:`tokenizer_for_ir`, take and return bytes without transcoding
+
+        :param bytes text: The source paragraph
+        :param bool fine_segment: Need finer segment or not
+        :return: JSON in bytes, same as :func:`tokenizer_for_ir`
+        """
+        return self.funcs["NLPIR_Tokenizer4IR"](text, fine_segment)
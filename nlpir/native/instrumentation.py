@@ -0,0 +1,217 @@
+# coding=utf-8
+"""
+Native call instrumentation
+
+记录每个组件每个动态库导出函数(如 ``NLPIR_ParagraphProcess``, ``KeyExtract_GetKeyWords``, ``DS_SingleDocE``)
+的调用次数, 输入字节数, 输出字节数和耗时分布(固定分桶的直方图), 默认关闭, 使用 :func:`enable` 开启.
+
+Record call counts, input bytes, output bytes and latency histograms of every native function,
+it is opt-in and has no overhead when disabled.
+
+Example::
+
+    from nlpir.native import instrumentation
+
+    recorder = instrumentation.enable()
+    ictclas.segment(text)
+    print(recorder.snapshot()["NLPIR"]["NLPIR_ParagraphProcess"]["count"])
+    print(recorder.render_prometheus())
+    # expose for scraping, http://127.0.0.1:9464/metrics
+    server = recorder.start_http_server(9464)
+    ...
+    instrumentation.disable(recorder)
+
+Only :class:`bytes` arguments and results are counted as input and output bytes.
+"""
+import bisect
+import http.server
+import threading
+import typing
+from nlpir.native.nlpir_base import NLPIRBase
+
+#: Upper bounds of the latency buckets in seconds, the last bucket is ``+Inf``
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class FunctionStats:
+    """
+    Statistics of one native function
+
+    :param buckets: sorted upper bounds of the latency buckets in seconds
+    """
+    __slots__ = ("buckets", "count", "input_bytes", "output_bytes", "seconds", "bucket_counts", "lock")
+
+    def __init__(self, buckets: typing.Sequence[float]):
+        self.buckets = buckets
+        self.count = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.seconds = 0.0
+        # one more bucket for +Inf
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float, input_bytes: int, output_bytes: int) -> None:
+        """
+        :param seconds: time cost of the call
+        :param input_bytes: bytes passed to the function
+        :param output_bytes: bytes returned by the function
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            self.count += 1
+            self.input_bytes += input_bytes
+            self.output_bytes += output_bytes
+            self.seconds += seconds
+            self.bucket_counts[index] += 1
+
+    def snapshot(self) -> dict:
+        """
+        :return: a copy of the statistics, ``buckets`` is a list of ``(upper bound, cumulative count)``
+        """
+        with self.lock:
+            counts = list(self.bucket_counts)
+            result = {
+                "count": self.count,
+                "input_bytes": self.input_bytes,
+                "output_bytes": self.output_bytes,
+                "seconds": self.seconds,
+            }
+        cumulative, buckets = 0, []
+        for bound, count in zip(list(self.buckets) + [float("inf")], counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        result["buckets"] = buckets
+        return result
+
+
+class Instrumentation:
+    """
+    A call hook of :class:`nlpir.native.nlpir_base.NLPIRBase` records the statistics of native calls,
+    add it by :func:`enable` or :func:`nlpir.native.nlpir_base.NLPIRBase.add_call_hook`
+
+    :param buckets: sorted upper bounds of the latency buckets in seconds, default is :data:`DEFAULT_BUCKETS`
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.stats: typing.Dict[typing.Tuple[str, str], FunctionStats] = dict()
+        self.lock = threading.Lock()
+
+    def __call__(self, component: str, function: str, args: tuple, result: typing.Any, seconds: float) -> None:
+        stats = self.stats.get((component, function))
+        if stats is None:
+            with self.lock:
+                stats = self.stats.setdefault((component, function), FunctionStats(self.buckets))
+        stats.record(
+            seconds,
+            sum(len(arg) for arg in args if isinstance(arg, bytes)),
+            len(result) if isinstance(result, bytes) else 0
+        )
+
+    def reset(self) -> None:
+        """
+        Clear all statistics
+        """
+        with self.lock:
+            self.stats = dict()
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, dict]]:
+        """
+        :return: ``{component: {function: stats}}`` , see :func:`FunctionStats.snapshot` for the stats
+        """
+        result = dict()
+        for (component, function), stats in list(self.stats.items()):
+            result.setdefault(component, dict())[function] = stats.snapshot()
+        return result
+
+    def render_prometheus(self, prefix: str = "nlpir_native") -> str:
+        """
+        Render the statistics in Prometheus text exposition format
+
+        :param prefix: prefix of the metric names
+        :return: the metrics text
+        """
+        snapshot = self.snapshot()
+        samples = [
+            (component, function, stats)
+            for component, functions in sorted(snapshot.items())
+            for function, stats in sorted(functions.items())
+        ]
+        lines = []
+        for name, key, help_text in (
+                ("calls_total", "count", "Number of native calls"),
+                ("input_bytes_total", "input_bytes", "Bytes passed to native calls"),
+                ("output_bytes_total", "output_bytes", "Bytes returned by native calls"),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for component, function, stats in samples:
+                lines.append(f'{prefix}_{name}{{component="{component}",function="{function}"}} {stats[key]}')
+        name = f"{prefix}_call_duration_seconds"
+        lines.append(f"# HELP {name} Latency of native calls")
+        lines.append(f"# TYPE {name} histogram")
+        for component, function, stats in samples:
+            labels = f'component="{component}",function="{function}"'
+            for bound, count in stats["buckets"]:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {stats['seconds']!r}")
+            lines.append(f"{name}_count{{{labels}}} {stats['count']}")
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port: int, host: str = "127.0.0.1") -> http.server.HTTPServer:
+        """
+        Serve :func:`render_prometheus` at ``http://host:port/metrics`` in a daemon thread
+
+        :param port: port to listen, 0 for a random free port
+        :param host: address to bind, only local by default
+        :return: the server, call ``shutdown()`` to stop it
+        """
+        instrumentation = self
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = instrumentation.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def enable(instrumentation: typing.Optional[Instrumentation] = None) -> Instrumentation:
+    """
+    Start recording native calls of all components
+
+    :param instrumentation: the recorder to use, create a new one if None
+    :return: the recorder
+    """
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    NLPIRBase.add_call_hook(instrumentation)
+    return instrumentation
+
+
+def disable(instrumentation: Instrumentation) -> None:
+    """
+    Stop recording native calls, the recorded statistics are kept
+
+    :param instrumentation: the recorder returned by :func:`enable`
+    """
+    NLPIRBase.remove_call_hook(instrumentation)
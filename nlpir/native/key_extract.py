@@ -10,6 +10,27 @@ class KeyExtract(NLPIRBase):
     A dynamic link library native class for Key Words Extract
     """
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "KeyExtract_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "KeyExtract_Exit": ([], c_bool),
+        "KeyExtract_GetKeyWords": ([c_char_p, c_int, c_int], c_char_p),
+        "KeyExtract_GetFileKeyWords": ([c_char_p, c_int, c_int], c_char_p),
+        "KeyExtract_ImportUserDict": ([c_char_p, c_bool], c_uint),
+        "KeyExtract_AddUserWord": ([c_char_p], c_int),
+        "KeyExtract_CleanUserWord": ([], c_int),
+        "KeyExtract_CleanCurrentUserWord": ([], c_int),
+        "KeyExtract_SaveTheUsrDic": ([], c_int),
+        "KeyExtract_DelUsrWord": ([c_char_p], c_int),
+        "KeyExtract_ImportKeyBlackList": ([c_char_p, c_char_p], c_uint),
+        "KeyExtract_Batch_Start": ([], c_int),
+        "KeyExtract_Batch_AddFile": ([c_char_p], c_ulong),
+        "KeyExtract_Batch_AddMem": ([c_char_p], c_bool),
+        "KeyExtract_Batch_Complete": ([], c_int),
+        "KeyExtract_Batch_GetResult": ([c_bool], c_char_p),
+        "KeyExtract_GetLastErrorMsg": ([], c_char_p),
+    }
+
     @property
     def dll_name(self) -> str:
         return "KeyExtract"
@@ -24,7 +45,7 @@ class KeyExtract(NLPIRBase):
         :param str license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func('KeyExtract_Init', [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["KeyExtract_Init"](data_path, encode, license_code)
 
     def exit_lib(self) -> bool:
         """
@@ -32,7 +53,7 @@ class KeyExtract(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func('KeyExtract_Exit', restype=c_bool)()
+        return self.funcs["KeyExtract_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_keywords(self, line: str, max_key_limit: int = 50, format_opt: int = nlpir_base.OUTPUT_FORMAT_SHARP) -> str:
@@ -81,9 +102,28 @@ class KeyExtract(NLPIRBase):
             ]
 
         """
-        return self.get_func('KeyExtract_GetKeyWords', [c_char_p, c_int, c_int], c_char_p)(
+        return self.funcs["KeyExtract_GetKeyWords"](
             line, max_key_limit, format_opt)
 
+    @NLPIRBase.byte_buffer_transform
+    def get_keywords_bytes(
+            self,
+            line: bytes,
+            max_key_limit: int = 50,
+            format_opt: int = nlpir_base.OUTPUT_FORMAT_SHARP
+    ) -> bytes:
+        """
+        Call **KeyExtract_GetKeyWords**
+
+        Same as :func:`get_keywords`, take and return bytes without transcoding
+
+        :param line: the encoded input paragraph
+        :param max_key_limit: maximum of key words, up to 50
+        :param format_opt: same as :func:`get_keywords`
+        :return: the keyword with weight in bytes
+        """
+        return self.funcs['KeyExtract_GetKeyWords'](line, max_key_limit, format_opt)
+
     @NLPIRBase.byte_str_transform
     def get_file_keywords(
             self,
@@ -132,9 +172,10 @@ class KeyExtract(NLPIRBase):
             ]
 
         """
-        return self.get_func('KeyExtract_GetFileKeyWords', [c_char_p, c_int, c_int], c_char_p)(
+        return self.funcs["KeyExtract_GetFileKeyWords"](
             filename, max_key_limit, format_opt)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_user_dict(self, filename: str, overwrite: bool = False):
         """
@@ -152,8 +193,9 @@ class KeyExtract(NLPIRBase):
         :param bool overwrite: overwrite the current user dict or not
         :return: import success or not  1->True 2->False
         """
-        return self.get_func('KeyExtract_ImportUserDict', [c_char_p, c_bool], c_uint)(filename, overwrite)
+        return self.funcs["KeyExtract_ImportUserDict"](filename, overwrite)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def add_user_word(self, word: str) -> int:
         """
@@ -174,8 +216,9 @@ class KeyExtract(NLPIRBase):
         :param str word:
         :return: 1,true ; 0,false
         """
-        return self.get_func('KeyExtract_AddUserWord', [c_char_p], c_int)(word)
+        return self.funcs["KeyExtract_AddUserWord"](word)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def clean_user_word(self) -> int:
         """
@@ -185,8 +228,9 @@ class KeyExtract(NLPIRBase):
 
         :return: 1,true ; 0,false
         """
-        return self.get_func('KeyExtract_CleanUserWord', None, c_int)()
+        return self.funcs["KeyExtract_CleanUserWord"]()
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def clean_current_user_word(self) -> int:
         """
@@ -197,7 +241,7 @@ class KeyExtract(NLPIRBase):
 
         :return: 1,true ; 0,false
         """
-        return self.get_func('KeyExtract_CleanCurrentUserWord', None, c_int)()
+        return self.funcs["KeyExtract_CleanCurrentUserWord"]()
 
     @NLPIRBase.byte_str_transform
     def save_the_usr_dic(self) -> int:
@@ -208,8 +252,9 @@ class KeyExtract(NLPIRBase):
 
         :return: 1,true; 2,false
         """
-        return self.get_func('KeyExtract_SaveTheUsrDic', None, c_int)()
+        return self.funcs["KeyExtract_SaveTheUsrDic"]()
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def del_usr_word(self, word: str) -> int:
         """
@@ -220,8 +265,9 @@ class KeyExtract(NLPIRBase):
         :param str word: the word to be delete
         :return: -1, the word not exist in the user dictionary; else, the handle of the word deleted
         """
-        return self.get_func('KeyExtract_DelUsrWord', [c_char_p], c_int)(word)
+        return self.funcs["KeyExtract_DelUsrWord"](word)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_key_blacklist(self, filename: str, pos_blacklist: typing.Optional[str] = None) -> int:
         """
@@ -241,7 +287,7 @@ class KeyExtract(NLPIRBase):
         :param pos_blacklist: A list of pos that want to block in the system, 想要屏蔽的词的词性
         :return: number of words that import to the systems
         """
-        return self.get_func('KeyExtract_ImportKeyBlackList', [c_char_p, c_char_p], c_uint)(filename, pos_blacklist)
+        return self.funcs["KeyExtract_ImportKeyBlackList"](filename, pos_blacklist)
 
     """
     /*********************************************************************
@@ -259,7 +305,7 @@ class KeyExtract(NLPIRBase):
 
         :return: rue:success, false:fail
         """
-        return self.get_func('KeyExtract_Batch_Start', None, c_int)()
+        return self.funcs["KeyExtract_Batch_Start"]()
 
     @NLPIRBase.byte_str_transform
     def batch_add_file(self, filename) -> int:
@@ -271,7 +317,7 @@ class KeyExtract(NLPIRBase):
         :param filename: 文件名
         :return: true:success, false:fail
         """
-        return self.get_func('KeyExtract_Batch_AddFile', [c_char_p], c_ulong)(filename)
+        return self.funcs["KeyExtract_Batch_AddFile"](filename)
 
     @NLPIRBase.byte_str_transform
     def batch_addmen(self, txt: str) -> bool:
@@ -283,7 +329,7 @@ class KeyExtract(NLPIRBase):
         :param txt: 文件名
         :return:  true:success, false:fail
         """
-        return self.get_func('KeyExtract_Batch_AddMem', [c_char_p], c_bool)(txt)
+        return self.funcs["KeyExtract_Batch_AddMem"](txt)
 
     @NLPIRBase.byte_str_transform
     def batch_complete(self) -> int:
@@ -294,7 +340,7 @@ class KeyExtract(NLPIRBase):
 
         :return: true:success, false:fail
         """
-        return self.get_func('KeyExtract_Batch_Complete', None, c_int)()
+        return self.funcs["KeyExtract_Batch_Complete"]()
 
     @NLPIRBase.byte_str_transform
     def batch_getresult(self, weight_out: bool) -> str:
@@ -306,7 +352,7 @@ class KeyExtract(NLPIRBase):
         :param weight_out: 是否需要输出每个关键词的权重参数
         :return:  输出格式为 【关键词1】 【权重1】 【关键词2】 【权重2】 ...
         """
-        return self.get_func('KeyExtract_Batch_GetResult', [c_bool], str)(weight_out)
+        return self.funcs["KeyExtract_Batch_GetResult"](weight_out)
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -315,4 +361,4 @@ class KeyExtract(NLPIRBase):
 
         :return: error message
         """
-        return self.get_func("KeyExtract_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["KeyExtract_GetLastErrorMsg"]()
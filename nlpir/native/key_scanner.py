@@ -19,6 +19,30 @@ class KeyScanner(NLPIRBase):
     A dynamic link library native class for Keyword Scan
     """
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "KS_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "KS_Exit": ([], c_bool),
+        "KS_GetLastErrorMsg": ([], c_char_p),
+        "KS_NewInstance": ([c_int], c_int),
+        "KS_DeleteInstance": ([c_int], c_int),
+        "KS_ImportUserDict": ([c_char_p, c_bool, c_bool, c_int], c_int),
+        "KS_DeleteUserDict": ([c_char_p, c_int], c_int),
+        "KS_Scan": ([c_char_p, c_int], c_char_p),
+        "KS_ScanDetail": ([c_char_p, c_int, c_int], c_char_p),
+        "KS_ScanFile": ([c_char_p, c_int], c_char_p),
+        "KS_ScanFileDetail": ([c_char_p, c_int], c_char_p),
+        "KS_ScanLine": ([c_char_p, c_char_p, c_int, c_int, c_int], c_int),
+        "KS_ScanStat": ([c_char_p, c_int], c_int),
+        "KS_ScanDir": ([c_char_p, c_char_p, c_char_p, c_int, c_int, c_int], c_int),
+        "KS_MergeResult": ([c_char_p], None),
+        "KS_ScanAddStat": ([c_char_p, c_int], c_int),
+        "KS_StatResultFilter": ([c_char_p, c_char_p, c_float], c_int),
+        "KS_ScanResultFilter": ([c_char_p, c_char_p, c_float], c_int),
+        "KS_Decrypt": ([c_char_p, c_char_p], c_int),
+        "KS_ExportDict": ([c_char_p, c_int], c_int),
+    }
+
     @property
     def dll_name(self) -> str:
         return "KeyScanAPI"
@@ -33,7 +57,7 @@ class KeyScanner(NLPIRBase):
         :param str license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func('KS_Init', [c_char_p, c_int, c_char_p], c_int)(
+        return self.funcs["KS_Init"](
             data_path, encode, license_code)
 
     def exit_lib(self) -> bool:
@@ -42,7 +66,7 @@ class KeyScanner(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func('KS_Exit', restype=c_bool)()
+        return self.funcs["KS_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -51,7 +75,7 @@ class KeyScanner(NLPIRBase):
 
         :return: error message
         """
-        return self.get_func("KS_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["KS_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def new_instance(self, filter_type_index: int = 0) -> int:
@@ -68,7 +92,7 @@ class KeyScanner(NLPIRBase):
             The filter file will save into `Data/KeyScanner/filter{no}*`
         :return: a handle from system if success; otherwise return -1;
         """
-        return self.get_func("KS_NewInstance", [c_int], c_int)(filter_type_index)
+        return self.funcs["KS_NewInstance"](filter_type_index)
 
     @NLPIRBase.byte_str_transform
     def delete_instance(self, handle: int) -> int:
@@ -82,8 +106,9 @@ class KeyScanner(NLPIRBase):
         :param handle: the handle want to be deleted
         :return: success or not
         """
-        return self.get_func("KS_DeleteInstance", [c_int], c_int)(handle)
+        return self.funcs["KS_DeleteInstance"](handle)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_user_dict(
             self,
@@ -120,7 +145,7 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: success or not
         """
-        return self.get_func("KS_ImportUserDict", [c_char_p, c_bool, c_bool, c_int], c_int)(
+        return self.funcs["KS_ImportUserDict"](
             filename, over_write, pinyin_abbrev_needed, handle)
 
     @NLPIRBase.byte_str_transform
@@ -139,7 +164,7 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: The number of lexical entry deleted successfully 成功删除的词典条数
         """
-        return self.get_func("KS_DeleteUserDict", [c_char_p, c_int], c_int)(text, handle)
+        return self.funcs["KS_DeleteUserDict"](text, handle)
 
     @NLPIRBase.byte_str_transform
     def delete_user_dic_from_file(self, filename: str, handle: int) -> int:
@@ -157,7 +182,7 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: The number of lexical entry deleted successfully 成功删除的词典条数
         """
-        return self.get_func("KS_DeleteUserDict", [c_char_p, c_int], c_int)(filename, handle)
+        return self.funcs["KS_DeleteUserDict"](filename, handle)
 
     @NLPIRBase.byte_str_transform
     def scan(self, content: str, handle: int = 0) -> str:
@@ -171,7 +196,20 @@ class KeyScanner(NLPIRBase):
         :return: 涉及不良的所有类别与权重，按照权重排序。如: ``色情/10#暴力/1#`` , ``政治反动/2#FLG/1#涉领导人/1#`` ,
             ``""`` : 表示无扫描命中结果
         """
-        return self.get_func("KS_Scan", [c_char_p, c_int], c_char_p)(content, handle)
+        return self.funcs["KS_Scan"](content, handle)
+
+    @NLPIRBase.byte_buffer_transform
+    def scan_bytes(self, content: bytes, handle: int = 0) -> bytes:
+        """
+        Call **KS_Scan**
+
+        Same as :func:`scan`, take and return bytes without transcoding
+
+        :param content: 编码后的文本内容
+        :param handle: handle of KeyScanner
+        :return: same as :func:`scan`
+        """
+        return self.funcs["KS_Scan"](content, handle)
 
     @NLPIRBase.byte_str_transform
     def scan_detail(self, content: str, scan_mode: int = SCAN_MODE_NORMAL, handle: int = 0) -> str:
@@ -219,7 +257,7 @@ class KeyScanner(NLPIRBase):
                 "score":13.333333333333332
             }
         """
-        return self.get_func("KS_ScanDetail", [c_char_p, c_int, c_int], c_char_p)(content, scan_mode, handle)
+        return self.funcs["KS_ScanDetail"](content, scan_mode, handle)
 
     @NLPIRBase.byte_str_transform
     def scan_file(self, filename: str, handle: int = 0) -> str:
@@ -232,7 +270,7 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: same as :func:`scan`
         """
-        return self.get_func("KS_ScanFile", [c_char_p, c_int], c_char_p)(filename, handle)
+        return self.funcs["KS_ScanFile"](filename, handle)
 
     @NLPIRBase.byte_str_transform
     def scan_file_detail(self, filename: str, handle: int = 0) -> str:
@@ -245,7 +283,7 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: same as :func:`scan_detail`
         """
-        return self.get_func("KS_ScanFileDetail", [c_char_p, c_int], c_char_p)(filename, handle)
+        return self.funcs["KS_ScanFileDetail"](filename, handle)
 
     @NLPIRBase.byte_str_transform
     def scan_line(
@@ -268,7 +306,7 @@ class KeyScanner(NLPIRBase):
         :param scan_mode:
         :return: same as :func:`scan_detail`
         """
-        return self.get_func("KS_ScanLine", [c_char_p, c_char_p, c_int, c_int, c_int], c_int)(
+        return self.funcs["KS_ScanLine"](
             filename, result_filename, handle, encrypt, scan_mode
         )
 
@@ -283,7 +321,7 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: 成功扫描到问题的文件数
         """
-        return self.get_func("KS_ScanStat", [c_char_p, c_int], c_int)(result_file, handle)
+        return self.funcs["KS_ScanStat"](result_file, handle)
 
     @NLPIRBase.byte_str_transform
     def scan_dir(
@@ -308,7 +346,7 @@ class KeyScanner(NLPIRBase):
         :param scan_mode:
         :return: 成功扫描到问题的文件数
         """
-        return self.get_func("KS_ScanDir", [c_char_p, c_char_p, c_char_p, c_int, c_int, c_int], c_int)(
+        return self.funcs["KS_ScanDir"](
             input_dir_path, result_path, filter, thread_count, encrypt, scan_mode
         )
 
@@ -320,7 +358,7 @@ class KeyScanner(NLPIRBase):
         :param path:
         :return:
         """
-        return self.get_func("KS_MergeResult", [c_char_p], None)(path)
+        return self.funcs["KS_MergeResult"](path)
 
     @NLPIRBase.byte_str_transform
     def scan_add_stat(self, result_file: str, handle: int) -> int:
@@ -331,7 +369,7 @@ class KeyScanner(NLPIRBase):
         :param handle:
         :return:
         """
-        return self.get_func("KS_ScanAddStat", [c_char_p, c_int], c_int)(result_file, handle)
+        return self.funcs["KS_ScanAddStat"](result_file, handle)
 
     @NLPIRBase.byte_str_transform
     def stat_result_filter(self, input_filename: str, result_filename: str, threshold: float = 5.0) -> int:
@@ -345,7 +383,7 @@ class KeyScanner(NLPIRBase):
         :param threshold: 不良得分的阈值
         :return: 成功扫描到问题的文件数
         """
-        return self.get_func("KS_StatResultFilter", [c_char_p, c_char_p, c_float], c_int)(
+        return self.funcs["KS_StatResultFilter"](
             input_filename, result_filename, c_float(threshold))
 
     @NLPIRBase.byte_str_transform
@@ -360,7 +398,7 @@ class KeyScanner(NLPIRBase):
         :param threshold: 不良得分的阈值
         :return: 成功扫描到问题的文件数
         """
-        return self.get_func("KS_ScanResultFilter", [c_char_p, c_char_p, c_float], c_int)(
+        return self.funcs["KS_ScanResultFilter"](
             input_filename, result_filename, c_float(threshold))
 
     @NLPIRBase.byte_str_transform
@@ -374,7 +412,7 @@ class KeyScanner(NLPIRBase):
         :param result_path: 输出结果的文件夹路径
         :return:
         """
-        return self.get_func("KS_Decrypt", [c_char_p, c_char_p], c_int)(input_dir_path, result_path)
+        return self.funcs["KS_Decrypt"](input_dir_path, result_path)
 
     @NLPIRBase.byte_str_transform
     def export_dict(self, filename: str, handle: int = 0) -> int:
@@ -393,4 +431,4 @@ class KeyScanner(NLPIRBase):
         :param handle: handle of KeyScanner
         :return: The number of lexical entry imported successfully  成功导入的词典条数
         """
-        return self.get_func("KS_ExportDict", [c_char_p, c_int], c_int)(filename, handle)
+        return self.funcs["KS_ExportDict"](filename, handle)
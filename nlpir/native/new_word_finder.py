@@ -6,6 +6,21 @@ from ctypes import c_bool, c_char_p, c_int, c_uint, c_ulong
 
 class NewWordFinder(NLPIRBase):
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "NWF_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "NWF_Exit": ([], c_bool),
+        "NWF_GetNewWords": ([c_char_p, c_int, c_int], c_char_p),
+        "NWF_GetFileNewWords": ([c_char_p, c_int, c_int], c_char_p),
+        "NWF_Batch_Start": ([], c_int),
+        "NWF_Batch_AddFile": ([c_char_p], c_ulong),
+        "NWF_Batch_AddMem": ([c_char_p], c_ulong),
+        "NWF_Batch_Complete": ([], c_int),
+        "NWF_Batch_GetResult": ([c_bool], c_char_p),
+        "NWF_Result2UserDict": ([], c_uint),
+        "NWF_GetLastErrorMsg": ([], c_char_p),
+    }
+
     @property
     def dll_name(self) -> str:
         return "NewWordFinder"
@@ -20,7 +35,7 @@ class NewWordFinder(NLPIRBase):
         :param str license_code:
         :return: 1 success 0 fail
         """
-        return self.get_func("NWF_Init", [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["NWF_Init"](data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -29,7 +44,7 @@ class NewWordFinder(NLPIRBase):
 
         :return: exit success or not
         """
-        return self.get_func("NWF_Exit", [None], c_bool)()
+        return self.funcs["NWF_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_new_words(
@@ -78,7 +93,26 @@ class NewWordFinder(NLPIRBase):
             ]
 
         """
-        return self.get_func("NWF_GetNewWords", [c_char_p, c_int, c_int], c_char_p)(line, max_key_limit, format_opt)
+        return self.funcs["NWF_GetNewWords"](line, max_key_limit, format_opt)
+
+    @NLPIRBase.byte_buffer_transform
+    def get_new_words_bytes(
+            self,
+            line: bytes,
+            max_key_limit: int = 50,
+            format_opt: int = nlpir_base.OUTPUT_FORMAT_SHARP
+    ) -> bytes:
+        """
+        Call **NWF_GetNewWords**
+
+        Same as :func:`get_new_words`, take and return bytes without transcoding
+
+        :param bytes line: the encoded input paragraph
+        :param int max_key_limit: maximum of key words, up to 50
+        :param int format_opt: same as :func:`get_new_words`
+        :return: new words list in bytes
+        """
+        return self.funcs["NWF_GetNewWords"](line, max_key_limit, format_opt)
 
     @NLPIRBase.byte_str_transform
     def get_file_new_words(
@@ -97,7 +131,7 @@ class NewWordFinder(NLPIRBase):
         :param int format_opt: same as :func:`get_new_words`
         :return: same as :func:`get_new_words`
         """
-        return self.get_func("NWF_GetFileNewWords", [c_char_p, c_int, c_int], c_char_p)(
+        return self.funcs["NWF_GetFileNewWords"](
             file_name,
             max_key_limit,
             format_opt
@@ -118,7 +152,7 @@ class NewWordFinder(NLPIRBase):
 
         :return: true:success, false:fail
         """
-        return self.get_func("NWF_Batch_Start", [None], c_int)()
+        return self.funcs["NWF_Batch_Start"]()
 
     @NLPIRBase.byte_str_transform
     def batch_addfile(self, filename: str) -> int:
@@ -130,7 +164,7 @@ class NewWordFinder(NLPIRBase):
         :param str filename: the path of file
         :return: 1 success 0 fail
         """
-        return self.get_func("NWF_Batch_AddFile", [c_char_p], c_ulong)(filename)
+        return self.funcs["NWF_Batch_AddFile"](filename)
 
     @NLPIRBase.byte_str_transform
     def batch_addmen(self, text: str) -> int:
@@ -142,7 +176,7 @@ class NewWordFinder(NLPIRBase):
         :param str text: text string
         :return: 1 success 0 fail
         """
-        return self.get_func("NWF_Batch_AddMem", [c_char_p], c_ulong)(text)
+        return self.funcs["NWF_Batch_AddMem"](text)
 
     @NLPIRBase.byte_str_transform
     def batch_complete(self) -> int:
@@ -153,7 +187,7 @@ class NewWordFinder(NLPIRBase):
 
         :return: 1 success 0 fail
         """
-        return self.get_func("NWF_Batch_Complete", None, c_int)()
+        return self.funcs["NWF_Batch_Complete"]()
 
     @NLPIRBase.byte_str_transform
     def batch_getresult(self, format_json: bool = False) -> str:
@@ -185,7 +219,7 @@ class NewWordFinder(NLPIRBase):
             ]
 
         """
-        return self.get_func("NWF_Batch_GetResult", [c_bool], c_char_p)(format_json)
+        return self.funcs["NWF_Batch_GetResult"](format_json)
 
     @NLPIRBase.byte_str_transform
     def result2user_dict(self) -> int:
@@ -197,8 +231,8 @@ class NewWordFinder(NLPIRBase):
 
         :return: bool, true:success, false:fail
         """
-        return self.get_func("NWF_Result2UserDict", None, c_uint)()
+        return self.funcs["NWF_Result2UserDict"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
-        return self.get_func("NWF_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["NWF_GetLastErrorMsg"]()
@@ -7,6 +7,7 @@ import ctypes
 import typing
 import functools
 import threading
+import time
 from abc import ABC
 from ctypes import c_int
 from nlpir import PACKAGE_DIR
@@ -34,6 +35,76 @@ OUTPUT_FORMAT_JSON = 1  #: 正常的JSON字符串输出新词结果
 OUTPUT_FORMAT_EXCEL = 2  #: 正常的CSV字符串输出新词结果,保存为csv格式即可采用Excel打开
 
 
+class NativeFunctions(dict):
+    """
+    组件导出函数表, 以函数名为键保存已经解析并设置好 ``argtypes`` 和 ``restype`` 的动态库函数,
+    调用时只需一次字典查找. 未在 :attr:`NLPIRBase.exported_functions` 中声明的函数在首次访问时
+    从动态库中解析并缓存, 不设置参数类型.
+
+    设置了调用钩子(call hooks)时, 表中保存的是包装后的函数, 每次调用后以
+    ``hook(component, function, args, result, seconds)`` 的形式调用所有钩子; 没有钩子时直接保存动态库函数,
+    不产生额外开销.
+
+    A table of the exported functions of a dynamic link library, keyed by the function name.
+
+    :param ctypes.CDLL lib: the loaded dynamic link library
+    :param str component: name of the component, passed to the call hooks
+    """
+
+    def __init__(self, lib: ctypes.CDLL, component: str = ""):
+        super().__init__()
+        self.lib = lib
+        self.component = component
+        #: functions without hooks
+        self.raw: typing.Dict[str, typing.Callable] = dict()
+        self.hooks: typing.List[typing.Callable] = list()
+
+    def __missing__(self, name: str) -> typing.Callable:
+        self.bind(name, getattr(self.lib, name))
+        return self[name]
+
+    def bind(self, name: str, func: typing.Callable) -> None:
+        """
+        Add a function to the table, wrap it if there are call hooks
+
+        :param name: name of the function
+        :param func: the function resolved from the library
+        """
+        self.raw[name] = func
+        self[name] = self.wrap(name, func) if self.hooks else func
+
+    def set_hooks(self, hooks: typing.Iterable[typing.Callable]) -> None:
+        """
+        Replace the call hooks and rewrap all functions in the table
+
+        :param hooks: callables like ``hook(component, function, args, result, seconds)``
+        """
+        self.hooks = list(hooks)
+        for name, func in self.raw.items():
+            self[name] = self.wrap(name, func) if self.hooks else func
+
+    def wrap(self, name: str, func: typing.Callable) -> typing.Callable:
+        """
+        :param name: name of the function
+        :param func: the function resolved from the library
+        :return: a function calls ``func`` and then all the call hooks with the time cost of ``func``
+        """
+        hooks = self.hooks
+        component = self.component
+        perf_counter = time.perf_counter
+
+        def hooked(*args):
+            start = perf_counter()
+            result = func(*args)
+            seconds = perf_counter() - start
+            for hook in hooks:
+                hook(component, name, args, result, seconds)
+            return result
+
+        hooked.__wrapped__ = func
+        return hooked
+
+
 class NLPIRBase(ABC):
     """
     抽象类,作为各种NLPIR组件的基类,提供加载DLL等功能,大部分代码借鉴于pynlpir项目
@@ -72,6 +143,28 @@ class NLPIRBase(ABC):
     #: lazy load DLL ,not supported for window, will be None on OS: windows
     RTLD_LAZY = os.RTLD_LAZY if hasattr(os, "RTLD_LAZY") else None
 
+    #: The functions exported by the dynamic link library which are used by the component,
+    #: ``{name: (argtypes, restype)}``, will be resolved and typed once when the instance is created,
+    #: see :func:`bind_functions`
+    exported_functions: typing.Dict[str, typing.Tuple[typing.Optional[list], typing.Any]] = dict()
+
+    #: Callables called after every native call of all components, like
+    #: ``hook(component, function, args, result, seconds)``, use :func:`add_call_hook` to change it
+    call_hooks: typing.List[typing.Callable] = list()
+
+    #: 用户词典的版本, 每次通过组件添加, 删除, 导入, 清空用户词典后加一, 作为结果缓存的键的一部分
+    #: version of the user dictionaries of the instance, increased after every change, used in the result cache key
+    user_dict_version: int = 0
+    #: 首次修改用户词典时生成的随机标识, 使得不同进程中未保存的修改不会得到相同的缓存键
+    #: a random token set at the first change of the user dictionaries, so the unsaved changes in different
+    #: processes never share a result cache key in a persistent cache
+    user_dict_session: typing.Optional[str] = None
+    #: 由 :class:`nlpir.user_dict.UserDictManager` 设置的 ``(词典版本, 设置时的 user_dict_version)`` ,
+    #: 此后用户词典没有其他修改时, 结果缓存的键使用词典版本, 使得使用相同词典的进程共享缓存
+    #: ``(version, user_dict_version)`` set by :class:`nlpir.user_dict.UserDictManager` , the result cache key uses
+    #: the version of the dictionaries until they are changed by other ways
+    user_dict_tag: typing.Optional[typing.Tuple[str, int]] = None
+
     __instance_lock__ = threading.Lock()
 
     # 函数泛型, 用于支持在使用装饰器时, 目标函数获取正确的参数值
@@ -116,6 +209,51 @@ class NLPIRBase(ABC):
 
         return wraps
 
+    @staticmethod
+    def byte_buffer_transform(func: __T__) -> __T__:
+        """
+        一个包装器,作为装饰器使用,与 :func:`byte_str_transform` 相对,用于直接接收和返回 bytes 的函数,
+        不进行任何编码转换. 参数中的 :class:`bytes` 直接传递给动态链接库, :class:`bytearray` 和 :class:`memoryview`
+        转换为 :class:`bytes` (复制一次内存,不进行转码), 返回值保持原样.
+
+        A wraps for the raw API which takes and returns bytes encoded in the component's encoding,
+        ``bytearray`` and ``memoryview`` arguments are copied to ``bytes`` without transcoding.
+
+        :param func: function
+        """
+
+        @functools.wraps(func)
+        def wraps(self, *args, **kwargs):
+            args = [bytes(arg) if isinstance(arg, (bytearray, memoryview)) else arg for arg in args]
+            for k in kwargs:
+                if isinstance(kwargs[k], (bytearray, memoryview)):
+                    kwargs[k] = bytes(kwargs[k])
+            return func(self, *args, **kwargs)
+
+        return wraps
+
+    @staticmethod
+    def user_dict_change(func: __T__) -> __T__:
+        """
+        一个包装器,作为装饰器使用,用于修改用户词典的函数,调用后增加 :attr:`user_dict_version` ,
+        使得之前缓存的结果失效.
+
+        A wraps for the functions change the user dictionaries, increase :attr:`user_dict_version` after the call.
+
+        :param func: function
+        """
+
+        @functools.wraps(func)
+        def wraps(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                if self.user_dict_session is None:
+                    self.user_dict_session = os.urandom(8).hex()
+                self.user_dict_version += 1
+
+        return wraps
+
     def __new__(cls, *args, **kwargs):
         if not hasattr(cls, '__instance__'):
             with cls.__instance_lock__:
@@ -135,6 +273,7 @@ class NLPIRBase(ABC):
             return
         self.LIB_DIR = os.path.join(PACKAGE_DIR, 'lib') if lib_path is None else lib_path
         self.lib_nlpir, self.lib_path = self.load_library(platform.uname())
+        self.funcs: NativeFunctions = self.bind_functions(self.lib_nlpir)
         self.encode: str = self.encode_map[encode]
         self.encode_nlpir = encode
         self.data_path = PACKAGE_DIR if data_path is None else data_path
@@ -170,6 +309,18 @@ class NLPIRBase(ABC):
         """
         raise NotImplementedError
 
+    def get_cache_config(self) -> tuple:
+        """
+        The settings of the instance which change the results of the component, used in the result cache key,
+        see :mod:`nlpir.cache`
+
+        :return: ``(encode, user_dict_version, user_dict_session)`` , or ``(encode, version, None)`` with the version
+            of :attr:`user_dict_tag` if the user dictionaries are not changed since it is set
+        """
+        if self.user_dict_tag is not None and self.user_dict_tag[1] == self.user_dict_version:
+            return self.encode_nlpir, self.user_dict_tag[0], None
+        return self.encode_nlpir, self.user_dict_version, self.user_dict_session
+
     def get_dll_path(self, uname: platform.uname_result, lib_dir: str, is_64bit: bool) -> str:
         """
         :param platform.uname_result uname: The platform identifier for the user's system.
@@ -245,29 +396,101 @@ class NLPIRBase(ABC):
         self.logger.debug("{} library file '{}' loaded.".format(self.dll_name, lib))
         return lib_nlpir, lib
 
+    def bind_functions(self, lib: ctypes.CDLL) -> NativeFunctions:
+        """
+        Resolve all functions declared in :attr:`exported_functions` from the library, set their
+        ``argtypes`` and ``restype`` and store them in a :class:`NativeFunctions` table, so the wrapper
+        methods can call ``self.funcs[name](...)`` without looking up the function every time.
+
+        动态库中不存在的函数会被跳过(部分函数仅在某些平台的动态库中提供), 在调用时再抛出 :class:`AttributeError`
+
+        :param ctypes.CDLL lib: the loaded dynamic link library
+        :return: the table of exported functions
+        """
+        funcs = NativeFunctions(lib, self.dll_name)
+        funcs.set_hooks(self.call_hooks)
+        for name, (argtypes, restype) in self.exported_functions.items():
+            try:
+                funcs.bind(name, self.get_func(name, argtypes, restype, lib=lib))
+            except AttributeError:
+                self.logger.debug("NLPIR API function '{}' not found in '{}'".format(name, self.dll_name))
+        return funcs
+
+    @classmethod
+    def instances(cls) -> typing.Iterator["NLPIRBase"]:
+        """
+        :return: the initialized instances of all components in current process
+        """
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            classes.extend(klass.__subclasses__())
+            instance = klass.__dict__.get("__instance__")
+            if instance is not None and hasattr(instance, "funcs"):
+                yield instance
+
+    @staticmethod
+    def add_call_hook(hook: typing.Callable) -> None:
+        """
+        Add a hook called after every native call of all components, include the initialized ones.
+        A hook is a callable like ``hook(component, function, args, result, seconds)``:
+
+        - ``component``: :attr:`dll_name` of the component
+        - ``function``: name of the exported function, like ``NLPIR_ParagraphProcess``
+        - ``args``: arguments passed to the function, str has been encoded to bytes
+        - ``result``: return value of the function
+        - ``seconds``: time cost of the call
+
+        Hooks are called in the calling thread, keep them fast and thread safe.
+        There is no overhead on the native calls if no hook is added.
+
+        :param hook: the hook
+        """
+        if hook not in NLPIRBase.call_hooks:
+            NLPIRBase.call_hooks.append(hook)
+        for instance in NLPIRBase.instances():
+            instance.funcs.set_hooks(NLPIRBase.call_hooks)
+
+    @staticmethod
+    def remove_call_hook(hook: typing.Callable) -> None:
+        """
+        Remove a hook added by :func:`add_call_hook`, do nothing if not added
+
+        :param hook: the hook
+        """
+        if hook in NLPIRBase.call_hooks:
+            NLPIRBase.call_hooks.remove(hook)
+        for instance in NLPIRBase.instances():
+            instance.funcs.set_hooks(NLPIRBase.call_hooks)
+
     def get_func(
             self,
             name: str,
             argtypes: typing.Optional[list] = None,
-            restype: typing.Any = c_int
+            restype: typing.Any = c_int,
+            lib: typing.Optional[ctypes.CDLL] = None
     ) -> typing.Callable:
         """Retrieves the corresponding NLPIR function.
 
+        The component already holds the functions declared in :attr:`exported_functions` in
+        :attr:`funcs`, this function is used to bind them or get a function not declared.
+
         :param str name: The name of the NLPIR function to get.
         :param list argtypes: A list of :mod:`ctypes` data types that correspond
             to the function's argument types.
         :param ctypes restype: A :mod:`ctypes` data type that corresponds to the
             function's return type (only needed if the return type isn't
             :class:`ctypes.c_int`).
+        :param ctypes.CDLL lib: the library to get the function, default is :attr:`lib_nlpir`
         :return: The exported function. It can be called like any other Python
             callable.
         :rtype: Callable Function
         """
         self.logger.debug("Getting NLPIR API function: 'name': '{}', 'argtypes': '{}',"
                           " 'restype': '{}'.".format(name, argtypes, restype))
-        func = getattr(self.lib_nlpir, name)
+        func = getattr(self.lib_nlpir if lib is None else lib, name)
         if argtypes is not None:
-            func.arg_types = argtypes
+            func.argtypes = argtypes
         if restype is not c_int:
             func.restype = restype
         self.logger.debug("NLPIR API function '{}' retrieved.".format(name))
@@ -1,11 +1,24 @@
 # coding=utf-8
 from nlpir.native.nlpir_base import NLPIRBase, UTF8_CODE, PACKAGE_DIR
-from ctypes import c_bool, c_char_p, c_double, c_int, byref, create_string_buffer
+from ctypes import c_bool, c_char_p, c_double, c_int, create_string_buffer
 import typing
 import os
 
 
 class SentimentNew(NLPIRBase):
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "ST_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "ST_Exit": ([], c_int),
+        "ST_GetLastErrorMsg": ([], c_char_p),
+        "ST_GetOneObjectResult": ([c_char_p, c_char_p, c_char_p], c_char_p),
+        "ST_GetMultiObjectResult": ([c_char_p, c_char_p, c_char_p], c_char_p),
+        "ST_GetSentencePoint": ([c_char_p], c_char_p),
+        "ST_GetSentimentPoint": ([c_char_p], c_double),
+        "ST_ImportUserDict": ([c_char_p, c_bool], c_int),
+        "ST_ProcesDir": ([c_char_p], c_char_p),
+    }
+
     @property
     def dll_name(self):
         return "SentimentNew"
@@ -31,7 +44,7 @@ class SentimentNew(NLPIRBase):
         :param license_code:
         :return:
         """
-        return self.get_func("ST_Init", [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["ST_Init"](data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -40,7 +53,7 @@ class SentimentNew(NLPIRBase):
 
         :return:
         """
-        return self.get_func("ST_Exit", None, c_int)()
+        return self.funcs["ST_Exit"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -49,7 +62,7 @@ class SentimentNew(NLPIRBase):
 
         :return:
         """
-        return self.get_func("ST_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["ST_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def get_one_object_result(self, title: str, content: str, analysis_object: str) -> str:
@@ -61,7 +74,7 @@ class SentimentNew(NLPIRBase):
         :param analysis_object:
         :return:
         """
-        return self.get_func("ST_GetOneObjectResult", [c_char_p, c_char_p, c_char_p], c_char_p)(
+        return self.funcs["ST_GetOneObjectResult"](
             title,
             content,
             analysis_object
@@ -77,7 +90,7 @@ class SentimentNew(NLPIRBase):
         :param object_rule_file: see Appendix II: Multiple Object configure sample
         :return:
         """
-        return self.get_func("ST_GetMultiObjectResult", [c_char_p, c_char_p, c_char_p], c_char_p)(
+        return self.funcs["ST_GetMultiObjectResult"](
             title, content, object_rule_file
         )
 
@@ -92,7 +105,7 @@ class SentimentNew(NLPIRBase):
         :param sentence:
         :return:  double,Sentimental point
         """
-        return self.get_func("ST_GetSentencePoint", [c_char_p], c_char_p)(sentence)
+        return self.funcs["ST_GetSentencePoint"](sentence)
 
     @NLPIRBase.byte_str_transform
     def get_sentiment_point(self, sentence: str) -> float:
@@ -105,8 +118,21 @@ class SentimentNew(NLPIRBase):
         :param sentence:
         :return:  double,Sentimental point
         """
-        return self.get_func("ST_GetSentimentPoint", [c_char_p], c_double)(sentence)
+        return self.funcs["ST_GetSentimentPoint"](sentence)
+
+    @NLPIRBase.byte_buffer_transform
+    def get_sentiment_point_bytes(self, sentence: bytes) -> float:
+        """
+        Call **ST_GetSentimentPoint**
+
+        Same as :func:`get_sentiment_point`, take bytes without transcoding
+
+        :param sentence: encoded sentence
+        :return:  double,Sentimental point
+        """
+        return self.funcs["ST_GetSentimentPoint"](sentence)
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_user_dict(self, filename: str, over_write: bool = False) -> int:
         """
@@ -118,7 +144,7 @@ class SentimentNew(NLPIRBase):
         :param over_write:
         :return:
         """
-        return self.get_func("ST_ImportUserDict", [c_char_p, c_bool], c_int)(filename, over_write)
+        return self.funcs["ST_ImportUserDict"](filename, over_write)
 
     @NLPIRBase.byte_str_transform
     def process_dir(self, path: str) -> str:
@@ -130,7 +156,7 @@ class SentimentNew(NLPIRBase):
         :param path:
         :return: path目录下, 自动生成 ``SentimentRankResult.xls``,返回该文件的全路径名称
         """
-        return self.get_func("ST_ProcesDir", [c_char_p], c_char_p)(path)
+        return self.funcs["ST_ProcesDir"](path)
 
 
 class SentimentAnalysis(NLPIRBase):
@@ -142,6 +168,18 @@ class SentimentAnalysis(NLPIRBase):
     EMOTION_EVIL = 5
     EMOTION_SURPRISE = 6
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "LJST_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "LJST_Exits": ([], c_bool),
+        "LJST_GetLastErrorMsg": ([], c_char_p),
+        "LJST_GetParagraphSent": ([c_char_p, c_char_p], c_bool),
+        "LJST_GetFileSent": ([c_char_p, c_char_p], c_bool),
+        "LJST_ImportUserDict": ([c_char_p, c_bool], c_int),
+        "LJST_GetParagraphSentE": ([c_char_p], c_char_p),
+        "LJST_GetFileSentE": ([c_char_p], c_char_p),
+    }
+
     @property
     def dll_name(self):
         return "LJSentimentAnalysis"
@@ -167,7 +205,7 @@ class SentimentAnalysis(NLPIRBase):
         :param license_code:
         :return:
         """
-        return self.get_func("LJST_Init", [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["LJST_Init"](data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -176,7 +214,7 @@ class SentimentAnalysis(NLPIRBase):
 
         :return:
         """
-        return self.get_func("LJST_Exits", None, c_bool)()
+        return self.funcs["LJST_Exits"]()
 
     @NLPIRBase.byte_str_transform
     def get_last_error_msg(self) -> str:
@@ -184,7 +222,7 @@ class SentimentAnalysis(NLPIRBase):
 
         :return:
         """
-        return self.get_func("LJST_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["LJST_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def get_paragraph_sent(self, paragraph: str) -> typing.Tuple[bool, str]:
@@ -197,7 +235,7 @@ class SentimentAnalysis(NLPIRBase):
         :return:
         """
         result = create_string_buffer(10240)
-        result_bool = self.get_func("LJST_GetParagraphSent", [c_char_p, c_char_p], c_bool)(paragraph, result)
+        result_bool = self.funcs["LJST_GetParagraphSent"](paragraph, result)
         return result_bool, result.value
 
     @NLPIRBase.byte_str_transform
@@ -211,9 +249,10 @@ class SentimentAnalysis(NLPIRBase):
         :return:
         """
         result = create_string_buffer(10240)
-        result_bool = self.get_func("LJST_GetFileSent", [c_char_p, c_char_p], c_bool)(filename, byref(result))
+        result_bool = self.funcs["LJST_GetFileSent"](filename, result)
         return result_bool, result.value
 
+    @NLPIRBase.user_dict_change
     @NLPIRBase.byte_str_transform
     def import_user_dict(self, filename: str, over_write: bool = False):
         """
@@ -225,7 +264,7 @@ class SentimentAnalysis(NLPIRBase):
         :param over_write:
         :return:
         """
-        return self.get_func("LJST_ImportUserDict", [c_char_p, c_bool], c_int)(filename, over_write)
+        return self.funcs["LJST_ImportUserDict"](filename, over_write)
 
     @NLPIRBase.byte_str_transform
     def get_paragraph_sent_e(self, paragraph: str) -> str:
@@ -237,7 +276,19 @@ class SentimentAnalysis(NLPIRBase):
         :param paragraph:
         :return:
         """
-        return self.get_func("LJST_GetParagraphSentE", [c_char_p], c_char_p)(paragraph)
+        return self.funcs["LJST_GetParagraphSentE"](paragraph)
+
+    @NLPIRBase.byte_buffer_transform
+    def get_paragraph_sent_e_bytes(self, paragraph: bytes) -> bytes:
+        """
+        Call **LJST_GetParagraphSentE**
+
+        Same as :func:`get_paragraph_sent_e`, take and return bytes without transcoding
+
+        :param paragraph: encoded paragraph
+        :return:
+        """
+        return self.funcs["LJST_GetParagraphSentE"](paragraph)
 
     @NLPIRBase.byte_str_transform
     def get_file_sent_e(self, filename: str) -> str:
@@ -249,4 +300,4 @@ class SentimentAnalysis(NLPIRBase):
         :param filename:
         :return:
         """
-        return self.get_func("LJST_GetFileSentE", [c_char_p], c_bool)(filename)
+        return self.funcs["LJST_GetFileSentE"](filename)
@@ -0,0 +1,208 @@
+# coding=utf-8
+"""
+Slow native call recorder
+
+当动态库函数单次调用耗时超过阈值时, 记录函数名, 耗时, 输入长度, 输入内容的哈希, 以及可选的输入内容本身,
+写入一个有界的记录文件, 用于复现和回放特别慢的输入(例如 ``NLPIR_ParagraphProcess``, ``DS_SingleDocE``).
+
+Record the native calls exceed a threshold to a bounded file, so the slow inputs can be
+reproduced and replayed by ``python -m benchmarks.replay_slow_calls``.
+
+Example::
+
+    from nlpir.native import slow_call
+
+    recorder = slow_call.enable("slow_calls.jsonl", threshold=0.5, capture_input=True)
+    ...
+    slow_call.disable(recorder)
+    for record in slow_call.load_records("slow_calls.jsonl"):
+        print(record["function"], record["seconds"], record["sha1"])
+
+The file is in JSON lines format, one record per line::
+
+    {"time": 1700000000.0, "pid": 123, "component": "NLPIR", "function": "NLPIR_ParagraphProcess",
+     "seconds": 1.2, "input_bytes": 1048576, "sha1": "...", "args": [{"b64": "..."}, 1]}
+
+``args`` only exists if ``capture_input`` is set, bytes are base64 encoded as ``{"b64": ...}``,
+numbers and None are kept, other arguments like ctypes buffers are saved as ``{"repr": ...}`` and
+can not be replayed.
+"""
+import base64
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+import typing
+from nlpir.native.nlpir_base import NLPIRBase
+
+#: Default threshold in seconds
+DEFAULT_THRESHOLD = 1.0
+#: Default number of records kept in the file
+DEFAULT_MAX_RECORDS = 1000
+
+
+def encode_args(args: tuple) -> list:
+    """
+    :param args: arguments of a native call
+    :return: JSON serializable arguments, see the module description
+    """
+    result = []
+    for arg in args:
+        if isinstance(arg, bytes):
+            result.append({"b64": base64.b64encode(arg).decode("ascii")})
+        elif arg is None or isinstance(arg, (bool, int, float)):
+            result.append(arg)
+        else:
+            result.append({"repr": repr(arg)})
+    return result
+
+
+def decode_args(args: list) -> tuple:
+    """
+    :param args: arguments encoded by :func:`encode_args`
+    :return: arguments can be passed to the native function
+    :raises ValueError: some of the arguments can not be replayed
+    """
+    result = []
+    for arg in args:
+        if isinstance(arg, dict):
+            if "b64" not in arg:
+                raise ValueError(f"Argument {arg['repr']} can not be replayed")
+            result.append(base64.b64decode(arg["b64"]))
+        else:
+            result.append(arg)
+    return tuple(result)
+
+
+def load_records(path: str) -> typing.List[dict]:
+    """
+    Read the records, broken lines (may be written by a killed process) are skipped
+
+    :param path: path of the record file
+    :return: records from old to new
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+class SlowCallRecorder:
+    """
+    A call hook of :class:`nlpir.native.nlpir_base.NLPIRBase` records the slow native calls to a file,
+    add it by :func:`enable` or :func:`nlpir.native.nlpir_base.NLPIRBase.add_call_hook` .
+
+    The file works as a ring buffer: records are appended, when the file has ``2 * max_records`` lines
+    it is rewritten with the latest ``max_records`` ones, so the size of the file is bounded and
+    the cost of writing is constant on average.
+
+    :param path: path of the record file, ``{pid}`` in it is replaced by the process id, so every
+        worker of :class:`nlpir.pool.Pool` writes its own file
+    :param threshold: record the calls cost more than it, in seconds
+    :param max_records: number of latest records to keep
+    :param capture_input: save the arguments for replaying, the file may be large if the inputs are large
+    :param functions: only record these native functions, like ``["NLPIR_ParagraphProcess"]`` , None for all
+    """
+
+    def __init__(
+            self,
+            path: str,
+            threshold: float = DEFAULT_THRESHOLD,
+            max_records: int = DEFAULT_MAX_RECORDS,
+            capture_input: bool = False,
+            functions: typing.Optional[typing.Iterable[str]] = None
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.max_records = max_records
+        self.capture_input = capture_input
+        self.functions = None if functions is None else frozenset(functions)
+        self.lock = threading.Lock()
+        self.records: typing.Deque[str] = collections.deque(maxlen=max_records)
+        self.lines = 0
+        self.pid: typing.Optional[int] = None
+
+    def __call__(self, component: str, function: str, args: tuple, result: typing.Any, seconds: float) -> None:
+        if seconds < self.threshold or (self.functions is not None and function not in self.functions):
+            return
+        data = b"".join(arg for arg in args if isinstance(arg, bytes))
+        record = {
+            "time": time.time(),
+            "pid": os.getpid(),
+            "component": component,
+            "function": function,
+            "seconds": seconds,
+            "input_bytes": len(data),
+            "sha1": hashlib.sha1(data).hexdigest(),
+        }
+        if self.capture_input:
+            record["args"] = encode_args(args)
+        self.write(json.dumps(record, ensure_ascii=False))
+
+    def get_path(self) -> str:
+        """
+        :return: path of the record file of current process
+        """
+        return self.path.replace("{pid}", str(os.getpid()))
+
+    def write(self, line: str) -> None:
+        """
+        Append a record to the file, rewrite the file with the latest records if it is full
+
+        :param line: a JSON record
+        """
+        with self.lock:
+            path = self.get_path()
+            if self.pid != os.getpid():
+                # first record in this process, continue with the existing file
+                self.pid = os.getpid()
+                self.records.clear()
+                self.lines = 0
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as f:
+                        for record in f:
+                            self.records.append(record.rstrip("\n"))
+                            self.lines += 1
+            self.records.append(line)
+            self.lines += 1
+            if self.lines >= 2 * self.max_records:
+                tmp_path = f"{path}.{self.pid}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write("".join(record + "\n" for record in self.records))
+                os.replace(tmp_path, path)
+                self.lines = len(self.records)
+            else:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+
+
+def enable(
+        path: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        capture_input: bool = False,
+        functions: typing.Optional[typing.Iterable[str]] = None
+) -> SlowCallRecorder:
+    """
+    Start recording slow native calls of all components, see :class:`SlowCallRecorder` for the parameters
+
+    :return: the recorder
+    """
+    recorder = SlowCallRecorder(path, threshold, max_records, capture_input, functions)
+    NLPIRBase.add_call_hook(recorder)
+    return recorder
+
+
+def disable(recorder: SlowCallRecorder) -> None:
+    """
+    Stop recording slow native calls
+
+    :param recorder: the recorder returned by :func:`enable`
+    """
+    NLPIRBase.remove_call_hook(recorder)
@@ -6,6 +6,16 @@ from ctypes import c_char_p, c_int, c_float, create_string_buffer
 class Summary(NLPIRBase):
     load_mode = NLPIRBase.RTLD_LAZY
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "DS_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "DS_Exit": ([], None),
+        "DS_GetLastErrorMsg": ([], c_char_p),
+        "DS_SingleDoc": ([c_char_p, c_float, c_int, c_int, c_int], c_char_p),
+        "DS_SingleDocE": ([c_char_p, c_char_p, c_float, c_int, c_int, c_int], c_int),
+        "DS_FileProcess": ([c_char_p, c_float, c_int, c_int, c_int], c_char_p),
+    }
+
     @property
     def dll_name(self):
         return "LJSummary"
@@ -20,7 +30,7 @@ class Summary(NLPIRBase):
         :param license_code:
         :return:
         """
-        return self.get_func("DS_Init", [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["DS_Init"](data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -29,7 +39,7 @@ class Summary(NLPIRBase):
 
         :return:
         """
-        self.get_func("DS_Exit", None, None)()
+        self.funcs["DS_Exit"]()
         return True
 
     @NLPIRBase.byte_str_transform
@@ -39,7 +49,7 @@ class Summary(NLPIRBase):
 
         :return:
         """
-        return self.get_func("DS_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["DS_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def single_doc(
@@ -63,7 +73,7 @@ class Summary(NLPIRBase):
         :param int sentence_count: 用户限定的句子数量 （为0则不限制）
         :return: 摘要字符串；出错返回空串 the summarization content, get null string if occurs error.
         """
-        return self.get_func("DS_SingleDoc", [c_char_p, c_float, c_int, c_int, c_int], c_char_p)(
+        return self.funcs["DS_SingleDoc"](
             text, c_float(sum_rate), sum_len, sentence_count, html_tag_remove
         )
 
@@ -92,7 +102,35 @@ class Summary(NLPIRBase):
         buffer_len = int(len(text) * 3 * (sum_rate if sum_rate > 0.0 else 1))
         buffer_len = sum_len if sum_len < buffer_len else buffer_len
         result = create_string_buffer(buffer_len * 4)
-        result_2 = self.get_func("DS_SingleDocE", [c_char_p, c_char_p, c_float, c_int, c_int])(
+        result_2 = self.funcs["DS_SingleDocE"](
+            result, text, c_float(sum_rate), sum_len, sentence_count, html_tag_remove
+        )
+        return result.value, result_2
+
+    @NLPIRBase.byte_buffer_transform
+    def single_doc_e_bytes(
+            self,
+            text: bytes,
+            sum_rate: float = 0.0,
+            sum_len: int = 500,
+            html_tag_remove: int = 0,
+            sentence_count: int = 0
+    ):
+        """
+        Call **DS_SingleDocE**
+
+        Same as :func:`single_doc_e`, take and return bytes without transcoding
+
+        :param bytes text: 编码后的文档内容 encoded text content
+        :param float sum_rate: same as :func:`single_doc_e`
+        :param int sum_len: same as :func:`single_doc_e`
+        :param bool html_tag_remove: same as :func:`single_doc_e`
+        :param int sentence_count: same as :func:`single_doc_e`
+        :return: 摘要 bytes 和返回值 the summarization content in bytes and the return value
+        """
+        # the summary is a part of the text, sum_len <= 0 is no limit
+        result = create_string_buffer((max(len(text), sum_len) + 1) * 4)
+        result_2 = self.funcs["DS_SingleDocE"](
             result, text, c_float(sum_rate), sum_len, sentence_count, html_tag_remove
         )
         return result.value, result_2
@@ -120,5 +158,5 @@ class Summary(NLPIRBase):
         :param int sentence_count: 用户限定的句子数量 （为0则不限制）
         :return: 摘要字符串；出错返回空串 the summarization content, get null string if occurs error.
         """
-        return self.get_func("DS_FileProcess", [c_char_p, c_float, c_int, c_int], c_char_p)(
+        return self.funcs["DS_FileProcess"](
             text_filename, c_float(sum_rate), sum_len, sentence_count, html_tag_remove)
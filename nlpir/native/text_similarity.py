@@ -9,6 +9,15 @@ SIM_MODEL_KEY = 3  #: 主题词模型，速度最慢，考虑语义最多，适
 
 class TextSimilarity(NLPIRBase):
 
+    #: Functions exported by the dynamic link library, see :attr:`nlpir.native.nlpir_base.NLPIRBase.exported_functions`
+    exported_functions = {
+        "TS_Init": ([c_char_p, c_int, c_char_p], c_int),
+        "TS_Exit": ([], None),
+        "TS_GetLastErrorMsg": ([], c_char_p),
+        "TS_ComputeSim": ([c_char_p, c_char_p, c_int], c_double),
+        "TS_ComputeSimFile": ([c_char_p, c_char_p, c_int], c_double),
+    }
+
     @property
     def dll_name(self):
         return "TextSimilarity"
@@ -23,7 +32,7 @@ class TextSimilarity(NLPIRBase):
         :param license_code:
         :return:
         """
-        return self.get_func("TS_Init", [c_char_p, c_int, c_char_p], c_int)(data_path, encode, license_code)
+        return self.funcs["TS_Init"](data_path, encode, license_code)
 
     @NLPIRBase.byte_str_transform
     def exit_lib(self) -> bool:
@@ -32,7 +41,7 @@ class TextSimilarity(NLPIRBase):
 
         :return:
         """
-        self.get_func("TS_Exit", None, None)()
+        self.funcs["TS_Exit"]()
         return True
 
     @NLPIRBase.byte_str_transform
@@ -42,7 +51,7 @@ class TextSimilarity(NLPIRBase):
 
         :return:
         """
-        return self.get_func("TS_GetLastErrorMsg", None, c_char_p)()
+        return self.funcs["TS_GetLastErrorMsg"]()
 
     @NLPIRBase.byte_str_transform
     def compute_sim(self, text_1: str, text_2: str, model: int = SIM_MODEL_WORD) -> float:
@@ -54,7 +63,21 @@ class TextSimilarity(NLPIRBase):
         :param model:
         :return:
         """
-        return self.get_func("TS_ComputeSim", [c_char_p, c_char_p, c_int], c_double)(text_1, text_2, model)
+        return self.funcs["TS_ComputeSim"](text_1, text_2, model)
+
+    @NLPIRBase.byte_buffer_transform
+    def compute_sim_bytes(self, text_1: bytes, text_2: bytes, model: int = SIM_MODEL_WORD) -> float:
+        """
+        Call **TS_ComputeSim**
+
+        Same as :func:`compute_sim`, take bytes without transcoding
+
+        :param text_1:
+        :param text_2:
+        :param model:
+        :return:
+        """
+        return self.funcs["TS_ComputeSim"](text_1, text_2, model)
 
     @NLPIRBase.byte_str_transform
     def compute_sim_file(self, filename_1: str, filename_2: str, model: int = SIM_MODEL_WORD) -> float:
@@ -66,4 +89,4 @@ class TextSimilarity(NLPIRBase):
         :param model:
         :return:
         """
-        return self.get_func("TS_ComputeSimFile", [c_char_p, c_char_p, c_int], c_double)(filename_1, filename_2, model)
+        return self.funcs["TS_ComputeSimFile"](filename_1, filename_2, model)
@@ -0,0 +1,407 @@
+#! coding=utf-8
+"""
+Multi-process worker pool for the high-level modules
+
+每个高层模块(:mod:`nlpir.ictclas`, :mod:`nlpir.key_extract`, :mod:`nlpir.summary` ...)在一个进程中只有一个
+组件实例, 使用 :class:`Pool` 可以启动多个工作进程, 在每个进程启动时按照主进程中 :func:`nlpir.init_setting`
+设置的参数初始化一次所需的组件, 之后通过 :func:`Pool.map`, :func:`Pool.imap`, :func:`Pool.submit` 调用任意高层函数.
+
+Example::
+
+    from nlpir import ictclas, key_extract
+    from nlpir.pool import Pool
+
+    with Pool([ictclas, key_extract], processes=8) as pool:
+        words = pool.map(ictclas.segment, texts, pos_tagged=True)
+        for keywords in pool.imap(key_extract.get_key_words, texts, max_key=10):
+            ...
+        result = pool.submit(ictclas.segment, text).get()
+
+传入的函数和参数需要可以被 :mod:`pickle` 序列化, 即模块级别的函数, 返回值也需要可以序列化并且不依赖工作进程中的
+组件状态, 例如 :func:`nlpir.doc_extractor.extract` 返回的 :class:`nlpir.doc_extractor.ExtractResult` 持有工作进程中的
+handle, 不能在主进程中使用.
+
+默认每个工作进程各自加载 ``Data`` 目录中的词典和模型. 使用 ``start_mode=START_MODE_FORK_AFTER_INIT`` 时,
+组件在主进程中初始化一次, 之后 fork 出工作进程, 已经加载的词典内存页以写时复制(copy-on-write)的方式在进程间共享,
+可以通过 :func:`Pool.memory_usage` 查看每个工作进程独占和共享的内存::
+
+    with Pool([ictclas], processes=32, start_mode=START_MODE_FORK_AFTER_INIT) as pool:
+        print(pool.memory_usage())
+
+使用 ``cache`` 参数可以在每个工作进程中开启结果缓存(见 :mod:`nlpir.cache`), 使用
+:class:`nlpir.cache.SharedMemoryCache` 时所有工作进程共享同一个缓存.
+
+修改用户词典后使用 :func:`Pool.reload` 滚动更新工作进程, 不需要停止服务: 先在主进程中更新并保存词典,
+然后启动一组新的工作进程加载新的词典, 之后提交的任务都由新的工作进程处理, 旧的工作进程处理完已提交的任务后退出.
+:func:`Pool.wait_reloaded` 等待所有旧的工作进程退出, 之后所有的结果都使用新的词典::
+
+    manager = UserDictManager(ictclas)
+    with Pool([ictclas], processes=8) as pool:
+        ...
+        pool.reload(lambda: manager.sync(words, version="2"), version="2")
+        pool.wait_reloaded()
+"""
+import functools
+import importlib
+import math
+import os
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.pool
+import threading
+import time
+import types
+import typing
+from nlpir.exception import NLPIRException
+from nlpir import cache as nlpir_cache
+
+__all__ = [
+    "Pool",
+    "DEFAULT_CHUNKSIZE",
+    "START_MODE_INIT_IN_WORKER",
+    "START_MODE_FORK_AFTER_INIT",
+    "get_memory_usage",
+]
+
+#: 每个工作进程启动后各自初始化组件 init components in every worker after it starts
+START_MODE_INIT_IN_WORKER = "init_in_worker"
+#: 在主进程中初始化组件后 fork 工作进程, 共享已加载的词典, 仅支持可以使用 fork 的系统
+#: init components in the parent process and fork workers, share the loaded dictionaries copy-on-write
+START_MODE_FORK_AFTER_INIT = "fork_after_init"
+
+#: Default number of inputs sent to a worker at once by :func:`Pool.imap` , if the length of inputs is unknown
+DEFAULT_CHUNKSIZE = 32
+
+# (module name, encode, lib_path, data_path, license_code)
+__Setting__ = typing.Tuple[str, int, typing.Optional[str], typing.Optional[str], typing.Optional[str]]
+
+
+def get_module_setting(module: typing.Union[types.ModuleType, str]) -> __Setting__:
+    """
+    Get the init setting of a high-level module in current process, which is set by :func:`nlpir.init_setting`
+
+    :param module: a high-level module or the name of it, like ``nlpir.ictclas`` or ``ictclas``
+    :return: setting can be sent to a worker
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module if module.startswith("nlpir.") else "nlpir." + module)
+    if not hasattr(module, "__cls__"):
+        raise ValueError(f"{module.__name__} is not a high-level module of nlpir")
+    return (
+        module.__name__,
+        module.__nlpir_encode__,
+        module.__lib__,
+        module.__data__,
+        module.__license_code__
+    )
+
+
+def init_modules(settings: typing.Iterable[__Setting__]) -> None:
+    """
+    Init the high-level modules with the given settings in current process, skip if already has an instance.
+    Used as the initializer of the workers.
+
+    :param settings: settings get from :func:`get_module_setting`
+    """
+    for name, encode, lib_path, data_path, license_code in settings:
+        module = importlib.import_module(name)
+        if module.__instance__ is not None:
+            continue
+        module.__nlpir_encode__ = encode
+        module.__lib__ = lib_path
+        module.__data__ = data_path
+        module.__license_code__ = license_code
+        module.get_native_instance()
+
+
+def init_worker(
+        settings: typing.Iterable[__Setting__],
+        cache: typing.Optional[nlpir_cache.Cache] = None,
+        cache_functions: typing.Optional[typing.List[str]] = None,
+        user_dict_tag: typing.Optional[str] = None
+) -> None:
+    """
+    The initializer of the workers, init the modules and enable the result cache
+
+    :param settings: settings get from :func:`get_module_setting`
+    :param cache: cache backend to enable in the worker, None to leave the cache disabled
+    :param cache_functions: functions to cache, see :func:`nlpir.cache.enable`
+    :param user_dict_tag: version of the user dictionaries given by :func:`Pool.reload` , used in the result cache key,
+        see :attr:`nlpir.native.nlpir_base.NLPIRBase.user_dict_tag`
+    """
+    settings = list(settings)
+    init_modules(settings)
+    if user_dict_tag is not None:
+        for name, *_ in settings:
+            instance = importlib.import_module(name).__instance__
+            instance.user_dict_tag = (user_dict_tag, instance.user_dict_version)
+    if cache is not None:
+        nlpir_cache.enable(cache_functions, cache)
+
+
+def get_memory_usage(pid: int) -> typing.Dict[str, int]:
+    """
+    Get the memory usage of a process from ``/proc/<pid>/smaps_rollup`` (or ``smaps`` on old kernels),
+    only available on Linux.
+
+    - ``rss``: resident memory, include the pages shared with other processes
+    - ``pss``: proportional set size, shared pages are divided by the number of processes sharing them
+    - ``uss``: unique set size, pages only used by this process
+    - ``shared``: resident pages shared with other processes
+
+    :param pid: process id
+    :return: memory usage in bytes
+    :raises NLPIRException: the memory usage is not available on this system
+    """
+    fields = {"Rss": 0, "Pss": 0, "Private_Clean": 0, "Private_Dirty": 0, "Shared_Clean": 0, "Shared_Dirty": 0}
+    for filename in ("smaps_rollup", "smaps"):
+        path = os.path.join("/proc", str(pid), filename)
+        if os.path.exists(path):
+            break
+    else:
+        raise NLPIRException(f"Can not get memory usage of process {pid}, /proc/{pid}/smaps not found")
+    with open(path) as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in fields:
+                fields[key] += int(value.split()[0]) * 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+        "shared": fields["Shared_Clean"] + fields["Shared_Dirty"],
+    }
+
+
+class Pool:
+    """
+    A pool of worker processes with high-level modules initialized once in every worker
+
+    :param modules: high-level modules (or the names of them) to init in every worker,
+        functions of other modules also can be used, the component will be initialized when first called
+    :param processes: number of workers, default is :func:`os.cpu_count`
+    :param chunksize: number of inputs sent to a worker at once, default is computed from the length
+        of inputs in :func:`map` , or :data:`DEFAULT_CHUNKSIZE` in :func:`imap`
+    :param context: multiprocessing context or the name of start method, like ``spawn``, ``fork``,
+        default is the default context of :mod:`multiprocessing`
+    :param maxtasksperchild: same as :class:`multiprocessing.pool.Pool`
+    :param start_mode: :data:`START_MODE_INIT_IN_WORKER` or :data:`START_MODE_FORK_AFTER_INIT` ,
+        the ``context`` is ignored and ``fork`` is used in the later one
+    :param cache: a result cache backend enabled in every worker, it is pickled and sent to the workers,
+        use :class:`nlpir.cache.SharedMemoryCache` or :class:`nlpir.cache.DiskCache` to share the results
+        among the workers, a :class:`nlpir.cache.MemoryCache` becomes an empty cache in every worker
+    :param cache_functions: functions to cache, default is all, see :func:`nlpir.cache.enable`
+    :raises NLPIRException: ``fork`` is not supported on this system when using :data:`START_MODE_FORK_AFTER_INIT`
+    """
+
+    def __init__(
+            self,
+            modules: typing.Iterable[typing.Union[types.ModuleType, str]],
+            processes: typing.Optional[int] = None,
+            chunksize: typing.Optional[int] = None,
+            context: typing.Union[None, str, multiprocessing.context.BaseContext] = None,
+            maxtasksperchild: typing.Optional[int] = None,
+            start_mode: str = START_MODE_INIT_IN_WORKER,
+            cache: typing.Optional[nlpir_cache.Cache] = None,
+            cache_functions: typing.Optional[typing.Iterable[str]] = None
+    ):
+        self.settings: typing.List[__Setting__] = [get_module_setting(module) for module in modules]
+        self.start_mode = start_mode
+        if start_mode == START_MODE_FORK_AFTER_INIT:
+            if "fork" not in multiprocessing.get_all_start_methods():
+                raise NLPIRException(f"{start_mode} is not supported on this system, fork is not available")
+            # load the dictionaries in the parent, workers get them by fork and skip init
+            init_modules(self.settings)
+            context = multiprocessing.get_context("fork")
+        elif start_mode != START_MODE_INIT_IN_WORKER:
+            raise NLPIRException(f"Unknown start mode {start_mode}")
+        if context is None or isinstance(context, str):
+            context = multiprocessing.get_context(context)
+        self.context = context
+        self.processes: int = processes if processes is not None else (multiprocessing.cpu_count() or 1)
+        self.chunksize = chunksize
+        self.maxtasksperchild = maxtasksperchild
+        self.cache = cache
+        self.cache_functions = None if cache_functions is None else list(cache_functions)
+        #: 工作进程的代数, 每次 :func:`reload` 后加一 generation of the workers, increased by :func:`reload`
+        self.generation = 0
+        #: 当前工作进程使用的词典版本, 由 :func:`reload` 设置 version of the dictionaries given to :func:`reload`
+        self.version: typing.Optional[str] = None
+        # old pools draining their tasks, and the threads joining them
+        self._draining: typing.List[typing.Tuple[multiprocessing.pool.Pool, threading.Thread]] = []
+        self._lock = threading.Lock()
+        self._pool = self.start_workers()
+
+    def start_workers(self, user_dict_tag: typing.Optional[str] = None) -> multiprocessing.pool.Pool:
+        """
+        :param user_dict_tag: see :func:`init_worker`
+        :return: a new group of workers
+        """
+        return self.context.Pool(
+            processes=self.processes,
+            initializer=init_worker,
+            initargs=(self.settings, self.cache, self.cache_functions, user_dict_tag),
+            maxtasksperchild=self.maxtasksperchild
+        )
+
+    def reload(
+            self,
+            prepare: typing.Optional[typing.Callable[[], typing.Any]] = None,
+            version: typing.Optional[str] = None
+    ) -> int:
+        """
+        Rolling reload of the workers after the user dictionaries are changed, see the module description.
+
+        ``prepare`` is called in the main process to update the dictionaries, e.g. by
+        :func:`nlpir.user_dict.UserDictManager.sync` , and the dictionaries must be saved to ``Data`` , so the new
+        workers load them at init, with :data:`START_MODE_FORK_AFTER_INIT` the new workers are forked after
+        ``prepare`` and get the dictionaries in memory of the main process.
+        Then new workers are started and get all tasks submitted after this call, the old workers finish their
+        tasks and exit, the results of the tasks submitted before are still available.
+
+        :param prepare: called in the main process before starting the new workers
+        :param version: version of the new dictionaries, used in the result cache key of the new workers,
+            so a shared cache never returns results of the old dictionaries, default is a random one
+        :return: the generation of the new workers
+        """
+        with self._lock:
+            if prepare is not None:
+                prepare()
+            pool = self.start_workers(f"pool:{os.urandom(8).hex() if version is None else version}")
+            old_pool, self._pool = self._pool, pool
+            self.generation += 1
+            self.version = version
+            # close lets the old workers finish the tasks in their queue before they exit
+            old_pool.close()
+            thread = threading.Thread(target=old_pool.join, daemon=True)
+            thread.start()
+            self._draining.append((old_pool, thread))
+        return self.generation
+
+    def wait_reloaded(self, timeout: typing.Optional[float] = None) -> bool:
+        """
+        Barrier of :func:`reload` , wait until all old workers finish their tasks and exit,
+        after that every task runs with the new dictionaries
+
+        :param timeout: seconds to wait, None to wait forever
+        :return: all old workers exited or not
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            draining = list(self._draining)
+        for _, thread in draining:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                return False
+        with self._lock:
+            self._draining = [(pool, thread) for pool, thread in self._draining if thread.is_alive()]
+        return True
+
+    def get_chunksize(self, iterable: typing.Iterable, chunksize: typing.Optional[int] = None) -> int:
+        """
+        :param iterable: inputs
+        :param chunksize: chunksize given by user
+        :return: the chunksize will be used
+        """
+        if chunksize is not None:
+            return chunksize
+        if self.chunksize is not None:
+            return self.chunksize
+        if hasattr(iterable, "__len__"):
+            return max(1, math.ceil(len(iterable) / (self.processes * 4)))
+        return DEFAULT_CHUNKSIZE
+
+    def map(
+            self,
+            func: typing.Callable,
+            iterable: typing.Iterable,
+            chunksize: typing.Optional[int] = None,
+            **kwargs
+    ) -> list:
+        """
+        Call ``func(item, **kwargs)`` for every item in workers, return a list of results in the order of inputs
+
+        :param func: a picklable function, usually a function of a high-level module
+        :param iterable: inputs
+        :param chunksize: number of inputs sent to a worker at once
+        :param kwargs: keyword arguments for every call
+        :return: list of results
+        """
+        if not hasattr(iterable, "__len__"):
+            iterable = list(iterable)
+        func = functools.partial(func, **kwargs) if kwargs else func
+        return self._pool.map(func, iterable, chunksize=self.get_chunksize(iterable, chunksize))
+
+    def imap(
+            self,
+            func: typing.Callable,
+            iterable: typing.Iterable,
+            chunksize: typing.Optional[int] = None,
+            **kwargs
+    ) -> typing.Iterator:
+        """
+        Same as :func:`map` , but consume the inputs lazily and yield results in the order of inputs
+
+        :param func: a picklable function, usually a function of a high-level module
+        :param iterable: inputs
+        :param chunksize: number of inputs sent to a worker at once
+        :param kwargs: keyword arguments for every call
+        :return: iterator of results
+        """
+        func = functools.partial(func, **kwargs) if kwargs else func
+        return self._pool.imap(func, iterable, chunksize=self.get_chunksize(iterable, chunksize))
+
+    def submit(self, func: typing.Callable, *args, **kwargs) -> multiprocessing.pool.AsyncResult:
+        """
+        Call ``func(*args, **kwargs)`` in a worker
+
+        :param func: a picklable function, usually a function of a high-level module
+        :return: an async result, use ``get()`` to get the result
+        """
+        return self._pool.apply_async(func, args, kwargs)
+
+    def worker_pids(self) -> typing.List[int]:
+        """
+        :return: process ids of current workers
+        """
+        # noinspection PyProtectedMember
+        return [process.pid for process in self._pool._pool if process.pid is not None]
+
+    def memory_usage(self) -> typing.Dict[int, typing.Dict[str, int]]:
+        """
+        Memory usage of every worker, see :func:`get_memory_usage` , compare ``uss`` and ``pss`` with ``rss``
+        to see how much memory is shared by :data:`START_MODE_FORK_AFTER_INIT`
+
+        :return: ``{pid: {"rss": ..., "pss": ..., "uss": ..., "shared": ...}}`` in bytes
+        """
+        return {pid: get_memory_usage(pid) for pid in self.worker_pids()}
+
+    def close(self):
+        """
+        Stop accepting new tasks, see :func:`multiprocessing.pool.Pool.close`
+        """
+        self._pool.close()
+
+    def join(self):
+        """
+        Wait for the workers to exit, must call :func:`close` or :func:`terminate` before it,
+        also wait for the old workers of :func:`reload`
+        """
+        self._pool.join()
+        self.wait_reloaded()
+
+    def terminate(self):
+        """
+        Stop the workers immediately, include the old workers of :func:`reload`
+        """
+        with self._lock:
+            for pool, _ in self._draining:
+                pool.terminate()
+            self._draining = []
+        self._pool.terminate()
+
+    def __enter__(self) -> "Pool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.terminate()
@@ -3,6 +3,7 @@
 high-level toolbox for Sentiment Analysis
 """
 from nlpir import get_instance as __get_instance__
+from nlpir.cache import cached_call as __cached_call__
 from nlpir import native
 from enum import Enum
 import typing
@@ -50,9 +51,7 @@ def get_emotion(
     :param content: 文档内容 text content
     :return:
     """
-    result = __instance__.get_paragraph_sent_e(
-        paragraph=content,
-    )
+    result = __cached_call__("sentiment_analysis.get_emotion", __instance__, __instance__.get_paragraph_sent_e, content)
     result = [_.split("/") for _ in result.split("\n")]
     structured_result = dict()
     for _ in result:
@@ -3,6 +3,7 @@
 high-level toolbox for Summarization
 """
 from nlpir import get_instance as __get_instance__
+from nlpir.cache import cached_call as __cached_call__
 from nlpir import native
 import typing
 
@@ -49,9 +50,7 @@ def summarization(
     :param int sentence_count: 用户限定的句子数量 （为0则不限制）limit number of sentence, set 0 to no limit
     :return: 摘要字符串；出错返回空串 the summarization content, get null string if occurs error.
     """
-    return __instance__.single_doc_e(
-        text=content,
-        sum_rate=sum_rate,
-        sum_len=sum_len,
-        html_tag_remove=0 if html_tag_remove else 1
+    return __cached_call__(
+        "summary.summarization", __instance__, __instance__.single_doc_e,
+        content, sum_rate, sum_len, 0 if html_tag_remove else 1
     )
@@ -0,0 +1,282 @@
+#! coding=utf-8
+"""
+Compact representation of segmentation results
+
+:func:`nlpir.ictclas.process_to_list` 返回的列表中每个词都是一个 ``str`` 对象(词性标注时还有一个 ``tuple`` 和词性的
+``str`` 对象), 每个词需要几十到上百字节. :class:`Tokens` 将一个文本的所有词拼接为一个字符串, 用两个 ``array('I')``
+保存每个词的起止位置, 用一个 ``array('H')`` 保存词性的编号, 每个词只需要10字节左右, 适合在内存中保存大量的分词结果::
+
+    from nlpir import ictclas
+
+    tokens = ictclas.segment(text, pos_tagged=True, post_process=ictclas.process_to_tokens)
+    tokens[0]       # ('法国', 'nsf')
+    tokens[2:5]     # Tokens of 3 words
+    tokens.words()  # ['法国', '启蒙', ...]
+    tokens.to_list()  # same as process_to_list, but without the empty strings
+
+词性的编号在进程内统一分配, 见 :func:`get_pos_id`. 四种标注集(计算所一级/二级, 北大一级/二级, 见
+:func:`nlpir.native.ictclas.ICTCLAS.set_pos_map`)中的词性按 :data:`POS_TAGS` 的顺序预先分配编号, 在所有进程中都相同,
+不在其中的词性在第一次出现时分配编号::
+
+    from nlpir import tokens
+
+    tokens.get_pos_id("n")          # 0, the same in every process
+    tokens.get_pos_name(0)          # 'n', interned
+    tokens.get_class_pos_ids("n")   # ids of n, nr, nsf, Ng ...
+"""
+import array
+import itertools
+import sys
+import threading
+import typing
+from nlpir.native.ictclas import ICTCLAS
+
+__all__ = [
+    "Tokens",
+    "POS_TAGS",
+    "get_pos_id",
+    "get_pos_name",
+    "get_pos_tags",
+    "get_pos_class",
+    "get_class_pos_ids",
+]
+
+#: POS tags of every pos map of :class:`nlpir.native.ictclas.ICTCLAS` , ``{pos_map: tags}``
+POS_TAGS: typing.Dict[int, typing.Tuple[str, ...]] = {
+    # 计算所二级标注集
+    ICTCLAS.ICT_POS_MAP_SECOND: (
+        "n", "nr", "nr1", "nr2", "nrj", "nrf", "ns", "nsf", "nt", "nz", "nl", "ng",
+        "t", "tg", "s", "f",
+        "v", "vd", "vn", "vshi", "vyou", "vf", "vx", "vi", "vl", "vg",
+        "a", "ad", "an", "ag", "al", "b", "bl", "z",
+        "r", "rr", "rz", "rzt", "rzs", "rzv", "ry", "ryt", "rys", "ryv", "rg",
+        "m", "mq", "q", "qv", "qt", "d", "p", "pba", "pbei", "c", "cc",
+        "u", "uzhe", "ule", "uguo", "ude1", "ude2", "ude3", "usuo", "udeng", "uyy", "udh", "uls", "uzhi", "ulian",
+        "e", "y", "o", "h", "k", "x", "xx", "xu", "xe", "xs", "xm",
+        "g", "gm", "gp", "gc", "gb", "gbc", "gg", "gi",
+        "w", "wkz", "wky", "wyz", "wyy", "wj", "ww", "wt", "wd", "wf", "wn", "wm", "ws", "wp", "wb", "wh",
+    ),
+    # 计算所一级标注集
+    ICTCLAS.ICT_POS_MAP_FIRST: (
+        "n", "t", "s", "f", "v", "a", "b", "z", "r", "m", "q", "d", "p", "c", "u", "e", "y", "o", "h", "k", "x",
+        "g", "w",
+    ),
+    # 北大二级标注集
+    ICTCLAS.PKU_POS_MAP_SECOND: (
+        "Ag", "a", "ad", "an", "b", "c", "Dg", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "Ng", "n", "nr",
+        "ns", "nt", "nz", "o", "p", "q", "r", "s", "Tg", "t", "u", "Vg", "v", "vd", "vn", "w", "x", "y", "z",
+    ),
+    # 北大一级标注集
+    ICTCLAS.PKU_POS_MAP_FIRST: (
+        "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q", "r", "s", "t", "u",
+        "v", "w", "x", "y", "z",
+    ),
+}
+
+# pos name: id, and names of the ids, shared by all tokens in the process
+__pos_ids__: typing.Dict[str, int] = dict()
+__pos_names__: typing.List[str] = list()
+__pos_lock__ = threading.Lock()
+
+
+def get_pos_id(pos: str) -> int:
+    """
+    :param pos: a POS tag, like ``nsf``
+    :return: id of the POS tag, tags in :data:`POS_TAGS` have fixed ids, a new id is assigned to other tags
+        if it is never seen
+    """
+    pos_id = __pos_ids__.get(pos)
+    if pos_id is None:
+        with __pos_lock__:
+            pos_id = __pos_ids__.get(pos)
+            if pos_id is None:
+                pos = sys.intern(pos)
+                pos_id = len(__pos_names__)
+                __pos_names__.append(pos)
+                __pos_ids__[pos] = pos_id
+    return pos_id
+
+
+def get_pos_name(pos_id: int) -> str:
+    """
+    :param pos_id: id get from :func:`get_pos_id`
+    :return: the interned POS tag
+    """
+    return __pos_names__[pos_id]
+
+
+# the tags of all pos maps get the same ids in every process
+for __pos__ in itertools.chain.from_iterable(POS_TAGS.values()):
+    get_pos_id(__pos__)
+del __pos__
+
+
+def get_pos_tags(pos_map: int = ICTCLAS.ICT_POS_MAP_SECOND) -> typing.Tuple[str, ...]:
+    """
+    :param pos_map: a pos map, see :func:`nlpir.native.ictclas.ICTCLAS.set_pos_map`
+    :return: the POS tags of the pos map, the interned strings
+    """
+    if pos_map not in POS_TAGS:
+        raise ValueError(f"unknown pos map {pos_map}")
+    return tuple(__pos_names__[__pos_ids__[pos]] for pos in POS_TAGS[pos_map])
+
+
+def get_pos_class(pos: str) -> str:
+    """
+    词性的大类, 即一级标注集中的词性, 如 ``nsf`` , ``Ng`` 都属于 ``n``
+
+    :param pos: a POS tag
+    :return: the class of the POS tag
+    """
+    return pos[:1].lower()
+
+
+def get_class_pos_ids(pos_class: typing.Union[str, typing.Iterable[str]]) -> typing.FrozenSet[int]:
+    """
+    :param pos_class: a class or classes, like ``n`` or ``["n", "v"]``
+    :return: ids of all POS tags seen in the process which are in the classes
+    """
+    classes = {pos_class} if isinstance(pos_class, str) else set(pos_class)
+    return frozenset(pos_id for pos_id, pos in enumerate(__pos_names__) if get_pos_class(pos) in classes)
+
+
+class Tokens:
+    """
+    A sequence of words, and POS tags if it is tagged, backed by one string and arrays of offsets.
+
+    Items are ``str`` or ``(word, pos)`` like :func:`nlpir.ictclas.process_to_list` , slices are
+    :class:`Tokens` sharing the same backing string.
+
+    :param text: the words joined together
+    :param starts: start offset of every word in ``text``
+    :param ends: end offset of every word in ``text``
+    :param pos_ids: POS id of every word, see :func:`get_pos_id` , None if not tagged
+    """
+    __slots__ = ("text", "starts", "ends", "pos_ids")
+
+    def __init__(
+            self,
+            text: str,
+            starts: array.array,
+            ends: array.array,
+            pos_ids: typing.Optional[array.array] = None
+    ):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+        self.pos_ids = pos_ids
+
+    @classmethod
+    def from_words(cls, words: typing.List[str], pos: typing.Optional[typing.Iterable[str]] = None) -> "Tokens":
+        """
+        :param words: words
+        :param pos: POS tag of every word, None if not tagged
+        :return: the tokens
+        """
+        ends = array.array("I", itertools.accumulate(map(len, words)))
+        starts = array.array("I", [0] if words else [])
+        starts.extend(ends[:-1])
+        pos_ids = None if pos is None else array.array("H", map(get_pos_id, pos))
+        return cls("".join(words), starts, ends, pos_ids)
+
+    @property
+    def pos_tagged(self) -> bool:
+        return self.pos_ids is not None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[str, typing.Tuple[str, str], "Tokens"]:
+        if isinstance(index, slice):
+            return Tokens(
+                self.text,
+                self.starts[index],
+                self.ends[index],
+                None if self.pos_ids is None else self.pos_ids[index]
+            )
+        word = self.text[self.starts[index]:self.ends[index]]
+        if self.pos_ids is None:
+            return word
+        return word, __pos_names__[self.pos_ids[index]]
+
+    def __iter__(self) -> typing.Iterator:
+        text = self.text
+        if self.pos_ids is None:
+            for start, end in zip(self.starts, self.ends):
+                yield text[start:end]
+        else:
+            for start, end, pos_id in zip(self.starts, self.ends, self.pos_ids):
+                yield text[start:end], __pos_names__[pos_id]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Tokens):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        items = list(itertools.islice(self, 10))
+        return f"Tokens({items}{'...' if len(self) > 10 else ''}, length={len(self)})"
+
+    def __sizeof__(self) -> int:
+        size = object.__sizeof__(self) + sys.getsizeof(self.starts) + sys.getsizeof(self.ends)
+        if self.pos_ids is not None:
+            size += sys.getsizeof(self.pos_ids)
+        return size + sys.getsizeof(self.text)
+
+    def __getstate__(self):
+        # POS ids are only valid in current process, send the names
+        return self.text, self.starts, self.ends, None if self.pos_ids is None else self.pos()
+
+    def __setstate__(self, state):
+        self.text, self.starts, self.ends, pos = state
+        self.pos_ids = None if pos is None else array.array("H", map(get_pos_id, pos))
+
+    def words(self) -> typing.List[str]:
+        """
+        :return: list of words
+        """
+        text = self.text
+        return [text[start:end] for start, end in zip(self.starts, self.ends)]
+
+    def pos(self) -> typing.Optional[typing.List[str]]:
+        """
+        :return: list of POS tags, None if not tagged
+        """
+        if self.pos_ids is None:
+            return None
+        return [__pos_names__[pos_id] for pos_id in self.pos_ids]
+
+    def to_list(self) -> list:
+        """
+        :return: list of words, or list of ``(word, pos)`` if tagged
+        """
+        if self.pos_ids is None:
+            return self.words()
+        return list(zip(self.words(), self.pos()))
+
+    def filter_pos(self, pos: typing.Iterable[str]) -> "Tokens":
+        """
+        :param pos: POS tags to keep
+        :return: tokens with the POS tags
+        """
+        if self.pos_ids is None:
+            raise ValueError("the tokens are not POS tagged")
+        keep = {__pos_ids__[p] for p in pos if p in __pos_ids__}
+        indexes = [i for i, pos_id in enumerate(self.pos_ids) if pos_id in keep]
+        return Tokens(
+            self.text,
+            array.array("I", [self.starts[i] for i in indexes]),
+            array.array("I", [self.ends[i] for i in indexes]),
+            array.array("H", [self.pos_ids[i] for i in indexes])
+        )
+
+    def filter_pos_class(self, pos_class: typing.Union[str, typing.Iterable[str]]) -> "Tokens":
+        """
+        :param pos_class: classes of the POS tags to keep, see :func:`get_pos_class`
+        :return: tokens with the POS tags in the classes
+        """
+        if self.pos_ids is None:
+            raise ValueError("the tokens are not POS tagged")
+        return self.filter_pos(__pos_names__[pos_id] for pos_id in get_class_pos_ids(pos_class))
@@ -0,0 +1,258 @@
+#! coding=utf-8
+"""
+Versioned user dictionaries
+
+:class:`UserDictManager` 为一个组件(:mod:`nlpir.ictclas` , :mod:`nlpir.key_extract` , :mod:`nlpir.doc_extractor`)
+维护一个清单(manifest), 记录已经导入组件的用户词典的版本和所有的词. 导入新版本的词典时只计算与清单的差异,
+只删除和添加变化的词, 不需要重新导入整个词典::
+
+    from nlpir import ictclas
+    from nlpir.user_dict import UserDictManager
+
+    manager = UserDictManager(ictclas)
+    report = manager.sync(["卢梭 nr", "社会契约论 n", ...], version="2024-05-01")
+    manager.version     # '2024-05-01'
+
+同步后组件的结果缓存使用词典的版本作为键的一部分(见 :attr:`nlpir.native.nlpir_base.NLPIRBase.user_dict_tag`),
+使用相同版本词典的进程可以共享 :mod:`nlpir.cache` 中的缓存.
+
+清单默认保存在 Data 文件夹下, 与保存的用户词典一同在程序重启后生效.
+
+通过文件导入的词(见 :func:`nlpir.native.ictclas.ICTCLAS.import_user_dict`)不能被 ``del_usr_word`` 和
+``clean_user_word`` 从内存中删除. 重新导入整个词典后, 支持 ``is_user_word`` 的组件(:mod:`nlpir.ictclas`)会检查被删除的词,
+仍然存在的词保留在清单中并在 ``failed`` 中报告; 其他组件无法检查, 清单中记录的是词典文件的内容.
+"""
+import hashlib
+import json
+import os
+import time
+import types
+import typing
+import nlpir
+from nlpir.exception import NLPIRException
+
+__all__ = [
+    "DictDiff",
+    "UserDictManager",
+    "parse_words",
+    "get_digest",
+]
+
+#: Versions kept in the history of a manifest
+HISTORY_SIZE = 20
+
+
+class DictDiff(typing.NamedTuple):
+    """
+    Changes from the loaded user dictionary to a new one, a word with a new POS is deleted and added again
+    """
+    #: ``{word: pos}`` to add
+    add: typing.Dict[str, str]
+    #: words to delete
+    delete: typing.List[str]
+
+    def __len__(self) -> int:
+        return len(self.add) + len(self.delete)
+
+
+def parse_words(word_list: typing.Iterable[str]) -> typing.Tuple[typing.Dict[str, str], list]:
+    """
+    :param word_list: entries of a user dictionary, ``word`` or ``word pos`` , see :func:`nlpir.parse_user_word`
+    :return: ``({word: pos}, invalid entries)`` , the last POS is used if a word appears more than once
+    """
+    words, invalid = dict(), list()
+    for entry in word_list:
+        parsed = nlpir.parse_user_word(entry)
+        if parsed is None:
+            invalid.append(entry)
+        else:
+            words[parsed[0]] = parsed[1]
+    return words, invalid
+
+
+def get_digest(words: typing.Dict[str, str]) -> str:
+    """
+    :param words: ``{word: pos}``
+    :return: digest of the content, the same for the same words in any order
+    """
+    digest = hashlib.sha1()
+    for word in sorted(words):
+        digest.update(f"{word} {words[word]}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class UserDictManager:
+    """
+    Keep the user dictionary of a component in sync with a versioned word list, see the module description
+
+    :param module: the high-level module of the component, :mod:`nlpir.ictclas` , :mod:`nlpir.key_extract` or
+        :mod:`nlpir.doc_extractor`
+    :param manifest_path: path of the manifest, default is ``Data/UserDictManifest.<component>.json``
+    :param persist: save the user dictionary by ``save_user_dict`` and write the manifest after every sync,
+        if it is False the manager in a new process starts from an empty manifest, and the whole dictionary is
+        added word by word in memory instead of importing a file, which is saved in the ``Data`` directory
+    """
+
+    def __init__(
+            self,
+            module: types.ModuleType,
+            manifest_path: typing.Optional[str] = None,
+            persist: bool = True
+    ):
+        for name in ("get_native_instance", "import_dict", "import_dict_bulk", "clean_user_dict", "save_user_dict"):
+            if not hasattr(module, name):
+                raise NLPIRException(f"{module.__name__} does not support user dictionaries")
+        self.module = module
+        self.name = module.__name__.rsplit(".", 1)[-1]
+        self.persist = persist
+        self.manifest_path = os.path.join(nlpir.PACKAGE_DIR, "Data", f"UserDictManifest.{self.name}.json") \
+            if manifest_path is None else manifest_path
+        self.manifest = self.load_manifest()
+        if self.manifest["version"] is not None:
+            self.tag_instance()
+
+    def load_manifest(self) -> dict:
+        """
+        :return: the saved manifest, ``{"version", "digest", "words", "history"}`` , an empty one if not persisted
+            or not exist
+        """
+        if self.persist and os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        return {"version": None, "digest": get_digest({}), "words": {}, "history": []}
+
+    def save_manifest(self):
+        if not self.persist:
+            return
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        with open(self.manifest_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False)
+        os.replace(self.manifest_path + ".tmp", self.manifest_path)
+
+    @property
+    def version(self) -> typing.Optional[str]:
+        """
+        The version of the user dictionary loaded in the component, None if never synced
+        """
+        return self.manifest["version"]
+
+    @property
+    def words(self) -> typing.Dict[str, str]:
+        """
+        ``{word: pos}`` loaded in the component
+        """
+        return self.manifest["words"]
+
+    def tag_instance(self):
+        """
+        Use the version in the result cache key of the component, see
+        :attr:`nlpir.native.nlpir_base.NLPIRBase.user_dict_tag`
+        """
+        instance = self.module.get_native_instance()
+        instance.user_dict_tag = (f"{self.name}:{self.version}:{self.manifest['digest']}", instance.user_dict_version)
+
+    def diff(self, words: typing.Dict[str, str]) -> DictDiff:
+        """
+        :param words: ``{word: pos}`` of the new dictionary, see :func:`parse_words`
+        :return: the changes from the loaded dictionary
+        """
+        loaded = self.words
+        add = {word: pos for word, pos in words.items() if loaded.get(word) != pos}
+        delete = [word for word, pos in loaded.items() if words.get(word) != pos]
+        return DictDiff(add, delete)
+
+    def sync(
+            self,
+            word_list: typing.Iterable[str],
+            version: typing.Optional[str] = None,
+            full_reload_ratio: float = 0.5
+    ) -> dict:
+        """
+        Change the user dictionary of the component to ``word_list`` , only the changed words are deleted and added.
+        The whole dictionary is imported again by :func:`nlpir.import_dict_bulk` (or :func:`nlpir.import_dict` if
+        not ``persist``) if it is never synced, or the changes are more than ``full_reload_ratio`` of the new
+        dictionary, or some words can not be deleted.
+
+        :param word_list: entries of the new dictionary, ``word`` or ``word pos``
+        :param version: name of the new version, default is the digest of the words
+        :param full_reload_ratio: import the whole dictionary if the changes are more than this ratio of it
+        :return: report of the sync, ``{"version", "added", "deleted", "failed", "full_reload"}`` ,
+            ``failed`` are the entries which are not loaded, and the deleted words which are still loaded,
+            see the module description
+        :raises NLPIRException: a full reload failed and the component can not tell which words are loaded,
+            the next sync imports the whole dictionary again
+        """
+        words, failed = parse_words(word_list)
+        digest = get_digest(words)
+        version = digest if version is None else str(version)
+        diff = self.diff(words)
+        if not diff:
+            self.manifest["version"] = version
+            self.save_manifest()
+            self.tag_instance()
+            return {"version": version, "added": 0, "deleted": 0, "failed": failed, "full_reload": False}
+
+        instance = self.module.get_native_instance()
+        full_reload = self.version is None or len(diff) > full_reload_ratio * len(words)
+        loaded = dict(self.words)
+        if not full_reload:
+            for word in diff.delete:
+                # the words imported from a file can not be deleted, see ICTCLAS.import_user_dict
+                if instance.del_usr_word(word) == -1:
+                    full_reload = True
+                    break
+                del loaded[word]
+        added_failed, not_deleted = list(), list()
+        if full_reload:
+            self.module.clean_user_dict()
+            entries = [f"{word} {pos}" for word, pos in words.items()]
+            if self.persist:
+                added_failed = self.module.import_dict_bulk(entries, overwrite=True)
+            else:
+                # a file import is saved in the Data directory
+                added_failed = self.module.import_dict(entries)
+            if self.persist and added_failed and not hasattr(instance, "is_user_word"):
+                # the component can not tell which words are loaded, start over with a full reload next time
+                self.manifest = {
+                    "version": None, "digest": get_digest({}), "words": {}, "history": self.manifest["history"]
+                }
+                self.save_manifest()
+                raise NLPIRException(f"failed to import the user dictionary of version {version} into {self.name}")
+            loaded = dict(words)
+            if hasattr(instance, "is_user_word"):
+                # the words imported from a file stay in memory after clean_user_dict
+                for word, pos in self.words.items():
+                    if word not in words and instance.is_user_word(word) == 1:
+                        loaded[word] = pos
+                        not_deleted.append(f"{word} {pos}")
+        else:
+            for word, pos in diff.add.items():
+                if 0 != instance.add_user_word(f"{word} {pos}"):
+                    added_failed.append(f"{word} {pos}")
+                loaded[word] = pos
+        for entry in added_failed:
+            loaded.pop(nlpir.parse_user_word(entry)[0], None)
+        if self.persist:
+            self.module.save_user_dict()
+
+        self.manifest = {
+            "version": version,
+            "digest": get_digest(loaded),
+            "words": loaded,
+            "history": (self.manifest["history"] + [{
+                "version": version,
+                "added": len(diff.add),
+                "deleted": len(diff.delete) - len(not_deleted),
+                "full_reload": full_reload,
+                "time": time.time(),
+            }])[-HISTORY_SIZE:],
+        }
+        self.save_manifest()
+        self.tag_instance()
+        return {
+            "version": version,
+            "added": len(diff.add),
+            "deleted": len(diff.delete) - len(not_deleted),
+            "failed": failed + added_failed + not_deleted,
+            "full_reload": full_reload,
+        }
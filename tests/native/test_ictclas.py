@@ -4,7 +4,10 @@ Tested Function:
 
 - :func:`nlpir.native.ictclas.ICTCLAS.exit_lib`
 - :func:`nlpir.native.ictclas.ICTCLAS.paragraph_process`
+- :func:`nlpir.native.ictclas.ICTCLAS.paragraph_process_bytes`
 - :func:`nlpir.native.ictclas.ICTCLAS.ictclas.paragraph_process_a`
+- :func:`nlpir.native.ictclas.ICTCLAS.result_array`
+- :func:`nlpir.native.ictclas.ICTCLAS.result_memoryview`
 - :func:`nlpir.native.ictclas.ICTCLAS.file_process`
 - :func:`nlpir.native.ictclas.ICTCLAS.add_user_word`
 - :func:`nlpir.native.ictclas.ICTCLAS.del_usr_word`
@@ -21,8 +24,11 @@ Tested Function:
 - :func:`nlpir.native.ictclas.ICTCLAS.file_word_freq_stat`
 - :func:`nlpir.native.ictclas.ICTCLAS.get_eng_word_origin`
 - :func:`nlpir.native.ictclas.ICTCLAS.get_last_error_msg`
+- :func:`nlpir.native.nlpir_base.NLPIRBase.bind_functions`
 """
 from nlpir.native import ICTCLAS
+from nlpir.native.ictclas import ResultT
+from ctypes import sizeof
 from nlpir import native, PACKAGE_DIR, clean_logs
 from collections.abc import Iterable
 import os
@@ -43,6 +49,17 @@ def test_init_exit():
     clean_logs(include_current=True)
 
 
+def test_bind_functions():
+    ictclas = get_ictclas()
+    for name, (argtypes, restype) in ICTCLAS.exported_functions.items():
+        if name not in ictclas.funcs:
+            continue
+        assert ictclas.funcs[name].argtypes == tuple(argtypes)
+        assert ictclas.funcs[name].restype == restype
+    assert ictclas.funcs["NLPIR_ParagraphProcess"] is ictclas.funcs["NLPIR_ParagraphProcess"]
+    clean_logs(include_current=True)
+
+
 def test_paragraph_process():
     ictclas = get_ictclas()
     test_str_seg_pos = '法国/nsf 启蒙/vn 思想家/n 孟德斯/nrf 鸠/n 曾/d 说/v 过/uguo ：/wm “/wyz 一切/rz 有/vyou 权力/n ' \
@@ -66,12 +83,30 @@ def test_paragraph_process():
     clean_logs(include_current=True)
 
 
+def test_paragraph_process_bytes():
+    ictclas = get_ictclas()
+    ictclas.clean_user_word()
+    paragraph = test_str.encode("utf-8")
+    for pos_tagged in (0, 1):
+        result = ictclas.paragraph_process_bytes(paragraph, pos_tagged)
+        assert isinstance(result, bytes)
+        assert result.decode("utf-8") == ictclas.paragraph_process(test_str, pos_tagged)
+        assert result == ictclas.paragraph_process_bytes(memoryview(paragraph), pos_tagged)
+        assert result == ictclas.paragraph_process_bytes(bytearray(paragraph), pos_tagged)
+    clean_logs(include_current=True)
+
+
 def test_paragraph_process_a():
     ictclas = get_ictclas()
     # clean all the user word
     ictclas.clean_user_word()
     result, result_count = ictclas.paragraph_process_a(test_str, True)
     assert result_count == 110
+    array = ictclas.result_array(result, result_count)
+    assert len(array) == 110 and array[0].start == 0
+    view = ictclas.result_memoryview(result, result_count)
+    assert view.nbytes == 110 * sizeof(ResultT)
+    assert len(ictclas.result_array(result, 0)) == 0
     clean_logs(include_current=True)
 
 
@@ -0,0 +1,44 @@
+# coding=utf-8
+"""
+Tested Function:
+
+- :func:`nlpir.native.nlpir_base.NLPIRBase.add_call_hook`
+- :func:`nlpir.native.nlpir_base.NLPIRBase.remove_call_hook`
+- :func:`nlpir.native.instrumentation.enable`
+- :func:`nlpir.native.instrumentation.disable`
+- :func:`nlpir.native.instrumentation.Instrumentation.snapshot`
+- :func:`nlpir.native.instrumentation.Instrumentation.render_prometheus`
+"""
+import urllib.request
+from nlpir.native import ICTCLAS, instrumentation
+from ..strings import test_str
+
+
+def test_instrumentation():
+    ictclas = ICTCLAS()
+    recorder = instrumentation.enable()
+    try:
+        result = ictclas.paragraph_process(test_str, 1)
+        ictclas.paragraph_process(test_str, 0)
+    finally:
+        instrumentation.disable(recorder)
+    # not recorded after disable
+    ictclas.paragraph_process(test_str, 1)
+    stats = recorder.snapshot()[ictclas.dll_name]["NLPIR_ParagraphProcess"]
+    assert stats["count"] == 2
+    assert stats["input_bytes"] == 2 * len(test_str.encode(ictclas.encode))
+    assert stats["output_bytes"] >= len(result.encode(ictclas.encode))
+    assert stats["buckets"][-1] == (float("inf"), 2)
+    assert ictclas.funcs["NLPIR_ParagraphProcess"] is ictclas.funcs.raw["NLPIR_ParagraphProcess"]
+
+    text = recorder.render_prometheus()
+    labels = f'component="{ictclas.dll_name}",function="NLPIR_ParagraphProcess"'
+    assert f"nlpir_native_calls_total{{{labels}}} 2" in text
+    assert f'nlpir_native_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+
+    server = recorder.start_http_server(0)
+    try:
+        url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+        assert urllib.request.urlopen(url).read().decode("utf-8") == text
+    finally:
+        server.shutdown()
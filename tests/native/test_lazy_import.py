@@ -0,0 +1,25 @@
+# coding=utf-8
+"""
+Tested Function:
+
+- lazy import of :mod:`nlpir.native`
+"""
+import subprocess
+import sys
+
+
+def test_lazy_import():
+    script = (
+        "import sys, nlpir.ictclas\n"
+        "print(sorted(m for m in sys.modules if m.startswith('nlpir.native.')))\n"
+        "from nlpir.native import KeyExtract\n"
+        "import nlpir.native\n"
+        "print(nlpir.native.SentimentNew.__module__, 'nlpir.native.key_extract' in sys.modules)\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script]).decode().splitlines()
+    if sys.version_info >= (3, 7):
+        assert output[0] == "['nlpir.native.ictclas', 'nlpir.native.nlpir_base']"
+    else:
+        # no module __getattr__, all components are imported at once
+        assert "'nlpir.native.key_extract'" in output[0]
+    assert output[1] == "nlpir.native.sentiment True"
@@ -0,0 +1,41 @@
+# coding=utf-8
+"""
+Tested function:
+
+- :func:`nlpir.native.sentiment.SentimentAnalysis.get_paragraph_sent`
+- :func:`nlpir.native.sentiment.SentimentAnalysis.get_file_sent`
+"""
+from ctypes import CFUNCTYPE
+from nlpir.native import SentimentAnalysis
+from nlpir import native, clean_logs
+from ..strings import test_str, test_source_filename
+
+
+def get_sentiment(encode=native.UTF8_CODE):
+    return SentimentAnalysis(encode=encode)
+
+
+def test_declared_arguments():
+    # the arguments must be accepted by the declared argtypes, the native library is not needed
+    calls = list()
+    sentiment = SentimentAnalysis.__new__(SentimentAnalysis)
+    sentiment.encode = "utf-8"
+    sentiment.funcs = {"LJST_Exits": lambda: True}
+    for name in ("LJST_GetParagraphSent", "LJST_GetFileSent"):
+        arg_types, res_type = SentimentAnalysis.exported_functions[name]
+        sentiment.funcs[name] = CFUNCTYPE(res_type, *arg_types)(
+            lambda text, result, name=name: calls.append((name, text)) or True
+        )
+    sentiment.get_paragraph_sent(test_str)
+    sentiment.get_file_sent(test_source_filename)
+    assert calls == [
+        ("LJST_GetParagraphSent", test_str.encode("utf-8")),
+        ("LJST_GetFileSent", test_source_filename.encode("utf-8")),
+    ]
+
+
+def test_get_sent():
+    sentiment = get_sentiment()
+    assert sentiment.get_paragraph_sent(test_str)
+    assert sentiment.get_file_sent(test_source_filename)
+    clean_logs(include_current=True)
@@ -0,0 +1,37 @@
+# coding=utf-8
+"""
+Tested Function:
+
+- :func:`nlpir.native.slow_call.enable`
+- :func:`nlpir.native.slow_call.disable`
+- :func:`nlpir.native.slow_call.load_records`
+- :func:`nlpir.native.slow_call.decode_args`
+"""
+import hashlib
+import os
+from nlpir.native import ICTCLAS, slow_call
+from ..strings import test_str
+
+
+def test_slow_call(tmpdir):
+    ictclas = ICTCLAS()
+    path = os.path.join(str(tmpdir), "slow_calls.jsonl")
+    recorder = slow_call.enable(
+        path, threshold=0, max_records=2, capture_input=True, functions=["NLPIR_ParagraphProcess"]
+    )
+    try:
+        for _ in range(5):
+            result = ictclas.paragraph_process(test_str, 1)
+        ictclas.is_word("法国")
+    finally:
+        slow_call.disable(recorder)
+    records = slow_call.load_records(path)
+    # bounded to 2 * max_records lines
+    assert 2 <= len(records) < 4
+    data = test_str.encode(ictclas.encode)
+    for record in records:
+        assert record["function"] == "NLPIR_ParagraphProcess"
+        assert record["input_bytes"] == len(data)
+        assert record["sha1"] == hashlib.sha1(data).hexdigest()
+    args = slow_call.decode_args(records[-1]["args"])
+    assert ictclas.funcs[records[-1]["function"]](*args).decode(ictclas.encode) == result
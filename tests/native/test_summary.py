@@ -6,6 +6,7 @@ Tested Function:
 - :func:`nlpir.native.summary.Summary.get_last_error_msg`
 - :func:`nlpir.native.summary.Summary.single_doc`
 - :func:`nlpir.native.summary.Summary.single_doc_e`
+- :func:`nlpir.native.summary.Summary.single_doc_e_bytes`
 - :func:`nlpir.native.summary.Summary.file_process`
 - :func:`nlpir.native.summary.Summary.get_last_error_msg`
 
@@ -13,6 +14,7 @@ Tested Function:
 from nlpir.native import Summary
 from nlpir import native, clean_logs
 from ..strings import test_str, test_source_filename
+import ctypes
 import pytest
 
 
@@ -33,6 +35,30 @@ def test_summary_string():
     assert summary.single_doc_e(text=test_str, sum_rate=0.3, sum_len=50, html_tag_remove=True)
 
 
+def test_summary_bytes():
+    summary = get_summary()
+    text = test_str.encode("utf-8")
+    result, _ = summary.single_doc_e_bytes(text, sum_rate=0.3, sum_len=50, html_tag_remove=True)
+    assert result
+    # no limit of the length
+    result, _ = summary.single_doc_e_bytes(text, sum_len=0)
+    assert result and len(result) <= len(text)
+
+
+def test_summary_bytes_buffer():
+    # the buffer can hold the whole text whatever the limit is, the native library is not needed
+    sizes = list()
+    summary = Summary.__new__(Summary)
+    summary.funcs = {
+        "DS_Exit": lambda: True,
+        "DS_SingleDocE": lambda result, *args: sizes.append(ctypes.sizeof(result)) or 0,
+    }
+    text = test_str.encode("utf-8")
+    for sum_len in (0, -1, 50, len(text) * 2):
+        summary.single_doc_e_bytes(text, sum_len=sum_len)
+    assert all(size > len(text) for size in sizes) and sizes[-1] > len(text) * 2
+
+
 def test_summary_file():
     summary = get_summary()
     assert summary.file_process(text_filename=test_source_filename, sum_rate=0.1, sum_len=300, html_tag_remove=True)
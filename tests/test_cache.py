@@ -0,0 +1,128 @@
+# coding=utf-8
+"""
+Tested function:
+
+- :func:`nlpir.cache.enable`
+- :func:`nlpir.cache.disable`
+- :func:`nlpir.cache.stats`
+- :class:`nlpir.cache.MemoryCache`
+- :class:`nlpir.cache.DiskCache`
+- :class:`nlpir.cache.TieredCache`
+- :class:`nlpir.cache.SharedMemoryCache`
+- :func:`nlpir.doc_extractor.extract` with cache
+"""
+import os
+import pickle
+import time
+import pytest
+from nlpir import ictclas, doc_extractor, cache
+from nlpir.pool import Pool
+from tests.strings import test_str
+
+
+def test_memory_cache():
+    backend = cache.MemoryCache(max_bytes=1000)
+    backend.set(b"a" * 16, "x" * 400)
+    backend.set(b"b" * 16, "y" * 400)
+    assert backend.get(b"a" * 16) == (True, "x" * 400)
+    # b is the least recently used one
+    backend.set(b"c" * 16, "z" * 400)
+    assert backend.get(b"b" * 16) == (False, None)
+    assert backend.stats()["evictions"] == 1
+    # larger than the limit, not cached
+    backend.set(b"d" * 16, "w" * 2000)
+    assert backend.get(b"d" * 16)[0] is False
+
+
+def test_segment_cache():
+    backend = cache.enable(["ictclas.segment"])
+    try:
+        expected = ictclas.segment(test_str, pos_tagged=True)
+        assert ictclas.segment(test_str, pos_tagged=True) == expected
+        assert backend.stats()["hits"] == 1
+        # different parameter, not hit
+        ictclas.segment(test_str, pos_tagged=False)
+        assert backend.stats()["hits"] == 1
+        # user dictionary changed, not hit
+        ictclas.get_native_instance().add_user_word("启蒙思想家 n")
+        assert ("启蒙思想家", "n") in ictclas.segment(test_str, pos_tagged=True)
+        assert backend.stats()["hits"] == 1
+        assert cache.stats()["ictclas.segment"]["misses"] >= 3
+    finally:
+        ictclas.get_native_instance().del_usr_word("启蒙思想家")
+        cache.disable()
+
+
+def test_disk_cache(tmpdir):
+    data_path = os.path.join(str(tmpdir), "Data")
+    os.mkdir(data_path)
+    with open(os.path.join(data_path, "UserDict.pdat"), "w") as f:
+        f.write("1")
+    path = os.path.join(str(tmpdir), "cache.sqlite3")
+    disk = cache.DiskCache(path, max_bytes=10000, watch_paths=[data_path], check_interval=0)
+    tiered = cache.TieredCache(cache.MemoryCache(), disk)
+    tiered.set(b"a" * 16, {"word": "法国"})
+    # persistent, another instance can read it
+    assert cache.DiskCache(path, watch_paths=[data_path]).get(b"a" * 16) == (True, {"word": "法国"})
+    # logs do not invalidate the cache
+    with open(os.path.join(data_path, "20210101.log"), "w") as f:
+        f.write("log")
+    assert disk.get(b"a" * 16)[0] is True
+    # dictionaries changed
+    time.sleep(0.01)
+    with open(os.path.join(data_path, "UserDict.pdat"), "w") as f:
+        f.write("2")
+    assert disk.get(b"a" * 16)[0] is False
+    assert disk.stats()["invalidations"] == 1
+    # a replaced value is not counted twice
+    for _ in range(200):
+        disk.set(b"b" * 16, "x" * 100)
+    assert disk.stats()["bytes"] == len(pickle.dumps("x" * 100, protocol=pickle.HIGHEST_PROTOCOL))
+    assert disk.stats()["evictions"] == 0
+    # evict the least recently used values
+    for i in range(200):
+        disk.set(i.to_bytes(16, "big"), "x" * 100)
+    assert disk.stats()["bytes"] <= 10000
+    assert disk.get((199).to_bytes(16, "big"))[0] is True
+    assert disk.get((0).to_bytes(16, "big"))[0] is False
+
+
+def test_extract_cache(tmpdir):
+    text = "法国启蒙思想家孟德斯鸠曾说过：“一切有权力的人都容易滥用权力，这是一条千古不变的经验。”"
+    expected = doc_extractor.extract(text, []).get_result()
+    backend = cache.enable(
+        ["doc_extractor.extract"],
+        cache=cache.DiskCache(os.path.join(str(tmpdir), "cache.sqlite3"))
+    )
+    try:
+        assert doc_extractor.extract(text, []).get_result() == expected
+        result = doc_extractor.extract(text, [])
+        assert result.handle is None
+        assert result.get_result() == expected
+        assert backend.stats()["hits"] == 1
+    finally:
+        cache.disable()
+
+
+@pytest.mark.skipif(cache.shared_memory is None, reason="multiprocessing.shared_memory requires python 3.8")
+def test_shared_memory_cache():
+    name = f"nlpir_test_{os.getpid()}"
+    backend = cache.SharedMemoryCache(name, max_bytes=1 << 20, slot_size=1024)
+    try:
+        backend.set(b"a" * 16, {"word": "法国"})
+        assert backend.get(b"a" * 16) == (True, {"word": "法国"})
+        # larger than a slot, not cached
+        backend.set(b"b" * 16, "x" * 2000)
+        assert backend.get(b"b" * 16) == (False, None)
+        assert backend.stats()["skipped"] == 1
+        # results of the workers are seen by the others
+        with Pool([ictclas], processes=2, cache=backend, cache_functions=["ictclas.segment"]) as pool:
+            first = pool.map(ictclas.segment, [test_str] * 2, chunksize=1)
+            second = pool.map(ictclas.segment, [test_str] * 2, chunksize=1)
+        assert first == second
+        assert backend.stats()["items"] == 2
+        backend.clear()
+        assert backend.get(b"a" * 16) == (False, None)
+    finally:
+        backend.close()
+        backend.unlink()
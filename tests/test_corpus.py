@@ -0,0 +1,60 @@
+# coding=utf-8
+"""
+Tested function:
+
+- :func:`nlpir.corpus.make_shards`
+- :func:`nlpir.corpus.segment_corpus`
+- :func:`nlpir.corpus.segment_shard`
+"""
+import os
+import pytest
+from nlpir import ictclas, corpus, clean_logs
+from tests.strings import test_source_filename
+
+
+def test_make_shards():
+    shards = corpus.make_shards(test_source_filename, 1024)
+    assert len(shards) > 1
+    with open(test_source_filename, "rb") as f:
+        data = f.read()
+    assert shards[0].start == 0 and shards[-1].end == len(data)
+    for previous, shard in zip(shards[:-1], shards[1:]):
+        assert previous.end == shard.start
+        assert data[shard.start - 1:shard.start] == b"\n"
+
+
+def test_segment_corpus(tmpdir):
+    source = os.path.join(str(tmpdir), "corpus")
+    os.makedirs(os.path.join(source, "sub"))
+    with open(test_source_filename, "rb") as f:
+        data = f.read()
+    for name in ("a.txt", os.path.join("sub", "b.txt")):
+        with open(os.path.join(source, name), "wb") as f:
+            f.write(data)
+    output = os.path.join(str(tmpdir), "output")
+    report = corpus.segment_corpus(source, output, processes=2, pos_tagged=True, shard_size=1024)
+    assert report["files"] == 2 and report["resumed"] == 0 and report["bytes"] == len(data) * 2
+    lines = data.decode("utf-8").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    expected = [ictclas.segment(line.rstrip("\r"), pos_tagged=True, post_process=lambda t, _: t) for line in lines]
+    for name in ("a.txt", os.path.join("sub", "b.txt")):
+        with open(os.path.join(output, name), encoding="utf-8") as f:
+            assert f.read().split("\n")[:-1] == expected
+    assert not os.path.exists(os.path.join(output, corpus.SHARDS_DIR))
+    # resume from the checkpoint
+    report = corpus.segment_corpus(source, output, processes=2, pos_tagged=True, shard_size=1024, keep_shards=True)
+    report = corpus.segment_corpus(source, output, processes=2, pos_tagged=True, shard_size=1024)
+    assert report["resumed"] == report["shards"] and report["bytes"] == 0
+    clean_logs(include_current=True)
+
+
+def test_segment_shard_decode_error(tmpdir):
+    path = os.path.join(str(tmpdir), "gbk.txt")
+    data = "法国启蒙思想家\n".encode("gbk")
+    with open(path, "wb") as f:
+        f.write(data)
+    shard = corpus.Shard(0, path, "gbk.txt", 0, len(data))
+    # bytes of another encoding are not dropped silently
+    with pytest.raises(UnicodeDecodeError):
+        corpus.segment_shard(shard, str(tmpdir))
@@ -83,6 +83,49 @@ def test_dict():
     nlpir.clean_logs(include_current=True)
 
 
+def test_import_dict_bulk():
+    from tests.strings import test_str_2nd
+    test_str_seg_with_dict = '另/rz 一/m 法国/nsf 启蒙/vn 思想家/n 卢梭/user 从/p 社会契约论/user 的/ude1 观点/n 出发/vi ，/wd' \
+                             ' 认为/v 国家/n 权力/n 是/vshi 公民/n 让/v 渡/v 其/rz 全部/m “/wyz 自然/n 权利/n ”/wyy 而/cc 获得/v 的/ude1 '
+    ictclas.clean_user_dict()
+    assert ictclas.import_dict_bulk(["卢梭 user", "社会契约论 user", "", "a b c"]) == ["", "a b c"]
+    assert test_str_seg_with_dict == ictclas.segment(test_str_2nd, pos_tagged=True, post_process=lambda t, _: t)
+    ictclas.clean_user_dict()
+    assert ictclas.clean_saved_user_dict()
+    nlpir.clean_logs(include_current=True)
+
+
+def test_import_dict_bulk_native_calls():
+    class Instance:
+        encode = "utf-8"
+
+        def __init__(self, result):
+            self.result = result
+            self.calls = []
+
+        def import_user_dict(self, filename, overwrite):
+            with open(filename, encoding=self.encode) as f:
+                self.calls.append(("import_user_dict", f.read().splitlines()))
+            return self.result
+
+        def is_user_word(self, word):
+            self.calls.append(("is_user_word", word))
+            return 1 if word == "卢梭" else 0
+
+        def add_user_word(self, word):
+            self.calls.append(("add_user_word", word))
+            return 0
+
+    # one native call if the import succeeds
+    instance = Instance(1)
+    assert nlpir.import_dict_bulk(["卢梭 user", "社会契约论"], instance) == []
+    assert instance.calls == [("import_user_dict", ["卢梭 user", "社会契约论 n"])]
+    # the failed words are found without adding them again
+    instance = Instance(0)
+    assert nlpir.import_dict_bulk(["卢梭 user", "社会契约论"], instance) == ["社会契约论"]
+    assert [name for name, _ in instance.calls] == ["import_user_dict", "is_user_word", "is_user_word"]
+
+
 def test_file_segment():
     from tests.strings import test_source_filename, test_result_filename
     import os
@@ -92,3 +135,139 @@ def test_file_segment():
     )
     os.remove(test_result_filename + ".test_ictclas.test_file_segment")
     nlpir.clean_logs(include_current=True)
+
+
+def test_segment_batch():
+    from tests.strings import test_str, test_str_1st, test_str_2nd
+    from nlpir.pool import Pool
+    texts = [test_str, test_str_1st, test_str_2nd] * 10
+    for pos_tagged in (False, True):
+        expected = [ictclas.segment(text, pos_tagged=pos_tagged) for text in texts]
+        assert expected == ictclas.segment_batch(texts, pos_tagged=pos_tagged)
+        assert expected == ictclas.segment_batch(iter(texts), pos_tagged=pos_tagged)
+    assert ictclas.segment_batch([]) == []
+    expected = [ictclas.segment(text, pos_tagged=True) for text in texts]
+    with Pool([ictclas], processes=4) as pool:
+        assert expected == ictclas.segment_batch(texts, pos_tagged=True, pool=pool)
+        assert expected == ictclas.segment_batch(iter(texts), pos_tagged=True, pool=pool, chunksize=7)
+    nlpir.clean_logs(include_current=True)
+
+
+def test_segment_file_iter(tmp_path):
+    from tests.strings import test_source_filename
+    with open(test_source_filename, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    expected = [ictclas.segment(line, pos_tagged=True) for line in lines]
+    assert expected == list(ictclas.segment_file_iter(test_source_filename, pos_tagged=True, chunk_size=64))
+    # bytes of another encoding are not dropped silently
+    bad_filename = str(tmp_path / "gbk.txt")
+    with open(bad_filename, "wb") as f:
+        f.write("法国启蒙思想家".encode("gbk"))
+    with pytest.raises(UnicodeDecodeError):
+        list(ictclas.segment_file_iter(bad_filename))
+    # records are cut at the sentence boundaries
+    assert ictclas.cut_record("一切。有权力的人。", 5) == ["一切。", "有权力的人", "。"]
+    nlpir.clean_logs(include_current=True)
+
+
+def test_segment_with_offsets():
+    from tests.strings import test_str
+    result = ictclas.segment_with_offsets(test_str, use_numpy=False)
+    assert [(word, pos) for word, pos, _, _ in result] == ictclas.segment(test_str, pos_tagged=True)
+    for word, _, start, end in result:
+        assert test_str[start:end] == word
+    assert list(ictclas.get_char_offsets("a法b".encode("gbk"), "gbk")) == [0, 1, 1, 2, 3]
+    assert list(ictclas.get_char_offsets("a法b".encode("utf-8"), "utf-8")) == [0, 1, 2, 2, 2, 3]
+    with pytest.raises(UnicodeDecodeError):
+        ictclas.get_char_offsets("a法b".encode("gbk")[:2], "gbk")
+    numpy = pytest.importorskip("numpy")
+    assert ictclas.segment_with_offsets(test_str, use_numpy=True) == result
+    table = ictclas.get_char_offsets("a法b".encode("utf-8"), "utf-8", use_numpy=True)
+    assert isinstance(table, numpy.ndarray) and table.tolist() == [0, 1, 2, 2, 2, 3]
+    nlpir.clean_logs(include_current=True)
+
+
+def test_process_to_generator(monkeypatch):
+    text = ictclas.segment("一切有权力的人都容易滥用权力。\n这是一条千古不变的经验。" * 20, pos_tagged=True, post_process=lambda t, _: t)
+    # cut the string into many chunks
+    monkeypatch.setattr(ictclas, "GENERATOR_CHUNK_SIZE", 7)
+    assert list(ictclas.process_to_generator(text, True)) == ictclas.match_tag.findall(text)
+    text = ictclas.segment("一切有权力的人都容易滥用权力。" * 20, pos_tagged=False, post_process=lambda t, _: t)
+    assert list(ictclas.process_to_generator(text, False)) == [word for word in text.split(" ") if word]
+    nlpir.clean_logs(include_current=True)
+
+
+def test_word_freq():
+    from tests.strings import test_str, test_str_1st, test_str_2nd
+    texts = [test_str, test_str_1st, test_str_2nd] * 10
+    expected = ictclas.parse_word_freq(ictclas.get_native_instance().word_freq_stat(test_str))
+    assert ictclas.parse_word_freq("张华平/nr/10#博士/n/9#张华平/n/8") == {"张华平": 18, "博士": 9}
+    result = ictclas.word_freq(texts, chunksize=4)
+    assert dict(result)[expected.most_common(1)[0][0]] >= 10 * expected.most_common(1)[0][1]
+    assert ictclas.word_freq(iter(texts), workers=2, top_k=5, chunksize=4) == result[:5]
+    assert [word for word, _ in ictclas.word_freq(texts, top_k=3, sketch_width=1024)] == [word for word, _ in result[:3]]
+    assert all(isinstance(word, tuple) for word, _ in ictclas.word_freq(texts, top_k=3, with_pos=True))
+    sketch = ictclas.CountMinSketch(16, 2)
+    for i in range(100):
+        sketch.add(i, i)
+    assert all(sketch.estimate(i) >= i for i in range(100))
+    nlpir.clean_logs(include_current=True)
+
+
+def test_tokenize_for_ir_batch():
+    from tests.strings import test_str, test_str_1st, test_str_2nd
+    import json
+    from nlpir.pool import Pool
+    texts = [test_str, test_str_1st, "", test_str_2nd] * 3
+    native_instance = ictclas.get_native_instance()
+    expected = [
+        [(t["text"], t["begin"], t["end"], t["pos"]) for t in json.loads(native_instance.tokenizer_for_ir(text))]
+        if text else [] for text in texts
+    ]
+    postings = ictclas.tokenize_for_ir_batch(texts)
+    assert postings.document_count == len(texts)
+    assert [postings.document(i) for i in range(len(texts))] == expected
+    assert len(postings.terms) == len(set(postings.terms))
+    with Pool([ictclas], processes=2) as pool:
+        parallel = ictclas.tokenize_for_ir_batch(iter(texts), pool=pool, chunksize=5)
+    assert [parallel.document(i) for i in range(len(texts))] == expected
+    nlpir.clean_logs(include_current=True)
+
+
+def test_batch_pool_without_instance(monkeypatch):
+    import array
+    import collections
+
+    class FakePool:
+        @staticmethod
+        def get_chunksize(iterable, chunksize=None):
+            return chunksize or 2
+
+        @staticmethod
+        def imap(func, iterable, chunksize=None, **kwargs):
+            for chunk in iterable:
+                if func is ictclas.segment_batch:
+                    yield [list(text) for text in chunk]
+                elif func is ictclas.word_freq_counter:
+                    yield collections.Counter(chunk)
+                else:
+                    yield ictclas.Postings(
+                        [text for text in chunk], ["n"], array.array("I", range(len(chunk))),
+                        array.array("H", [0] * len(chunk)), array.array("I", [0] * len(chunk)),
+                        array.array("I", [1] * len(chunk)), array.array("Q", range(len(chunk) + 1))
+                    )
+
+    def init(*args, **kwargs):
+        raise AssertionError("the component is initialized in the process using the pool")
+
+    # the process handing the texts to the workers does not load the component
+    monkeypatch.setattr(ictclas, "__instance__", None)
+    monkeypatch.setattr(ictclas, "__cls__", init)
+    texts = ["法国", "启蒙", "思想家", "法国", "卢梭"]
+    assert ictclas.segment_batch(texts, pool=FakePool()) == [list(text) for text in texts]
+    postings = ictclas.tokenize_for_ir_batch(texts, pool=FakePool(), chunksize=2)
+    assert postings.document_count == len(texts) and postings.terms == ["法国", "启蒙", "思想家", "卢梭"]
+    assert list(postings.term_ids) == [0, 1, 2, 0, 3]
+    assert ictclas.word_freq(texts, top_k=1, pool=FakePool(), chunksize=2) == [("法国", 2)]
@@ -0,0 +1,56 @@
+# coding=utf-8
+"""
+Tested function:
+
+- :func:`nlpir.pool.Pool.map`
+- :func:`nlpir.pool.Pool.imap`
+- :func:`nlpir.pool.Pool.submit`
+- :func:`nlpir.pool.Pool.memory_usage`
+- :func:`nlpir.pool.Pool.reload`
+- :func:`nlpir.pool.Pool.wait_reloaded`
+"""
+from nlpir import ictclas, key_extract, clean_logs
+from nlpir.pool import Pool, START_MODE_FORK_AFTER_INIT
+import platform
+import pytest
+from tests.strings import test_str, test_str_1st, test_str_2nd
+
+
+def test_pool():
+    texts = [test_str, test_str_1st, test_str_2nd] * 10
+    expected = [ictclas.segment(text, pos_tagged=True) for text in texts]
+    with Pool([ictclas, "key_extract"], processes=4) as pool:
+        assert expected == pool.map(ictclas.segment, texts, pos_tagged=True)
+        assert expected == list(pool.imap(ictclas.segment, iter(texts), chunksize=4, pos_tagged=True))
+        assert expected[0] == pool.submit(ictclas.segment, test_str, pos_tagged=True).get()
+        assert pool.submit(key_extract.get_key_words, test_str, max_key=10).get()
+    clean_logs(include_current=True)
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="fork and /proc are only available on Linux")
+def test_pool_fork_after_init():
+    texts = [test_str, test_str_1st, test_str_2nd] * 10
+    expected = [ictclas.segment(text) for text in texts]
+    with Pool([ictclas], processes=4, start_mode=START_MODE_FORK_AFTER_INIT) as pool:
+        assert expected == pool.map(ictclas.segment, texts)
+        usage = pool.memory_usage()
+        assert len(usage) == 4
+        for memory in usage.values():
+            assert memory["uss"] <= memory["pss"] <= memory["rss"]
+            assert memory["shared"] > 0
+    clean_logs(include_current=True)
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="fork is only available on Linux")
+def test_pool_reload():
+    user_dict = ["卢梭 user", "社会契约论 user"]
+    ictclas.clean_user_dict()
+    with Pool([ictclas], processes=2, start_mode=START_MODE_FORK_AFTER_INIT) as pool:
+        before = pool.submit(ictclas.segment, test_str_2nd, pos_tagged=True)
+        assert pool.reload(lambda: ictclas.import_dict(user_dict), version="with user dict") == 1
+        assert ("卢梭", "user") not in before.get()
+        assert ("卢梭", "user") in pool.submit(ictclas.segment, test_str_2nd, pos_tagged=True).get()
+        assert pool.wait_reloaded(timeout=60)
+        assert pool.version == "with user dict"
+    ictclas.clean_user_dict()
+    clean_logs(include_current=True)
@@ -0,0 +1,65 @@
+# coding=utf-8
+"""
+Tested function:
+
+- :class:`nlpir.tokens.Tokens`
+- :func:`nlpir.ictclas.process_to_tokens`
+- :func:`nlpir.ictclas.process_to_pos_ids`
+- :func:`nlpir.ictclas.process_to_interned`
+- POS registry of :mod:`nlpir.tokens`
+"""
+import pickle
+import threading
+from nlpir import ictclas
+from nlpir import tokens as pos_registry
+from nlpir.tokens import Tokens
+
+test_str_seg_pos = '法国/nsf 启蒙/vn 思想家/n 孟德斯/nrf 鸠/n 曾/d 说/v 过/uguo ：/wm “/wyz 一切/rz 有/vyou 权力/n '
+test_str_seg = '法国 启蒙 思想家 孟德斯 鸠 曾 说 过 ： “ 一切 有 权力 '
+
+
+def test_tokens():
+    tokens = ictclas.process_to_tokens(test_str_seg_pos, True)
+    expected = ictclas.process_to_list(test_str_seg_pos, True)
+    assert len(tokens) == len(expected)
+    assert tokens.to_list() == expected == list(tokens)
+    assert tokens[0] == ("法国", "nsf") and tokens[-1] == ("权力", "n")
+    assert isinstance(tokens[2:5], Tokens) and tokens[2:5].to_list() == expected[2:5]
+    assert tokens.words() == [word for word, _ in expected]
+    assert tokens.filter_pos(["n", "nsf"]).to_list() == [item for item in expected if item[1] in ("n", "nsf")]
+    assert pickle.loads(pickle.dumps(tokens)) == tokens
+    words = ictclas.process_to_tokens(test_str_seg, False)
+    assert words.to_list() == [word for word in ictclas.process_to_list(test_str_seg, False) if word]
+    assert not words.pos_tagged and words[1:3].words() == ["启蒙", "思想家"]
+    assert len(Tokens.from_words([])) == 0
+    assert tokens.filter_pos_class("n").to_list() == [item for item in expected if item[1][0] == "n"]
+
+
+def test_pos_registry():
+    expected = ictclas.process_to_list(test_str_seg_pos, True)
+    ids = ictclas.process_to_pos_ids(test_str_seg_pos, True)
+    assert [(word, pos_registry.get_pos_name(pos_id)) for word, pos_id in ids] == expected
+    interned = ictclas.process_to_interned(test_str_seg_pos, True)
+    assert interned == expected and interned[1][1] is pos_registry.get_pos_name(pos_registry.get_pos_id("vn"))
+    # ids of the pos maps are fixed
+    assert pos_registry.get_pos_id("n") == 0
+    for pos_map, tags in pos_registry.POS_TAGS.items():
+        assert pos_registry.get_pos_tags(pos_map) == tags
+    assert pos_registry.get_pos_class("Ng") == "n"
+    assert pos_registry.get_pos_id("Ng") in pos_registry.get_class_pos_ids(["n", "v"])
+    new_id = pos_registry.get_pos_id("not_a_tag")
+    assert new_id >= len(set(sum(pos_registry.POS_TAGS.values(), ()))) and pos_registry.get_pos_id("not_a_tag") == new_id
+    # threads meeting the same new tags get one id for each of them
+    new_tags = [f"thread_tag_{i}" for i in range(200)]
+    results = [None] * 8
+
+    def assign(index):
+        results[index] = [pos_registry.get_pos_id(pos) for pos in new_tags]
+
+    threads = [threading.Thread(target=assign, args=(i,)) for i in range(len(results))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(result == results[0] for result in results)
+    assert [pos_registry.get_pos_name(pos_id) for pos_id in results[0]] == new_tags
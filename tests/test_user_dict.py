@@ -0,0 +1,108 @@
+# coding=utf-8
+"""
+Tested function:
+
+- :class:`nlpir.user_dict.UserDictManager`
+"""
+import os
+import types
+import nlpir
+from nlpir import ictclas
+from nlpir.user_dict import UserDictManager, get_digest
+
+
+def test_user_dict_manager(tmp_path):
+    from tests.strings import test_str_2nd
+    manifest_path = os.path.join(str(tmp_path), "manifest.json")
+    ictclas.clean_user_dict()
+    manager = UserDictManager(ictclas, manifest_path=manifest_path)
+    assert manager.version is None
+    report = manager.sync(["卢梭 user", "社会契约论 user"], version="1")
+    assert report["full_reload"] and report["added"] == 2 and not report["failed"]
+    assert ("卢梭", "user") in ictclas.segment(test_str_2nd, pos_tagged=True)
+    cache_config = ictclas.get_native_instance().get_cache_config()
+    assert "1" in cache_config[1]
+    # only the changed words are applied
+    assert manager.diff({"卢梭": "user", "契约": "n"}) == ({"契约": "n"}, ["社会契约论"])
+    report = manager.sync(["卢梭 user", "社会契约论 user", "自然权利 user"], version="2")
+    assert report["added"] == 1 and report["deleted"] == 0 and manager.version == "2"
+    assert ("自然权利", "user") in ictclas.segment(test_str_2nd, pos_tagged=True)
+    # the manifest is loaded by a new manager
+    assert UserDictManager(ictclas, manifest_path=manifest_path).words == manager.words
+    # the words imported from a file may stay in memory, the manifest must say so
+    report = manager.sync(["卢梭 user"], version="3", full_reload_ratio=0)
+    for word in ("社会契约论", "自然权利"):
+        segmented = (word, "user") in ictclas.segment(test_str_2nd, pos_tagged=True)
+        assert segmented == (f"{word} user" in report["failed"]) == (word in manager.words)
+    ictclas.clean_user_dict()
+    assert ictclas.clean_saved_user_dict()
+    nlpir.clean_logs(include_current=True)
+
+
+def test_user_dict_manager_full_reload(tmp_path):
+    class Instance:
+        """
+        Words imported from a file stay in memory like ICTCLAS, see ICTCLAS.import_user_dict
+        """
+        encode = "utf-8"
+        user_dict_version = 0
+        user_dict_tag = None
+
+        def __init__(self):
+            self.calls = []
+            self.imported = dict()
+            self.added = dict()
+
+        def import_user_dict(self, filename, overwrite):
+            with open(filename, encoding=self.encode) as f:
+                lines = f.read().splitlines()
+            self.calls.append(("import_user_dict", len(lines), overwrite))
+            self.imported.update(line.split(" ") for line in lines)
+            return 1
+
+        def is_user_word(self, word):
+            self.calls.append(("is_user_word", word))
+            return 1 if word in self.imported or word in self.added else 0
+
+        def add_user_word(self, word):
+            self.calls.append(("add_user_word", word))
+            word, pos = nlpir.parse_user_word(word)
+            self.added[word] = pos
+            return 0
+
+        def del_usr_word(self, word):
+            return -1 if self.added.pop(word, None) is None else 0
+
+    def fake_module(instance):
+        module = types.ModuleType("nlpir.fake_component")
+        module.get_native_instance = lambda: instance
+        module.import_dict = lambda word_list: nlpir.import_dict(word_list, instance)
+        module.import_dict_bulk = lambda word_list, overwrite=False: nlpir.import_dict_bulk(
+            word_list, instance, overwrite
+        )
+        module.clean_user_dict = instance.added.clear
+        module.save_user_dict = lambda: True
+        return module
+
+    instance = Instance()
+    manager = UserDictManager(fake_module(instance), manifest_path=os.path.join(str(tmp_path), "manifest.json"))
+    words = ["卢梭 user", "社会契约论 user", "自然权利"]
+    report = manager.sync(words, version="1")
+    # one native call for the whole dictionary, no word is added again
+    assert report["full_reload"] and not report["failed"]
+    assert instance.calls == [("import_user_dict", 3, True)]
+    assert manager.words == {"卢梭": "user", "社会契约论": "user", "自然权利": "n"}
+    assert manager.manifest["digest"] == get_digest(manager.words)
+    # an imported word can not be deleted, it is reported and kept in the manifest
+    report = manager.sync(words[:2], version="2")
+    assert report["full_reload"] and report["failed"] == ["自然权利 n"] and report["deleted"] == 0
+    assert manager.words == {"卢梭": "user", "社会契约论": "user", "自然权利": "n"}
+
+    # without persist the words are only added in memory, and can be deleted
+    instance = Instance()
+    manager = UserDictManager(fake_module(instance), persist=False)
+    manager.sync(words, version="1")
+    assert not instance.imported and instance.added == manager.words
+    report = manager.sync(words[:2], version="2")
+    assert not report["failed"] and report["deleted"] == 1
+    assert instance.added == manager.words == {"卢梭": "user", "社会契约论": "user"}
@@ -0,0 +1,18 @@
+# coding=utf-8
+"""
+Tested Function:
+
+- :func:`nlpir.warmup`
+"""
+import nlpir
+from nlpir import ictclas, key_extract
+
+
+def test_warmup():
+    timings = nlpir.warmup([ictclas, "key_extract"])
+    assert set(timings) == {"nlpir.ictclas", "nlpir.key_extract"}
+    for timing in timings.values():
+        assert timing["init"] >= 0 and timing["call"] >= 0
+    assert ictclas.__instance__ is not None and key_extract.__instance__ is not None
+    # already initialized, only the instance is got when the dummy call is disabled
+    assert set(nlpir.warmup([ictclas], dummy_call=False)["nlpir.ictclas"]) == {"init"}